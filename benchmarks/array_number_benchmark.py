@@ -0,0 +1,42 @@
+"""
+Benchmark Normalizer.number_to_words_bulk against a per-value number_to_words loop.
+
+    python benchmarks/array_number_benchmark.py
+"""
+import time
+
+import numpy as np
+
+from pybangla.module.main import Normalizer
+from pybangla.module.parser import NumberParser
+
+
+def report_amounts(size, rng):
+    # report columns: rounded amounts with heavy repetition
+    return rng.integers(1, 50000, size=size, dtype=np.int64) * rng.choice([1, 10, 100, 1000], size=size)
+
+
+def ids(size, rng):
+    # nearly all distinct
+    return rng.integers(0, 10 ** 12, size=size, dtype=np.int64)
+
+
+def bench(label, values, nmlr, npr, loop_size=20000):
+    start = time.perf_counter()
+    nmlr.number_to_words_bulk(values)
+    bulk = len(values) / (time.perf_counter() - start)
+
+    sample = [npr._digit_converter(str(v), "bn") for v in values[:loop_size]]
+    start = time.perf_counter()
+    for number in sample:
+        npr.number_to_words(number)
+    loop = len(sample) / (time.perf_counter() - start)
+    print(f"{label:<16} bulk: {bulk:12.0f} values/s   loop: {loop:10.0f} values/s   speedup: {bulk / loop:6.1f}x")
+
+
+if __name__ == "__main__":
+    rng, nmlr, npr = np.random.default_rng(0), Normalizer(), NumberParser()
+    nmlr.number_to_words_bulk(np.arange(10))
+    for size in [100000, 1000000, 10000000]:
+        bench(f"amounts {size}", report_amounts(size, rng), nmlr, npr)
+    bench("distinct 1000000", ids(1000000, rng), nmlr, npr)
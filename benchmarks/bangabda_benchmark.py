@@ -0,0 +1,38 @@
+"""
+Benchmark Gregorian -> Bangabda conversion of 10M dates with the numpy tables against
+the scalar table lookup.
+
+    python benchmarks/bangabda_benchmark.py [dates]
+"""
+import sys
+import time
+
+import numpy as np
+
+from pybangla.module.bangabda import BangabdaCalendar
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    calendar = BangabdaCalendar()
+    calendar.to_bangabda_bulk(np.array(["2023-04-14"], dtype="datetime64[D]"))
+    rng = np.random.default_rng(0)
+    start, stop = np.datetime64("1950-01-01").astype(np.int64), np.datetime64("2100-01-01").astype(np.int64)
+    dates = rng.integers(start, stop, size=size).astype("datetime64[D]")
+
+    begin = time.perf_counter()
+    years, months, days = calendar.to_bangabda_bulk(dates)
+    bulk = time.perf_counter() - begin
+    print(f"to_bangabda_bulk   {size:>10} dates {bulk:7.2f} s {size / bulk:14.0f} dates/s")
+
+    begin = time.perf_counter()
+    calendar.from_bangabda_bulk(years, months, days)
+    back = time.perf_counter() - begin
+    print(f"from_bangabda_bulk {size:>10} dates {back:7.2f} s {size / back:14.0f} dates/s")
+
+    sample = dates[:200000].astype(object)
+    begin = time.perf_counter()
+    for date in sample:
+        calendar.to_bangabda(date)
+    scalar = time.perf_counter() - begin
+    print(f"to_bangabda loop   {len(sample):>10} dates {scalar:7.2f} s {len(sample) / scalar:14.0f} dates/s")
+    print(f"speedup {(size / bulk) / (len(sample) / scalar):.0f}x")
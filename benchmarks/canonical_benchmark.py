@@ -0,0 +1,49 @@
+"""
+Cost of the canonical pre-pass against collapse_whitespace, the cheapest text_normalizer
+stage, on clean text and on text with precomposed nukta letters, zero width joiners and emoji,
+per sentence and on one long document.
+
+    python benchmarks/canonical_benchmark.py [sentences]
+"""
+import random
+import sys
+import time
+
+from pybangla.module.canonical import canonicalize
+from pybangla.module.main import tp
+
+sentences = [
+    "মোঃ রহিম ১৯৯৪ সালে ২১তম হন এবং ৳১,০০০.৫০ পুরস্কার পান।",
+    "সভা ০১-০৪-২০২৩ তারিখে সকাল ১০:৩০ এ শুরু হবে।",
+    "আপনার OTP ৪৫১২, কোনো সমস্যা হলে ০১৭১২৩৪৫৬৭৮ নম্বরে কল করুন।",
+    "অফারটি ৫০% ছাড়ে কি এখনো পাওয়া যাচ্ছে?",
+]
+
+
+def noisy(text):
+    # the same sentence as keyboards and chat apps write it
+    text = text.replace("\u09af\u09bc", "\u09df").replace("\u09a1\u09bc", "\u09dc")
+    return text.replace(" ", " \u200c", 1) + " \U0001f600\u200d\U0001f44d"
+
+
+def timed(func, texts, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    random.seed(3)
+    clean = [random.choice(sentences) for _ in range(count)]
+    for label, texts in [("clean", clean), ("noisy", [noisy(text) for text in clean])]:
+        document = " ".join(texts)
+        print(f"{label}: {count} sentences, one document of {len(document) / 1e6:.1f} M characters")
+        for name, func in [("collapse_whitespace", tp.collapse_whitespace), ("canonicalize", canonicalize)]:
+            per_sentence = timed(func, texts) / count * 1e6
+            whole = timed(func, [document]) * 1000
+            print(f"  {name:<22} {per_sentence:7.2f} us per sentence {whole:9.2f} ms per document")
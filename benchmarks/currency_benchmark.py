@@ -0,0 +1,70 @@
+"""
+Benchmark TextParser.extract_currency_amounts on invoice and price-list text
+against the previous findall + replace implementation.
+
+    python benchmarks/currency_benchmark.py
+"""
+import random
+import re
+import time
+
+from pybangla.module.config import Config as cfg
+from pybangla.module.parser import NumberParser, TextParser
+
+random.seed(11)
+
+bn_digits = cfg.en_to_bn_digits_mapping
+items = ["চাল", "ডাল", "তেল", "চিনি", "লবণ", "আটা", "ডিম", "দুধ"]
+symbols = list(cfg._currency)
+
+
+def bn(number):
+    return "".join(bn_digits.get(d, d) for d in str(number))
+
+
+def invoice(lines=2000):
+    text = []
+    for i in range(lines):
+        qty, price = random.randint(1, 50), random.randint(10, 99999)
+        symbol = random.choice(symbols)
+        text.append(f"{bn(i + 1)}. {random.choice(items)} {bn(qty)} কেজি, দর {symbol}{bn(price)}.{bn(random.randint(10, 99))}, মোট {symbol}{bn(qty * price)}")
+    return text
+
+
+def price_list(lines=2000):
+    text = []
+    for _ in range(lines):
+        text.append(f"{random.choice(items)} প্যাকেট {random.randint(1, 9)} টি: ${random.randint(1, 500)} অথবা ৳{random.randint(100, 50000)}, স্টক {random.randint(1, 999)}")
+    return text
+
+
+npr, currency_pattern = NumberParser(), r'(?:\$|£|৳|€|¥|₹|₽|₺)?(?:\d+(?:,\d{3})*(?:\.\d+)?|\d+(?:\.\d+)?)'
+
+
+def legacy_extract_currency_amounts(text):
+    for m in re.findall(currency_pattern, text):
+        currency = re.findall(r'[৳$£€¥₹₽₺]', m)
+        if currency:
+            n_m = m.replace(currency[0], "")
+            if "." in n_m:
+                s_m = n_m.split(".")
+                word = npr.number_to_words(s_m[0]) + " দশমি " + npr.digit_number_to_digit_word(s_m[1]) + " " + cfg._currency[currency[0]]
+            else:
+                word = npr.number_to_words(n_m) + " " + cfg._currency[currency[0]]
+            text = text.replace(m, word)
+    return text
+
+
+def bench(label, func, lines):
+    start = time.perf_counter()
+    for line in lines:
+        func(line)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {len(lines) / elapsed:10.0f} lines/s")
+
+
+if __name__ == "__main__":
+    tp = TextParser()
+    for name, lines in [("invoice", invoice()), ("price list", price_list())]:
+        bench(name + " (single regex)", tp.extract_currency_amounts, lines)
+        bench(name + " (legacy)", legacy_extract_currency_amounts, lines)
@@ -0,0 +1,48 @@
+"""
+Benchmark the pandas accessor and normalize_arrow against df[col].map(nmlr.text_normalizer)
+on a column with heavy duplication (IVR prompts, product names).
+
+    python benchmarks/dataframe_benchmark.py [rows] [distinct]
+"""
+import random
+import sys
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+from pybangla.module.dataframe import normalize_arrow
+from pybangla.module.main import Normalizer
+
+templates = [
+    "আপনার বিল ৳{n} , শেষ তারিখ {d} তারিখ",
+    "অফারটি {n}% ছাড়ে পাওয়া যাচ্ছে",
+    "পণ্য নম্বর {n} এর দাম ${d}",
+    "আপনি {d}তম গ্রাহক, মোঃ রহিম কে ডাঃ দেখাবেন",
+]
+
+
+def column(rows, distinct):
+    random.seed(1)
+    values = [random.choice(templates).format(n=random.randint(1, 99999), d=random.randint(1, 30)) for _ in range(distinct)]
+    return [random.choice(values) for _ in range(rows)]
+
+
+def bench(label, func, rows):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.2f} s   {rows / elapsed:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    values, nmlr = column(rows, distinct), Normalizer()
+    series, array = pd.Series(values), pa.chunked_array([values[i:i + 100000] for i in range(0, rows, 100000)])
+
+    sample = series[:20000]
+    bench("map(text_normalizer), 20k rows", lambda: sample.map(nmlr.text_normalizer), len(sample))
+    bench("series.bangla.text_normalizer()", lambda: series.bangla.text_normalizer(), rows)
+    bench("series.bangla, 4 workers", lambda: series.bangla.text_normalizer(workers=4), rows)
+    bench("normalize_arrow (chunked)", lambda: normalize_arrow(array), rows)
@@ -0,0 +1,48 @@
+"""
+Benchmark Normalizer.date_format_bulk against a date_format call per row on a date column
+sharing one format, with a few rows of other formats that fall back to the heuristics.
+
+    python benchmarks/date_format_bulk_benchmark.py [rows]
+"""
+import datetime
+import random
+import sys
+import time
+
+from pybangla.module.main import Normalizer
+
+layouts = {
+    "DD-MM-YYYY": lambda d: d.strftime("%d-%m-%Y"),
+    "DD-Month-YYYY": lambda d: d.strftime("%d-%b-%Y"),
+    "YYYY/MM/DD": lambda d: d.strftime("%Y/%m/%d"),
+}
+
+
+def column(rows, layout):
+    random.seed(1)
+    start = datetime.date(1990, 1, 1).toordinal()
+    values = []
+    for _ in range(rows):
+        day = datetime.date.fromordinal(start + random.randint(0, 15000))
+        # one row in a hundred comes in another format
+        values.append(layouts[layout](day) if random.random() > 0.01 else day.strftime("%Y-%m-%d"))
+    return values
+
+
+def bench(label, func, rows):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.2f} s   {rows / elapsed:10.0f} rows/s")
+    return result
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    nmlr = Normalizer()
+    for layout in layouts:
+        values = column(rows, layout)
+        print(layout)
+        expected = bench("  date_format per row", lambda: [nmlr.date_format(v) for v in values], rows)
+        results, report = bench("  date_format_bulk", lambda: nmlr.date_format_bulk(values), rows)
+        print("  report:", report, " same results:", results == expected)
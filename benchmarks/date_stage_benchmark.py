@@ -0,0 +1,73 @@
+"""
+Throughput of the expand_dates stage on news-like and SMS-like text, against the
+workaround it replaces: find date candidates, call Normalizer.date_format on each
+and splice the words back.
+
+    python benchmarks/date_stage_benchmark.py [sentences]
+"""
+import random
+import re
+import sys
+import time
+
+from pybangla.module.main import Normalizer
+from pybangla.module.parser import TextParser
+
+bn = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+months = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+
+news = [
+    "গত {d}-{m}-{y} তারিখে রাজধানীতে এক সংবাদ সম্মেলনে মন্ত্রী বলেন, প্রকল্পের কাজ {p}% শেষ হয়েছে",
+    "{d} {M}, {y} সালে শুরু হওয়া আলোচনা আজ {h}:{mi} মিনিটে শেষ হয়",
+    "নির্বাচন কমিশন জানিয়েছে, ভোটগ্রহণ চলবে {y}/{m}/{d} সকাল {h}:{mi} থেকে",
+    "বাজেট অধিবেশন {d}/{m}/{y} পর্যন্ত মুলতবি করা হয়েছে, বরাদ্দ বেড়েছে {n} কোটি টাকা",
+]
+sms = [
+    "আপনার বিল {n} টাকা, শেষ তারিখ {d}-{m}-{y}",
+    "মিটিং {h}:{mi} এ, দেরি করবেন না",
+    "{M} {d}, {y} এর মধ্যে রিচার্জ করুন",
+    "ওকে ভাই, কাল দেখা হবে",
+]
+
+
+def corpus(templates, count):
+    random.seed(5)
+    out = []
+    for _ in range(count):
+        text = random.choice(templates).format(
+            d="%02d" % random.randint(1, 28), m="%02d" % random.randint(1, 12), y=random.randint(1990, 2030),
+            M=random.choice(months), h="%02d" % random.randint(0, 23), mi="%02d" % random.randint(0, 59),
+            p=random.randint(1, 99), n=random.randint(10, 9999),
+        )
+        out.append(text.translate(bn) if random.random() < 0.6 else text)
+    return out
+
+
+candidate_re = re.compile(r"[0-9০-৯]{1,4}[-/][0-9০-৯]{1,2}[-/][0-9০-৯]{1,4}|[0-9০-৯]{1,2} [A-Za-z]+, [0-9০-৯]{4}")
+
+
+def date_format_workaround(nmlr, text):
+    def replace(match):
+        result = nmlr.date_format(match.group())
+        return " ".join([result["txt_date"], result["month"], result["txt_year"]])
+    return candidate_re.sub(replace, text)
+
+
+def bench(label, func, texts):
+    size = sum(len(text.encode()) for text in texts)
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {len(texts) / elapsed:9.0f} sentences/s {size / elapsed / 2**20:7.2f} MB/s")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tp, nmlr = TextParser(), Normalizer()
+    for name, templates in (("news", news), ("sms", sms)):
+        texts = corpus(templates, count)
+        print(f"{name}: {count} sentences")
+        bench("expand_dates stage", tp.expand_dates, texts)
+        bench("candidates + date_format", lambda t: date_format_workaround(nmlr, t), texts)
+        bench("text_normalizer, all stages", nmlr.text_normalizer, texts)
@@ -0,0 +1,44 @@
+"""
+Benchmark Normalizer.format_digits_bulk against a per-value Python loop over
+_digit_converter with manual lakh/crore grouping.
+
+    python benchmarks/format_digits_benchmark.py
+"""
+import time
+
+import numpy as np
+
+from pybangla.module.main import Normalizer
+from pybangla.module.parser import NumberParser
+
+npr = NumberParser()
+
+
+def format_loop(value, decimals=2):
+    integer, _, fraction = ("%.*f" % (decimals, abs(value))).partition(".")
+    head, tail = integer[:-3], integer[-3:]
+    groups = []
+    while head:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    text = ",".join(groups + [tail])
+    text = ("-" if value < 0 and float(integer + "." + (fraction or "0")) else "") + text
+    if fraction:
+        text += "." + fraction
+    return "".join(npr._digit_converter(c, "bn") if c.isdigit() else c for c in text)
+
+
+if __name__ == "__main__":
+    rng, nmlr = np.random.default_rng(0), Normalizer()
+    for size in [100000, 1000000, 10000000]:
+        values = rng.normal(0, 1e6, size=size)
+        start = time.perf_counter()
+        formatted = nmlr.format_digits_bulk(values)
+        bulk = size / (time.perf_counter() - start)
+
+        sample = values[:50000].tolist()
+        start = time.perf_counter()
+        looped = [format_loop(v) for v in sample]
+        loop = len(sample) / (time.perf_counter() - start)
+        assert looped == formatted[:len(sample)].tolist()
+        print(f"{size:>9} floats   bulk: {bulk:12.0f} values/s   loop: {loop:10.0f} values/s   speedup: {bulk / loop:6.1f}x")
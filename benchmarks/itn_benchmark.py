@@ -0,0 +1,59 @@
+"""
+Throughput of Normalizer.inverse_text_normalizer on transcript corpora, against the plain
+word2number it builds on, and how many transcripts read back to their written form.
+
+The transcripts are the text_normalizer output of written sentences (the TTS side) and
+colloquial ASR style sentences.
+
+    python benchmarks/itn_benchmark.py [transcripts]
+"""
+import random
+import sys
+import time
+
+from pybangla.module.main import Normalizer
+
+written = [
+    "রহিম {y} সালে ৳{n} জমা দেন।",
+    "অফারটি {p}% ছাড়ে পাওয়া যাচ্ছে",
+    "সভা {d}-০৪-২০২৩ তারিখে হবে, খরচ ${n}.{p}",
+    "মোট {n} জন উপস্থিত ছিলেন",
+]
+spoken = [
+    "আমাকে দেড়শো টাকা দিতে হবে",
+    "ডাবল সেভেন ওয়ান জিরো নম্বরে কল দিন",
+    "দুই হাজার চব্বিশ সালে বিশ পারসেন্ট বেড়েছে",
+    "পঁচিশ মে দুই হাজার চব্বিশ তারিখে সাড়ে তিনশ টাকা",
+]
+to_bn = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+
+def corpus(size, nmlr):
+    random.seed(1)
+    sentences = []
+    for _ in range(size // 2):
+        values = {"y": random.randint(1000, 2999), "n": random.randint(1, 999999), "p": random.randint(10, 99), "d": random.randint(10, 28)}
+        sentences.append(random.choice(written).format(**values).translate(to_bn))
+    transcripts = [nmlr.text_normalizer(sentence) for sentence in sentences]
+    transcripts += [random.choice(spoken) for _ in range(size - len(transcripts))]
+    return sentences, transcripts
+
+
+def bench(label, func, texts):
+    start = time.perf_counter()
+    results = [func(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<30} {elapsed:8.2f} s   {len(texts) / elapsed:10.0f} transcripts/s")
+    return results
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    nmlr = Normalizer()
+    sentences, transcripts = corpus(size, nmlr)
+    nmlr.inverse_text_normalizer(transcripts[0])
+    print(f"{size} transcripts, {sum(map(len, transcripts)) // size} characters each")
+    bench("word2number", nmlr.word2number, transcripts)
+    results = bench("inverse_text_normalizer", nmlr.inverse_text_normalizer, transcripts)
+    back = sum(result == sentence for result, sentence in zip(results, sentences))
+    print(f"written form recovered: {back} of {len(sentences)} text_normalizer transcripts")
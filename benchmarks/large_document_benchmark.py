@@ -0,0 +1,51 @@
+"""
+Benchmark Normalizer.normalize_document against text_normalizer on one large document
+(a book or a long legal text) and check that both give the same output.
+
+    python benchmarks/large_document_benchmark.py [megabytes] [workers]
+"""
+import os
+import random
+import sys
+import time
+
+from pybangla.module.document import split_document
+from pybangla.module.main import Normalizer
+
+sentences = [
+    "মোঃ রহিম ১৯৯৪ সালে ২১তম হন এবং ৳১,০০০.৫০ পুরস্কার পান।",
+    "আদালত ০১-০৪-২০২৩ তারিখে সকাল ১০:৩০ এ শুনানির দিন ধার্য করে।",
+    "বিবাদীর OTP নম্বর ৪৫১২ এবং মোবাইল ০১৭১২৩৪৫৬৭৮ উল্লেখ আছে।",
+    "ধারা ৩/৪ অনুযায়ী ৫০% অংশ তার প্রাপ্য, মোট ১২৩৪৫৬ টাকা?",
+    "Dr. Rahman ১৫ বৈশাখ ১৪৩০ এ সাক্ষ্য দেন!",
+]
+
+
+def document(megabytes):
+    random.seed(1)
+    lines, size = [], 0
+    while size < megabytes * 1000000:
+        line = " ".join(random.choice(sentences) for _ in range(random.randint(1, 6)))
+        lines.append(line)
+        size += len(line.encode()) + 1
+    return "\n".join(lines)
+
+
+def bench(label, func, megabytes):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.2f} s   {megabytes / elapsed:8.2f} MB/s")
+    return result
+
+
+if __name__ == "__main__":
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    text, nmlr = document(megabytes), Normalizer()
+    print(f"{megabytes:g} MB, {len(text)} characters, {workers} workers")
+
+    bench("split_document", lambda: split_document(text), megabytes)
+    serial = bench("text_normalizer (serial)", lambda: nmlr.text_normalizer(text), megabytes)
+    parallel = bench(f"normalize_document, {workers} workers", lambda: nmlr.normalize_document(text, workers=workers), megabytes)
+    print("identical output:", parallel == serial)
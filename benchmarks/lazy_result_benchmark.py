@@ -0,0 +1,61 @@
+"""
+Benchmark date_format and number_convert when callers read one field, against
+the eager dicts they used to build and against reading every lazy field.
+
+    python benchmarks/lazy_result_benchmark.py [calls]
+"""
+import random
+import sys
+import time
+
+from pybangla import Normalizer
+from pybangla.module.main import npr
+
+
+def bench(label, func, values):
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {len(values) / elapsed:12.0f} calls/s")
+    return elapsed
+
+
+def eager_date_format(nmlr, date_):
+    """
+    the dict date_format built before the results were lazy
+    """
+    formatted_date = nmlr._split_date(date_)
+    weekday = npr.get_weekday(formatted_date, "bn")
+    day = npr._digit_converter(str(formatted_date[0]), "bn")
+    month = npr.search_month(str(formatted_date[1]), "bn")
+    year = npr._digit_converter(str(formatted_date[2]), "bn")
+    return {"date": day, "month": month[0], "year": year, "txt_date": npr.number_to_words(day), "txt_year": npr.year_in_number(year),
+            "weekday": weekday, "ls_month": month[1], "seasons": month[2]}
+
+
+def eager_number_convert(number):
+    number = npr._digit_converter(number, "bn")
+    return {"digit": number, "digit_word": npr.digit_number_to_digit_word(number), "number_string": npr.number_to_words(number)}
+
+
+def main(calls=100000):
+    random.seed(3)
+    nmlr = Normalizer()
+    dates = ["%02d-%02d-%d" % (random.randint(1, 28), random.randint(1, 12), random.randint(1950, 2030)) for _ in range(calls)]
+    numbers = [str(random.randint(1, 10 ** random.randint(1, 12))) for _ in range(calls)]
+
+    eager = bench("eager dict date_format", lambda d: eager_date_format(nmlr, d), dates)
+    bench("date_format, every field", lambda d: nmlr.date_format(d).to_dict(), dates)
+    lazy = bench("date_format, weekday", lambda d: nmlr.date_format(d)["weekday"], dates)
+    bench("date_format, fields=['weekday']", lambda d: nmlr.date_format(d, fields=["weekday"]), dates)
+    print(f"weekday speedup {eager / lazy:.1f}x")
+
+    eager = bench("eager dict number_convert", eager_number_convert, numbers)
+    bench("number_convert, every field", lambda n: nmlr.number_convert(n).to_dict(), numbers)
+    lazy = bench("number_convert, digit", lambda n: nmlr.number_convert(n)["digit"], numbers)
+    print(f"digit speedup {eager / lazy:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
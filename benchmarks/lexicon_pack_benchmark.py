@@ -0,0 +1,68 @@
+"""
+Benchmark loading a lexicon pack with 100k entries: the marshal blob against the same
+tables as JSON, then building its Config and parsers and swapping it into a Normalizer.
+
+    python benchmarks/lexicon_pack_benchmark.py [entries]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from pybangla import Normalizer
+from pybangla.module.lexicon import LexiconPack
+
+
+def timed(label, func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1000:9.1f} ms")
+    return result
+
+
+def main(entries=100000):
+    letters = "কখগঘঙচছজঝঞটঠডঢণতথদধনপফবভমযরলশষসহ"
+    words = {}
+    for i in range(entries):
+        word, n = "", i
+        while True:
+            word += letters[n % len(letters)]
+            n //= len(letters)
+            if not n:
+                break
+        words[word + "া"] = str(i)
+    pack = LexiconPack.default().overlay({"bn_word_map": words}, name="bench", revision=1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.lexicon")
+        json_path = os.path.join(directory, "bench.json")
+        pack.save(path)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(pack.tables, f, ensure_ascii=False)
+        print(f"{entries} extra entries, marshal {os.path.getsize(path) / 1e6:.1f} MB, json {os.path.getsize(json_path) / 1e6:.1f} MB")
+
+        timed("LexiconPack.load (marshal)", lambda: LexiconPack.load(path))
+
+        def load_json():
+            with open(json_path, encoding="utf-8") as f:
+                return json.load(f)
+
+        timed("json.load", load_json)
+        timed("config()", lambda: LexiconPack.load(path).config())
+        nmlr = Normalizer()
+        timed("load_lexicon (file -> swap)", lambda: nmlr.load_lexicon(path))
+
+    loaded = pack.parsers()
+    start = time.perf_counter()
+    for _ in range(100000):
+        nmlr.parsers = loaded
+    print(f"{'swap assignment':<28} {(time.perf_counter() - start) * 1e4:9.1f} ns")
+    print(nmlr.lexicon_info(), nmlr.word2number("কা টাকা"))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
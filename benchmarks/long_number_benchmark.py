@@ -0,0 +1,42 @@
+"""
+Benchmark NumberParser.number_to_words on 10 to 10,000 digit strings, table lookups
+per 7 digit chunk versus the earlier num2words call per chunk.
+
+    python benchmarks/long_number_benchmark.py
+"""
+import random
+import time
+
+from pybangla.module.parser import NumberParser
+
+bn_digits = "০১২৩৪৫৬৭৮৯"
+
+
+def num2words_per_chunk(npr, number, chunk_millions=7):
+    # the number_to_words of the 1.x releases
+    number = number[::-1]
+    chunks = [number[i:i+chunk_millions][::-1] for i in range(0, len(number), chunk_millions)][::-1]
+    number = " কোটি ".join([npr.number_to_words_converting_process(chunk, lang="bn") for chunk in chunks])
+    return " ".join(number.replace("শূন্য", "").split())
+
+
+def timed(func, number, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(number)
+    return (time.perf_counter() - start) / repeat, result
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    npr = NumberParser()
+    npr.group_words("bn")
+    print(f"{'digits':>7} {'num2words/chunk':>16} {'grouped':>11} {'digits policy':>14} {'speedup':>8} {'us/digit':>9}")
+    for size in [10, 100, 1000, 10000]:
+        number = "".join(random.choice(bn_digits) for _ in range(size))
+        repeat = max(1, 20000 // size)
+        legacy, expected = timed(lambda n: num2words_per_chunk(npr, n), number, repeat)
+        grouped, result = timed(npr.number_to_words, number, repeat)
+        assert result == expected
+        digits, _ = timed(lambda n: npr.number_to_words(n, policy="digits", digits_threshold=15), number, repeat)
+        print(f"{size:>7} {legacy * 1e3:>13.3f} ms {grouped * 1e3:>8.3f} ms {digits * 1e3:>11.3f} ms {legacy / grouped:>7.1f}x {grouped / size * 1e6:>9.3f}")
@@ -0,0 +1,63 @@
+"""
+Benchmark TextParser.expand_position on ordinal-dense sports and education
+text against the previous ten re.sub + findall/replace implementation.
+
+    python benchmarks/ordinal_benchmark.py
+"""
+import random
+import re
+import time
+
+from pybangla.module.config import Config as cfg
+from pybangla.module.parser import NumberParser, TextParser
+
+random.seed(3)
+
+bn_digits = cfg.en_to_bn_digits_mapping
+fixed = [x[0] for x in cfg._bn_ordinals]
+
+
+def bn(number):
+    return "".join(bn_digits[d] for d in str(number))
+
+
+def sports(lines=2000):
+    return [
+        f"দলটি লিগে {bn(random.randint(1, 20))}তম অবস্থানে, সাকিব {random.choice(fixed)} ওভারে উইকেট নেন, ম্যাচের {bn(random.randint(11, 90))} তম মিনিটে গোল"
+        for _ in range(lines)
+    ]
+
+
+def education(lines=2000):
+    return [
+        f"সে {random.choice(fixed)} শ্রেণিতে {random.choice(fixed)} হয়েছে, মেধা তালিকায় {bn(random.randint(1, 500))}তম, class rank {random.randint(1, 99)}th"
+        for _ in range(lines)
+    ]
+
+
+npr = NumberParser()
+
+
+def legacy_expand_position(text):
+    for regex, replacement in cfg._ordinal_re["bn"]:
+        text = re.sub(regex, replacement, text)
+    for i in re.findall(r'(\d+)(?:\s*)(?:তম)', text):
+        word = npr.number_to_words(i)
+        text = text.replace(i + "তম", word + "তম")
+        text = text.replace(i + " তম", word + "তম")
+    return text
+
+
+def bench(label, func, lines):
+    start = time.perf_counter()
+    for line in lines:
+        func(line)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {len(lines) / elapsed:10.0f} lines/s")
+
+
+if __name__ == "__main__":
+    tp = TextParser()
+    for name, lines in [("sports", sports()), ("education", education())]:
+        bench(name + " (single matcher)", tp.expand_position, lines)
+        bench(name + " (legacy)", legacy_expand_position, lines)
@@ -0,0 +1,40 @@
+"""
+Benchmark Normalizer.parse_numbers_bulk against the per-value
+_digit_converter + int() loop on CSV-style Bangla amounts.
+
+    python benchmarks/parse_numbers_benchmark.py [rows]
+"""
+import sys
+import time
+
+import numpy as np
+
+from pybangla.module.main import Normalizer
+from pybangla.module.parser import NumberParser
+
+
+def amounts(size, rng, nmlr):
+    values = rng.integers(0, 10 ** 8, size=size)
+    grouped = nmlr.format_digits_bulk(values)
+    plain = nmlr.format_digits_bulk(values, language="en")
+    # half lakh-grouped Bangla, half plain English digits
+    return np.where(rng.random(size) < 0.5, grouped, np.char.replace(plain, ",", "")).tolist(), values
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    rng, nmlr, npr = np.random.default_rng(0), Normalizer(), NumberParser()
+    values, expected = amounts(size, rng, nmlr)
+
+    start = time.perf_counter()
+    numbers, invalid = nmlr.parse_numbers_bulk(values)
+    bulk = size / (time.perf_counter() - start)
+    assert not invalid.any() and (numbers == expected).all()
+
+    sample = values[:200000]
+    start = time.perf_counter()
+    looped = [int(npr._digit_converter(v.replace(",", ""), "en")) for v in sample]
+    loop = len(sample) / (time.perf_counter() - start)
+    assert looped == expected[:len(sample)].tolist()
+
+    print(f"{size} values   bulk: {bulk:12.0f} values/s ({size / bulk:.2f} s)   loop: {loop:10.0f} values/s (~{size / loop:.1f} s extrapolated)")
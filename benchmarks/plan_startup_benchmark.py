@@ -0,0 +1,58 @@
+"""
+Worker startup benchmark: time until a fresh worker process returns its first
+normalized text, building the default Normalizer versus loading a plan blob.
+
+    python benchmarks/plan_startup_benchmark.py [workers]
+"""
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from pybangla import NormalizationPlan
+
+WORKER = r"""
+import sys, time
+start = time.perf_counter()
+from pybangla import Normalizer, NormalizationPlan
+imported = time.perf_counter()
+if sys.argv[1] == "plan":
+    with open(sys.argv[2], "rb") as f:
+        nmlr = Normalizer(plan=NormalizationPlan.loads(f.read()))
+else:
+    nmlr = Normalizer()
+built = time.perf_counter()
+nmlr.text_normalizer("মোঃ রহিম ১০ কিমি হাঁটেন, খরচ ৳৫০")
+ready = time.perf_counter()
+print(imported - start, built - imported, ready - start)
+"""
+
+
+def run(mode, blob_path, workers):
+    imports, builds, readies, walls = [], [], [], []
+    for _ in range(workers):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", WORKER, mode, blob_path], capture_output=True, text=True, check=True).stdout
+        walls.append(time.perf_counter() - start)
+        imported, built, ready = map(float, out.split())
+        imports.append(imported), builds.append(built), readies.append(ready)
+    ms = lambda values: statistics.median(values) * 1000
+    print(f"{mode:<8} import: {ms(imports):7.1f} ms   build: {ms(builds):6.2f} ms   first result: {ms(readies):7.1f} ms   process wall: {ms(walls):7.1f} ms")
+
+
+if __name__ == "__main__":
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    plan = NormalizationPlan().add_rule("কিমি", "কিলোমিটার", priority=550)
+    blob = plan.dumps()
+
+    start = time.perf_counter()
+    for _ in range(100):
+        NormalizationPlan.loads(blob)
+    print(f"plan blob: {len(blob)} bytes, loads in {(time.perf_counter() - start) * 10:.3f} ms")
+
+    with tempfile.NamedTemporaryFile(suffix=".plan") as f:
+        f.write(blob)
+        f.flush()
+        run("default", f.name, workers)
+        run("plan", f.name, workers)
@@ -0,0 +1,57 @@
+"""
+Time to first sentence of Normalizer.normalize_sentences against text_normalizer on long
+paragraphs, as a TTS front end sees it, and the total time of both.
+
+    python benchmarks/sentence_stream_benchmark.py [sentences per paragraph] [paragraphs]
+"""
+import random
+import sys
+import time
+
+from pybangla.module.main import Normalizer
+
+sentences = [
+    "মোঃ রহিম ১৯৯৪ সালে ২১তম হন এবং ৳১,০০০.৫০ পুরস্কার পান।",
+    "সভা ০১-০৪-২০২৩ তারিখে সকাল ১০:৩০ এ শুরু হবে।",
+    "আপনার OTP ৪৫১২, কোনো সমস্যা হলে ০১৭১২৩৪৫৬৭৮ নম্বরে কল করুন।",
+    "অফারটি ৫০% ছাড়ে কি এখনো পাওয়া যাচ্ছে?",
+]
+
+
+def paragraphs(size, count):
+    random.seed(1)
+    return [" ".join(random.choice(sentences) for _ in range(size)) for _ in range(count)]
+
+
+def chunks(text, size=64):
+    # text arriving in small pieces, like tokens from an upstream generator
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+def first_and_total(func, texts):
+    first = total = 0.0
+    for text in texts:
+        start = time.perf_counter()
+        stream = func(text)
+        next(stream)
+        first += time.perf_counter() - start
+        for _ in stream:
+            pass
+        total += time.perf_counter() - start
+    return first / len(texts) * 1000, total / len(texts) * 1000
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    texts, nmlr = paragraphs(size, count), Normalizer()
+    nmlr.text_normalizer(texts[0]), list(nmlr.normalize_sentences(texts[0]))
+    print(f"{count} paragraphs of {size} sentences, {sum(map(len, texts)) // count} characters each")
+    for label, func in [
+        ("text_normalizer", lambda text: iter([nmlr.text_normalizer(text)])),
+        ("normalize_sentences(str)", nmlr.normalize_sentences),
+        ("normalize_sentences(chunks)", lambda text: nmlr.normalize_sentences(chunks(text))),
+    ]:
+        first, total = first_and_total(func, texts)
+        print(f"{label:<30} first sentence {first:9.3f} ms   whole paragraph {total:9.2f} ms")
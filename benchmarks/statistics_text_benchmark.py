@@ -0,0 +1,74 @@
+"""
+Benchmark number_processing on statistics-heavy text (percentages, decimals, fractions,
+signed and comma grouped numbers): the single numeral scan versus the earlier pair of
+finditer loops with str.replace, which also needed expand_symbols for "%".
+
+    python benchmarks/statistics_text_benchmark.py [sentences]
+"""
+import random
+import re
+import sys
+import time
+
+from pybangla.module.main import Normalizer
+from pybangla.module.parser import NumberParser, TextParser
+
+templates = [
+    "মূল্যস্ফীতি {p}.{d}% থেকে কমে {p}.{d}% হয়েছে",
+    "জিডিপি প্রবৃদ্ধি {p}.{d} শতাংশ, রপ্তানি -{p}.{d}% কমেছে",
+    "মোট {g} জন পরীক্ষার্থীর মধ্যে {n} জন পাস করেছে, পাসের হার {p}%",
+    "জমির {a}/{b} অংশ সেচের আওতায়, গড় ফলন {p}.{d}{d} টন",
+    "সূচক {n} পয়েন্ট বা {p}.{d}% বেড়ে {g} এ দাঁড়িয়েছে",
+]
+bn = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+
+def sentences(count):
+    random.seed(11)
+    out = []
+    for _ in range(count):
+        text = random.choice(templates).format(
+            p=random.randint(1, 99), d=random.randint(0, 9), n=random.randint(10, 9999),
+            g="{:,}".format(random.randint(10000, 9999999)), a=random.randint(1, 3), b=random.randint(4, 9),
+        )
+        out.append(text.translate(bn) if random.random() < 0.7 else text)
+    return out
+
+
+def legacy_number_processing(npr, text):
+    # number_processing of the 1.x releases
+    bn_matches, en_matches = list(re.finditer(npr.bn_regex, text)), list(re.finditer(npr.en_regex, text))
+    for m in en_matches:
+        text = text.replace(m[0], npr.number_to_words(npr._digit_converter(m[0])))
+    for m in bn_matches:
+        text = text.replace(m[0], npr.number_to_words(m[0]))
+    return text
+
+
+def legacy_symbols(text):
+    for regex, replacement in legacy_symbol_rules:
+        text = regex.sub(replacement, text).replace("  ", " ")
+    return text.strip()
+
+
+legacy_symbol_rules = [(re.compile(re.escape(s), re.IGNORECASE), w) for s, w in [("&", " এবং"), ("@", " এট দা রেট"), ("%", " পারসেন্ট"), ("#", " হ্যাশ"), ("°", " ডিগ্রী")]]
+
+
+def bench(label, func, texts):
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {len(texts) / elapsed:9.0f} sentences/s")
+    return elapsed
+
+
+if __name__ == "__main__":
+    texts = sentences(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+    npr, tp = NumberParser(), TextParser()
+    for text in texts[:3]:
+        print(text, "->", Normalizer().text_normalizer(text))
+    legacy = bench("legacy: symbols + finditer/replace passes", lambda t: legacy_number_processing(npr, legacy_symbols(t)), texts)
+    single = bench("expand_symbols + single numeral scan", lambda t: npr.number_processing(tp.expand_symbols(t)), texts)
+    print(f"speedup {legacy / single:.1f}x")
+    bench("Normalizer.text_normalizer, all stages", Normalizer().text_normalizer, texts)
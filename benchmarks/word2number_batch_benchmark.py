@@ -0,0 +1,60 @@
+"""
+Benchmark Word2NumberMap.convert_word2number_batch against a loop of uncached
+convert_word2number calls on an ASR-like transcript mix: short utterances where
+the same number phrases repeat with varying surrounding words.
+
+    python benchmarks/word2number_batch_benchmark.py [utterances] [cache_size]
+"""
+import random
+import sys
+import time
+
+from pybangla.module.number_parser import Word2NumberMap
+
+amounts = ["এক লক্ষ", "দুই হাজার", "পাঁচশ", "সাড়ে পাঁচ হাজার", "আড়াই লক্ষ", "দেড়শো", "তিন হাজার চারশ", "বিশ", "পঞ্চাশ", "একশ বিশ"]
+phones = ["জিরো ওয়ান ডাবল সেভেন", "ডাবল নাইন টু", "ট্রিপল থ্রি ওয়ান", "জিরো ওয়ান ফাইভ সিক্স"]
+names = ["রহিম", "করিম", "সুমি", "রাজু", "নাসির", "মিতা", "জামাল", "তানিয়া", "শফিক", "রুমা", "আকাশ", "বিথী"]
+places = ["ঢাকা", "খুলনা", "সিলেট", "রাজশাহী", "বরিশাল", "রংপুর", "কুমিল্লা", "গাজীপুর"]
+templates = [
+    "আমি {n} আমাকে {a} টাকা পাঠান",
+    "{n} ভাই আমার বিল {a} টাকা হয়েছে",
+    "আমার নম্বর {p} {p}",
+    "{l} থেকে রিচার্জ {a} টাকা এবং {a} টাকা",
+    "{n} {a} টাকার অফার চাই",
+    "জি বলুন {n}",
+    "{l} শাখার পিন কোড {p}",
+]
+
+
+def transcripts(count):
+    random.seed(7)
+    return [
+        random.choice(templates).format(a=random.choice(amounts), p=random.choice(phones), n=random.choice(names), l=random.choice(places))
+        for _ in range(count)
+    ]
+
+
+def bench(label, func, count):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:7.2f} s   {count / elapsed:9.0f} utterances/s")
+    return result, elapsed
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    cache_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4096
+    texts = transcripts(count)
+    print(f"{count} utterances, {len(set(texts))} distinct")
+
+    uncached = Word2NumberMap(cache_size=0)
+    cached = Word2NumberMap(cache_size=cache_size)
+    expected, base = bench("loop, no cache", lambda: [uncached.convert_word2number(t) for t in texts], count)
+    _, looped = bench("loop, cluster cache", lambda: [cached.convert_word2number(t) for t in texts], count)
+    info = cached.cache_info()
+    print(f"{'':<28} hit rate {info.hits / (info.hits + info.misses):.3%} ({info.currsize} clusters cached)")
+    cached.convert_cluster.cache_clear()
+    result, batched = bench("batch", lambda: cached.convert_word2number_batch(texts), count)
+    assert result == expected
+    print(f"speedup: loop + cache {base / looped:.1f}x, batch {base / batched:.1f}x")
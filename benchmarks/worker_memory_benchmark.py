@@ -0,0 +1,60 @@
+"""
+Per worker memory of forked pools: every worker builds its own tables versus
+workers inheriting tables the parent preloaded and froze (workers.freeze).
+
+USS is Private_Clean + Private_Dirty of /proc/<pid>/smaps_rollup, the memory a
+worker does not share with the parent. Linux only.
+
+    python benchmarks/worker_memory_benchmark.py [max_workers]
+"""
+import subprocess
+import sys
+
+WORKER_TEXTS = ["মোঃ রহিম ১ম হন, ২১তম ৳১,০০০.৫০ খরচে ১৯৯৪ সালে ৫০%", "এক লক্ষ চার হাজার দুইশ এক টাকা"] * 200
+
+CHILD = r"""
+import multiprocessing, sys
+mode, workers = sys.argv[1], int(sys.argv[2])
+
+from pybangla.module import workers as w
+
+
+def uss():
+    private = 0
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                private += int(line.split()[1])
+    return private
+
+
+def task(texts):
+    w.normalize_text(texts[0])
+    for i, text in enumerate(texts):
+        (w.normalize_text if i % 2 == 0 else w.word_to_number)(text)
+    return uss()
+
+
+if mode == "frozen":
+    w.freeze()
+texts = TEXTS
+with multiprocessing.get_context("fork").Pool(workers, initializer=w.worker_initializer) as pool:
+    # one task per worker, a barrier keeps a worker from taking two
+    results = pool.map(task, [texts] * workers, chunksize=1)
+print(sum(results) / len(results))
+""".replace("TEXTS", repr(WORKER_TEXTS))
+
+
+def measure(mode, workers):
+    # a fresh interpreter per run, so earlier pools do not warm up the parent
+    out = subprocess.run([sys.executable, "-c", CHILD, mode, str(workers)], capture_output=True, text=True, check=True).stdout
+    return float(out)
+
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    counts = [n for n in (1, 2, 4, 8, 16, 32) if n <= max_workers]
+    print(f"{'workers':>7} {'cold USS/worker':>16} {'frozen USS/worker':>18} {'saved total':>12}")
+    for n in counts:
+        cold, frozen = measure("cold", n), measure("frozen", n)
+        print(f"{n:>7} {cold / 1024:>13.2f} MB {frozen / 1024:>15.2f} MB {(cold - frozen) * n / 1024:>9.2f} MB")
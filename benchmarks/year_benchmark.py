@@ -0,0 +1,72 @@
+"""
+Benchmark date_format and year_formation on year-heavy news text, with the
+precomputed year tables and with the general algorithm only.
+
+    python benchmarks/year_benchmark.py
+"""
+import random
+import time
+
+from pybangla.module.config import Config as cfg
+from pybangla.module.main import Normalizer
+from pybangla.module.parser import NumberParser, TextParser
+
+random.seed(7)
+
+bn_digits = cfg.en_to_bn_digits_mapping
+templates = [
+    "{y} সালে দেশে মোট {n} টি নতুন বিদ্যালয় চালু হয়",
+    "গত {y} সালের বন্যায় ক্ষতিগ্রস্ত হয় প্রায় {n} পরিবার",
+    "{y} শতাব্দীতে এই অঞ্চলে বাণিজ্য বাড়ে",
+    "প্রতিষ্ঠানটি {y} সালে যাত্রা শুরু করে এবং {y2} সালে নতুন ভবনে যায়",
+]
+
+
+def bn(number):
+    return "".join(bn_digits[d] for d in str(number))
+
+
+def news_text(lines=2000):
+    text = []
+    for _ in range(lines):
+        template = random.choice(templates)
+        text.append(template.format(y=bn(random.randint(1900, 2030)), y2=bn(random.randint(1900, 2030)), n=bn(random.randint(10, 999))))
+    return text
+
+
+def dates(count=2000):
+    out = []
+    for _ in range(count):
+        d, m, y = random.randint(1, 28), random.randint(1, 12), random.randint(1950, 2030)
+        out.append(random.choice([f"{d:02d}-{m:02d}-{y}", bn(f"{d:02d}") + "-" + bn(f"{m:02d}") + "-" + bn(y), f"{y}/{m:02d}/{d:02d}"]))
+    return out
+
+
+def run(label):
+    nmlr, tp = Normalizer(), TextParser()
+    lines, date_list = news_text(), dates()
+    # warm up, this is where the tables get built
+    nmlr.date_format(date_list[0]), tp.year_formation(lines[0])
+
+    start = time.perf_counter()
+    for line in lines:
+        tp.year_formation(line)
+    year_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for date_ in date_list:
+        nmlr.date_format(date_, language="bn")
+        nmlr.date_format(date_, language="en")
+    date_time = time.perf_counter() - start
+
+    print(f"{label:<10} year_formation: {len(lines) / year_time:10.0f} lines/s   date_format: {2 * len(date_list) / date_time:10.0f} dates/s")
+
+
+if __name__ == "__main__":
+    run("tables")
+    table_range = cfg.year_table_range
+    cfg.year_table_range = (0, 0)
+    cfg._year_tables.clear()
+    run("general")
+    cfg.year_table_range = table_range
+    cfg._year_tables.clear()
@@ -1,3 +1,4 @@
 __version__ = "1.0.0"
 
-from pybangla.module.main import Normalizer
\ No newline at end of file
+from pybangla.module.main import Normalizer
+from pybangla.module.plan import NormalizationPlan
\ No newline at end of file
@@ -0,0 +1,321 @@
+from .config import Config as cfg
+from .parser import NumberParser
+
+# the 7 digit chunks number_to_words joins with "কোটি"
+CHUNK = 10 ** 7
+# int64 holds every 18 digit number
+MAX_INT64_DIGITS = 18
+# mantissa / 10**k is exactly rounded below 2**53, every 15 digit mantissa is
+MAX_EXACT_FLOAT_DIGITS = 15
+NEGATIVE_SIGNS = (ord("-"), ord("−"))
+
+
+def _numpy():
+    """
+    numpy is an optional dependency, only the array APIs need it
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required for the array APIs, install it with `pip install pybangla[numpy]`") from None
+    return numpy
+
+
+def _code_points(np, values):
+    """
+    View a sequence of strings as a (rows, width) uint32 code point matrix,
+    shorter strings are padded with 0
+    """
+    array = np.asarray(values, dtype=str).reshape(-1)
+    if array.dtype.itemsize == 0:
+        array = array.astype("U1")
+    width = array.dtype.itemsize // 4
+    return np.ascontiguousarray(array).view(np.uint32).reshape(len(array), width)
+
+
+def _digit_values(np, points):
+    """
+    Digit value (0-9) of every English or Bangla digit code point and a mask of the digit positions
+    """
+    english = points - ord("0")
+    bangla = points - ord("০")
+    is_english, is_bangla = english < 10, bangla < 10
+    digits = np.where(is_english, english, bangla).astype(np.int64)
+    return digits, is_english | is_bangla
+
+
+class ArrayNumberParser:
+    """
+    Vectorized counterparts of the NumberParser conversions for whole columns of numbers
+    """
+    __slots__ = ("npr", "_tables")
+
+    def __init__(self):
+        self.npr = NumberParser()
+        self._tables = {}
+
+    def _group_tables(self, language="bn"):
+        """
+        Per group lookup tables, every entry carries its scale word and a trailing
+        space so chunk words are plain concatenations, zero groups are empty
+        """
+        tables = self._tables.get(language)
+        if tables is None:
+            np = _numpy()
+            group_words = self.npr.group_words(language)
+            numbers, scales = group_words["numbers"], group_words["scales"]
+
+            def table(size, scale=""):
+                words = [""] + [numbers[i] + " " + (scale + " " if scale else "") for i in range(1, size)]
+                return np.array(words)
+
+            tables = {
+                "lakh": table(100, scales["lakh"]),
+                "thousand": table(100, scales["thousand"]),
+                "hundred": table(10, scales["hundred"]),
+                "rest": table(100),
+                "crore": np.array(scales["crore"] + " "),
+            }
+            self._tables[language] = tables
+        return tables
+
+    def _chunk_words(self, np, chunk, tables):
+        words = np.char.add(tables["lakh"][chunk // 100000], tables["thousand"][chunk // 1000 % 100])
+        words = np.char.add(words, tables["hundred"][chunk // 100 % 10])
+        return np.char.add(words, tables["rest"][chunk % 100])
+
+    def _assemble(self, np, values, n_chunks, tables):
+        """
+        Words of distinct non negative int64 values, chunk by chunk from the lowest
+        """
+        words = self._chunk_words(np, values % CHUNK, tables)
+        level, high = 1, values // CHUNK
+        while high.any():
+            chunk_words = np.char.add(self._chunk_words(np, high % CHUNK, tables), tables["crore"])
+            words = np.where(n_chunks > level, np.char.add(chunk_words, words), words)
+            level, high = level + 1, high // CHUNK
+        return np.char.rstrip(words)
+
+    def parse_digit_strings(self, values):
+        """
+        Convert English or Bangla digit strings to int64
+
+        return: (numbers, n_digits, valid) where valid is False for strings that
+        are not pure digits or have more than 18 digits
+        """
+        np = _numpy()
+        points = _code_points(np, values)
+        digits, is_digit = _digit_values(np, points)
+        is_char = points != 0
+        n_digits = is_char.sum(axis=1)
+        valid = (is_digit == is_char).all(axis=1) & (n_digits > 0) & (n_digits <= MAX_INT64_DIGITS)
+
+        numbers = np.zeros(len(points), dtype=np.int64)
+        for column in range(points.shape[1]):
+            numbers = np.where(is_digit[:, column] & valid, numbers * 10 + digits[:, column], numbers)
+        return numbers, n_digits, valid
+
+    def parse_numbers(self, values, dtype="int64", block_size=1000000):
+        """
+        Parse Bangla, English or mixed digit strings like "১,২৩,৪৫৬", "-12.5" or " ৩.১৪ "
+
+        Arg:
+            values{list or numpy array of str}: numeric strings, commas are read at thousands (1,234,567) or lakh (১২,৩৪,৫৬৭) group boundaries
+            dtype{str}                        : "int64" or "float64"
+            block_size{int}                   : rows converted at a time, bounds the code point matrix
+
+        return: (numbers, invalid) numpy arrays, invalid marks the entries that could not be parsed, their number is 0
+        """
+        np = _numpy()
+        dtype = np.dtype(dtype)
+        if dtype.kind not in "if":
+            raise ValueError("dtype must be int64 or float64, got %s" % dtype)
+        if not isinstance(values, (list, tuple, np.ndarray)):
+            values = list(values)
+        numbers, invalid = np.zeros(len(values), dtype=dtype), np.zeros(len(values), dtype=bool)
+        for start in range(0, len(values), block_size):
+            block = values[start:start + block_size]
+            numbers[start:start + len(block)], invalid[start:start + len(block)] = self._parse_block(np, block, dtype)
+        return numbers, invalid
+
+    def _parse_block(self, np, values, dtype):
+        strings = np.char.strip(np.asarray(values, dtype=str).reshape(-1))
+        # one contiguous row per character position, the scan below walks the columns
+        columns = np.ascontiguousarray(_code_points(np, strings).T)
+        size = columns.shape[1]
+
+        negative = np.isin(columns[0], NEGATIVE_SIGNS)
+        signed = negative | (columns[0] == ord("+"))
+        mantissa = np.zeros(size, dtype=np.int64)
+        n_digits, n_fraction = np.zeros(size, dtype=np.int64), np.zeros(size, dtype=np.int64)
+        bad, seen_dot = np.zeros(size, dtype=bool), np.zeros(size, dtype=bool)
+        after_digit, after_comma = np.zeros(size, dtype=bool), np.zeros(size, dtype=bool)
+        # integer part groups: digits of the group being read, of the first group, and whether every
+        # group between two commas has 3 digits (1,234,567) or 2 digits (1,23,45,678)
+        run, first, n_commas = np.zeros(size, dtype=np.int64), np.zeros(size, dtype=np.int64), np.zeros(size, dtype=np.int64)
+        middle_3, middle_2 = np.ones(size, dtype=bool), np.ones(size, dtype=bool)
+        for index, column in enumerate(columns):
+            digits, is_digit = _digit_values(np, column)
+            is_comma, is_dot = column == ord(","), column == ord(".")
+            mantissa = np.where(is_digit, mantissa * 10 + digits, mantissa)
+            n_digits += is_digit
+            n_fraction += is_digit & seen_dot
+            # a grouping comma sits between two digits and before the decimal point
+            bad |= (is_comma & (~after_digit | seen_dot)) | (after_comma & ~is_digit) | (is_dot & seen_dot)
+            other = ~(is_digit | is_comma | is_dot | (column == 0))
+            bad |= other & ~signed if index == 0 else other
+            middle = is_comma & (n_commas > 0)
+            middle_3 &= ~middle | (run == 3)
+            middle_2 &= ~middle | (run == 2)
+            first = np.where(is_comma & (n_commas == 0), run, first)
+            n_commas += is_comma
+            seen_dot |= is_dot
+            run = np.where(is_comma, 0, run + (is_digit & ~seen_dot))
+            after_digit, after_comma = is_digit, is_comma
+
+        # the last integer group has 3 digits, the first one up to 3 with thousands grouping, up to 2 with lakhs
+        grouped = (run == 3) & (((first <= 3) & middle_3) | ((first <= 2) & middle_2))
+        bad |= (n_commas > 0) & ~grouped
+
+        valid = ~(bad | after_comma) & (n_digits > 0)
+        if dtype.kind == "i":
+            valid &= ~seen_dot
+        exact = valid & (n_digits <= (MAX_INT64_DIGITS if dtype.kind == "i" else MAX_EXACT_FLOAT_DIGITS))
+        mantissa = np.where(exact, mantissa, 0)
+
+        if dtype.kind == "i":
+            numbers = np.where(negative, -mantissa, mantissa)
+            # more than 18 digits does not fit in int64
+            return numbers, ~exact
+        numbers = mantissa / np.power(10.0, n_fraction)
+        for index in np.flatnonzero(valid & ~exact):
+            # long mantissas are rare, Python float does the correctly rounded conversion
+            numbers[index] = float(self._ascii_number(strings[index]).lstrip("+-"))
+        return np.where(negative & valid, -numbers, numbers), ~valid
+
+    def _ascii_number(self, string):
+        """
+        "১,২৩৪.৫" -> "1234.5"
+        """
+        return "".join([cfg.bn_to_en_digits_mapping.get(c, c) for c in string if c != ","]).replace("−", "-")
+
+    def number_to_words(self, numbers, language="bn"):
+        """
+        Verbalize a whole column of numbers
+
+        Arg:
+            numbers{numpy integer array or list of str} : non negative integers or English/Bangla digit strings
+            language{str}                               : "bn" for Bangla words, "en" for English words
+
+        return: numpy object array of str, the same words NumberParser.number_to_words gives for each value
+        """
+        np = _numpy()
+        tables = self._group_tables(language)
+
+        if isinstance(numbers, np.ndarray) and numbers.dtype.kind in "iu":
+            shape = numbers.shape
+            if numbers.dtype.kind == "u" and numbers.size and numbers.max() > np.iinfo(np.int64).max:
+                raise ValueError("numbers beyond int64 can not be verbalized from an array, pass them as digit strings")
+            values = numbers.reshape(-1).astype(np.int64)
+            if (values < 0).any():
+                raise ValueError("negative numbers can not be verbalized")
+            strings, n_digits, valid = None, None, np.ones(len(values), dtype=bool)
+        else:
+            strings = numbers if isinstance(numbers, (list, tuple)) else list(numbers)
+            shape = (len(strings),)
+            values, n_digits, valid = self.parse_digit_strings(strings)
+
+        # distinct values are verbalized once and scattered back
+        unique, inverse = np.unique(values, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        digit_counts = np.searchsorted(10 ** np.arange(1, 19, dtype=np.int64), unique, side="right") + 1
+        unique_chunks = (digit_counts + 6) // 7
+        words = self._assemble(np, unique, unique_chunks, tables).astype(object)
+        result = words[inverse]
+
+        if strings is not None:
+            # leading zero chunks ("00000001234567") and numbers beyond int64 take the scalar path
+            fallback = ~valid | ((n_digits + 6) // 7 > unique_chunks[inverse])
+            for index in np.flatnonzero(fallback):
+                result[index] = self._scalar_words(strings[index], language)
+        return result.reshape(shape)
+
+    def _digit_points(self, np, language="bn"):
+        """
+        Code points of the digits 0-9 in the Bangla or English script
+        """
+        if language == "bn":
+            return np.array([ord(cfg.en_to_bn_digits_mapping[str(d)]) for d in range(10)], dtype=np.uint32)
+        return np.array([ord(str(d)) for d in range(10)], dtype=np.uint32)
+
+    def format_digits(self, numbers, decimals=None, language="bn"):
+        """
+        Render numbers as digit strings with South Asian grouping, ১২৩৪৫৬৭.৮৯ -> "১২,৩৪,৫৬৭.৮৯"
+
+        Arg:
+            numbers{numpy array or list}: integers or floats
+            decimals{int}               : digits after the decimal point, default 0 for integers and 2 for floats
+            language{str}               : digit script, "bn" or "en"
+
+        return: numpy str array, non finite (or beyond int64 once scaled) numbers give "", unsigned
+                integers beyond int64 raise ValueError
+        """
+        np = _numpy()
+        numbers = np.asarray(numbers)
+        shape, numbers = numbers.shape, numbers.reshape(-1)
+        if numbers.dtype.kind not in "iuf":
+            raise ValueError("numbers must be integers or floats, got dtype %s" % numbers.dtype)
+        if decimals is None:
+            decimals = 2 if numbers.dtype.kind == "f" else 0
+        scale = 10 ** decimals
+
+        if numbers.dtype.kind == "f":
+            scaled = np.round(np.abs(numbers) * scale)
+            valid = np.isfinite(scaled) & (scaled < 2.0 ** 63)
+            negative = (numbers < 0) & (scaled > 0)
+            scaled = np.where(valid, scaled, 0).astype(np.int64)
+        else:
+            if numbers.dtype.kind == "u" and numbers.size and numbers.max() > np.iinfo(np.int64).max:
+                raise ValueError("numbers beyond int64 can not be formatted from an array")
+            numbers = numbers.astype(np.int64)
+            limit = (2 ** 63 - 1) // scale
+            valid, negative = (numbers >= -limit) & (numbers <= limit), numbers < 0
+            scaled = np.where(valid, np.abs(numbers), 0) * scale
+        integer, fraction = scaled // scale, scaled % scale
+
+        n_digits = np.searchsorted(10 ** np.arange(1, 19, dtype=np.int64), integer, side="right") + 1
+        n_commas = np.maximum(n_digits - 2, 0) // 2
+        sign = negative.astype(np.int64)
+        integer_end = sign + n_digits + n_commas
+        lengths = np.where(valid, integer_end + (decimals + 1 if decimals else 0), 0)
+
+        rows = np.arange(len(numbers))
+        width = max(int(lengths.max()) if len(numbers) else 0, 1)
+        points = np.zeros((len(numbers), width), dtype=np.uint32)
+        digit_points = self._digit_points(np, language)
+
+        selected = valid & negative
+        points[rows[selected], 0] = ord("-")
+        value = integer
+        for k in range(int(n_digits.max()) if len(numbers) else 0):
+            # digit k (from the right) sits after the 0, 1, 2, ... commas of the 3, 2, 2, ... grouping
+            selected = valid & (k < n_digits)
+            position = k + (0 if k < 3 else (k - 3) // 2 + 1)
+            points[rows[selected], integer_end[selected] - 1 - position] = digit_points[value[selected] % 10]
+            value = value // 10
+        for j in range(int(n_commas.max()) if len(numbers) else 0):
+            selected = valid & (j < n_commas)
+            points[rows[selected], integer_end[selected] - 4 - 3 * j] = ord(",")
+        if decimals:
+            points[rows[valid], integer_end[valid]] = ord(".")
+            value = fraction
+            for k in range(decimals):
+                points[rows[valid], integer_end[valid] + decimals - k] = digit_points[value[valid] % 10]
+                value = value // 10
+        return points.view("<U%d" % width).reshape(shape)
+
+    def _scalar_words(self, number, language="bn"):
+        digits = self.npr._digit_converter(number, language)
+        if len(digits) != len(number):
+            raise ValueError("not a digit string: %r" % (number,))
+        return self.npr.number_to_words(digits)
@@ -0,0 +1,158 @@
+import datetime
+from bisect import bisect_right
+
+from .config import Config as cfg
+from .array_parser import _numpy
+
+# revised Bangladesh calendar (2019): the year starts on 14 April, Boishakh-Ashwin have 31 days,
+# Kartik-Magh and Chaitra 30, Falgun 29 or 30 when its February has a 29th
+MONTH_DAYS = cfg._bangabda_month_days
+NEW_YEAR = (4, 14)
+# Bangabda = Gregorian year of its Boishakh 1 - 593
+YEAR_OFFSET = 593
+EPOCH = datetime.date(1970, 1, 1).toordinal()
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+class BangabdaCalendar:
+    """
+    Gregorian <-> Bangabda conversion from precomputed offset tables
+
+    The revised rules are applied to every year of Config.bangabda_year_range, scalar
+    conversions use the Python tables, the *_bulk ones the same tables as numpy arrays.
+    """
+    __slots__ = ("first_year", "last_year", "new_years", "month_starts", "_arrays")
+
+    def __init__(self, year_range=None):
+        """
+        Arg:
+            year_range{tuple}: first and last supported Bangabda year, default Config.bangabda_year_range
+        """
+        self.first_year, self.last_year = year_range or cfg.bangabda_year_range
+        # days since 1970-01-01 of every Boishakh 1, plus the one after the last year
+        self.new_years = [
+            datetime.date(year + YEAR_OFFSET, *NEW_YEAR).toordinal() - EPOCH
+            for year in range(self.first_year, self.last_year + 2)
+        ]
+        # day of the year each month starts on, for normal and leap (30 day Falgun) years
+        self.month_starts = []
+        for leap in (False, True):
+            starts, total = [], 0
+            for month, days in enumerate(MONTH_DAYS):
+                starts.append(total)
+                total += days + (leap and month == 10)
+            self.month_starts.append(starts)
+        self._arrays = None
+
+    def is_leap(self, year):
+        """
+        Bangabda year with a 30 day Falgun, its Falgun falls in February of year + 594
+        """
+        return _is_leap(year + YEAR_OFFSET + 1)
+
+    def year_days(self, year):
+        return 365 + self.is_leap(year)
+
+    def _check_year(self, year):
+        if not self.first_year <= year <= self.last_year:
+            raise ValueError("Bangabda year %d is outside the supported range %d-%d" % (year, self.first_year, self.last_year))
+
+    def to_bangabda(self, date):
+        """
+        Gregorian date -> (Bangabda year, month 1-12, day)
+
+        datetime.date(2023, 4, 14) -> (1430, 1, 1)
+        """
+        days = date.toordinal() - EPOCH
+        index = bisect_right(self.new_years, days) - 1
+        if index < 0 or index > self.last_year - self.first_year:
+            raise ValueError("%s is outside the supported Bangabda years %d-%d" % (date, self.first_year, self.last_year))
+        year = self.first_year + index
+        offset = days - self.new_years[index]
+        starts = self.month_starts[self.is_leap(year)]
+        month = bisect_right(starts, offset)
+        return year, month, offset - starts[month - 1] + 1
+
+    def from_bangabda(self, year, month, day):
+        """
+        (Bangabda year, month 1-12, day) -> Gregorian datetime.date
+        """
+        self._check_year(year)
+        leap = self.is_leap(year)
+        if not 1 <= month <= 12 or not 1 <= day <= MONTH_DAYS[month - 1] + (leap and month == 11):
+            raise ValueError("invalid Bangabda date %d-%d-%d" % (year, month, day))
+        days = self.new_years[year - self.first_year] + self.month_starts[leap][month - 1] + day - 1
+        return datetime.date.fromordinal(days + EPOCH)
+
+    def _tables(self):
+        """
+        numpy tables: Boishakh 1 days, leap flags, month starts and the date of every supported day
+        """
+        if self._arrays is None:
+            np = _numpy()
+            years = np.arange(self.first_year, self.last_year + 1)
+            leap = np.array([self.is_leap(int(year)) for year in years])
+            month_of_day = np.zeros((2, 366), dtype=np.int8)
+            day_of_month = np.zeros((2, 366), dtype=np.int8)
+            for is_leap, starts in enumerate(self.month_starts):
+                for month, start in enumerate(starts):
+                    days = MONTH_DAYS[month] + (is_leap and month == 10)
+                    month_of_day[is_leap, start:start + days] = month + 1
+                    day_of_month[is_leap, start:start + days] = np.arange(1, days + 1)
+            new_years = np.array(self.new_years, dtype=np.int64)
+            # year, month and day of every supported day, so a conversion is a single gather
+            days = np.arange(new_years[0], new_years[-1], dtype=np.int64)
+            index = np.searchsorted(new_years, days, side="right") - 1
+            offset = days - new_years[index]
+            is_leap = leap[index].astype(np.int64)
+            self._arrays = {
+                "new_years": new_years,
+                "leap": leap,
+                "month_starts": np.array(self.month_starts, dtype=np.int64),
+                "years": (index + self.first_year).astype(np.int16),
+                "months": month_of_day[is_leap, offset],
+                "days": day_of_month[is_leap, offset],
+            }
+        return self._arrays
+
+    def to_bangabda_bulk(self, dates):
+        """
+        Vectorized to_bangabda, requires numpy
+
+        Arg:
+            dates{array like}: numpy datetime64 values, "YYYY-MM-DD" strings or datetime.date objects
+
+        return: (years, months, days) int arrays
+        """
+        np = _numpy()
+        tables = self._tables()
+        index = np.asarray(dates, dtype="datetime64[D]").astype(np.int64) - self.new_years[0]
+        if index.size and (index.min() < 0 or index.max() >= len(tables["years"])):
+            raise ValueError("dates outside the supported Bangabda years %d-%d" % (self.first_year, self.last_year))
+        return (
+            tables["years"][index].astype(np.int64),
+            tables["months"][index].astype(np.int64),
+            tables["days"][index].astype(np.int64),
+        )
+
+    def from_bangabda_bulk(self, years, months, days):
+        """
+        Vectorized from_bangabda, requires numpy
+
+        return: numpy datetime64[D] array
+        """
+        np = _numpy()
+        tables = self._tables()
+        years, months, days = (np.asarray(values, dtype=np.int64) for values in (years, months, days))
+        index = years - self.first_year
+        if index.size and (index.min() < 0 or index.max() > self.last_year - self.first_year):
+            raise ValueError("years outside the supported Bangabda years %d-%d" % (self.first_year, self.last_year))
+        leap = tables["leap"][index]
+        month_days = np.asarray(MONTH_DAYS, dtype=np.int64)[np.clip(months, 1, 12) - 1] + (leap & (months == 11))
+        if ((months < 1) | (months > 12) | (days < 1) | (days > month_days)).any():
+            raise ValueError("invalid Bangabda month or day")
+        result = tables["new_years"][index] + tables["month_starts"][leap.astype(np.int64), months - 1] + days - 1
+        return result.astype("datetime64[D]")
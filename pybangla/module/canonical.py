@@ -0,0 +1,56 @@
+"""
+Canonical form of the text, the pre-pass of every Normalizer operation and the form the lexicon
+tables are written in
+
+    canonicalize("ছা\\u09dc\\u200c ৫০% 😀")      # "ছা\\u09a1\\u09bc ৫০% "
+
+Zero width and bidi marks, controls and emoji are dropped (joiners inside a Bangla word are kept), the nukta letters (ড় ঢ় য়) written as
+letter + nukta and the two part vowel signs joined (ে + া -> ো): the NFC form of the Bangla block.
+"""
+import re
+from itertools import chain
+
+from .config import Config as cfg
+
+# a joiner stays when a hasanta is on either side or a Bangla letter on both sides
+_dropped_re = re.compile("[%s]+|(?<!\u09cd)[{j}](?!\u09cd)(?:(?<![{b}][{j}])|(?![{b}]))".format(j=cfg._joiners, b=cfg._bangla_letters)
+                         % "".join(chr(first) + "-" + chr(last) for first, last in cfg._dropped_ranges))
+# str.replace scans at C speed and returns the text itself when there is nothing to replace
+_replacements = tuple(cfg._nukta_letters.items())
+_compositions = tuple(cfg._compositions.items())
+
+
+def canonicalize(text):
+    """
+    Arg:
+        text{str}: any input of a Normalizer operation
+
+    return: str, text in canonical form
+    """
+    for letter, parts in _replacements:
+        text = text.replace(letter, parts)
+    text = _dropped_re.sub("", text)
+    for pair, sign in _compositions:
+        text = text.replace(pair, sign)
+    return text
+
+
+def canonical_entries(value):
+    """
+    Lexicon entries with every string in canonical form, keys that become equal collapse to one,
+    the later entry wins
+    """
+    if isinstance(value, str):
+        return canonicalize(value)
+    if isinstance(value, dict):
+        try:
+            # a {word: word} table, one pass over all its words tells whether any needs the pre-pass
+            words = "\n".join(chain(value, value.values()))
+        except TypeError:
+            words = None
+        if words is not None and canonicalize(words) == words:
+            return value
+        return {canonical_entries(key): canonical_entries(entry) for key, entry in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(canonical_entries(entry) for entry in value)
+    return value
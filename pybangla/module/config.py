@@ -1,5 +1,85 @@
 
 import re
+import sys
+
+# amount: lakh grouping (1,00,000), western grouping (100,000) or a plain run, with optional decimals
+_amount = r"(?:[0-9০-৯]{1,2}(?:,[0-9০-৯]{2})*,[0-9০-৯]{3}(?!,[0-9০-৯])|[0-9০-৯]{1,3}(?:,[0-9০-৯]{3})+(?!,[0-9০-৯])|[0-9০-৯]+)(?:\.[0-9০-৯]+)?"
+
+
+def currency_regex(currency):
+    """
+    Symbol-prefixed or symbol-suffixed amounts for the symbols of a currency table
+    """
+    symbols = "[%s]" % re.escape("".join(currency))
+    return re.compile(
+        r"(?P<symbol>{s})\s?(?P<amount>{a})|(?<![0-9০-৯,.])(?P<amount_s>{a})\s?(?P<symbol_s>{s})(?![0-9০-৯])".format(s=symbols, a=_amount)
+        )
+
+
+def ordinal_regex(ordinal_words):
+    """
+    Fixed ordinals (১ম ... ১০ম), "<number> তম" and English "21st" in one alternation
+    """
+    return re.compile(
+        r"(?<![0-9০-৯])(?:(?P<fixed>%s)|(?P<number>[0-9০-৯]+)\s*তম|(?P<en_number>[0-9]+)(?:st|nd|rd|th)(?![A-Za-z]))"
+        % "|".join(map(re.escape, sorted(ordinal_words, key=len, reverse=True)))
+        )
+
+
+def numeral_regex(cues):
+    """
+    One scanner for number_processing: mobile numbers, cue-prefixed codes and leading zero
+    runs are read digit by digit, "৩/৪" is a fraction, every other numeric literal is a signed
+    integer or decimal with an optional percent sign
+    """
+    # every alternative starts with a digit, a sign or a cue, the lookahead rejects other positions fast
+    first = "".join(sorted({c for cue in cues for c in (cue[0].lower(), cue[0].upper())}))
+    cues = "|".join(map(re.escape, sorted(cues, key=len, reverse=True)))
+    return re.compile(
+        r"(?=[0-9০-৯+\-−" + re.escape(first) + r"])(?:"
+        r"(?P<phone>(?<![0-9০-৯])(?:\+?(?:880|৮৮০)[\s-]?[0০]?|[0০])[1১][3-9৩-৯][0-9০-৯]{2}[\s-]?[0-9০-৯]{6}(?![0-9০-৯]))"
+        # a cue is a common noun too ("কার্ড ১২টি"), it marks a code only with a number word or 4+ digits after it
+        r"|(?P<cue>(?<!\w)(?i:" + cues + r")\s*(?:(?:নম্বর|নং|নাম্বার|(?i:no)\.?)\s*[:-]?\s*|[:-]?\s*(?=[0-9০-৯]{4}|[0-9০-৯]+-[0-9০-৯])))"
+        r"(?P<sequence>[0-9০-৯]+(?:-[0-9০-৯]+)*)"
+        r"|(?P<zero>(?<![0-9০-৯])[0০][0-9০-৯]{3,}(?![0-9০-৯]|\.[0-9০-৯]))"
+        r"|(?<![0-9০-৯/])(?P<numerator>[0-9০-৯]+)/(?P<denominator>[0-9০-৯]+)(?![0-9০-৯]|/[0-9০-৯])"
+        # a run with more than one dot, like a version "1.2.3", is read one run at a time, never as a decimal
+        r"|(?<![0-9০-৯.])(?P<dotted>[0-9০-৯]+(?:\.[0-9০-৯]+){2,})(?![0-9০-৯]|\.[0-9০-৯])"
+        r"|(?:(?<![\w,.])(?P<sign>[-+−]))?(?<![0-9০-৯])(?<![0-9০-৯]\.)(?P<amount>" + _amount + r")(?![0-9০-৯]|\.[0-9০-৯])(?P<percent>\s?[%％])?)"
+        )
+
+
+def month_numbers(data):
+    """
+    {"april": 4, "apr": 4, "এপ্রিল": 4, "বৈশাখ": 1, "4": 4, "০৪": 4, ...}
+    """
+    names = data["en"]["months"] + data["bn"]["months"] + data["bn"]["option_name"] + data["en"]["option_name"]
+    table = {name: i % 12 + 1 for i, name in enumerate(names)}
+    digits = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+    for month in range(1, 13):
+        for number in {str(month), "%02d" % month}:
+            table[number] = table[number.translate(digits)] = month
+    return table
+
+
+def date_regex(month_names):
+    """
+    Dates with a four digit year first or last ("০১-০৪-২০২৩", "12.12.2020", "2023/04/01", "07 April, 2023",
+    "Apr 1, 2023", "১৫ বৈশাখ ১৪৩০") and clock times ("১০:৩০", "09:05:30")
+    """
+    d, y = r"[0-9০-৯]{1,2}", r"[0-9০-৯]{4}"
+    m = r"(?i:%s)(?![A-Za-z])" % "|".join(map(re.escape, sorted(month_names, key=len, reverse=True)))
+    # a date or time starts with a digit, or with a month name at the start of a word
+    first = "".join(sorted({c for name in month_names for c in (name[0].lower(), name[0].upper())}))
+    return re.compile(
+        r"(?=[0-9০-৯" + re.escape(first) + r"])(?<![0-9০-৯])(?P<date>"
+        r"{d}(?P<sep>[-/.]){d}(?P=sep){y}|{y}(?P<sep_y>[-/.]){d}(?P=sep_y){d}"
+        r"|{d}(?:\s*[-/,]\s*|\s+){m}(?:\s*[-/,]\s*|\s+){y}|(?:^|(?<=[\s(,])){m}\s*[-/ ]\s*{d},?\s*[-/ ]\s*{y}"
+        r")(?![0-9০-৯])"
+        r"|(?<![0-9০-৯:])(?P<hour>[0-9০-৯]{{1,2}}):(?P<minute>[0-9০-৯]{{2}})(?::(?P<second>[0-9০-৯]{{2}}))?(?![0-9০-৯:])".format(d=d, y=y, m=m)
+        )
+
+
 class Config:
     data = {
         "en":{
@@ -7,32 +87,83 @@ class Config:
             "weekdays" : ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"],
             "months"   : ["january", "february", "march", "april", "may", "june", "july", "august", "september", "october", "november",  "december"],
             "seasons" : ["summer", "wet season", "autumn","dry season", "winter", "spring"],
-            "number_mapping": {'0': 'জিরো', '1': 'ওয়ান', '2': 'টু', '3': 'থ্রি', '4': 'ফোর', '5': 'ফাইভ', '6': 'সিক্স', '7': 'সেভেন', '8': 'এইট', '9': 'নাইন'}
+            "number_mapping": {'0': 'জিরো', '1': 'ওয়ান', '2': 'টু', '3': 'থ্রি', '4': 'ফোর', '5': 'ফাইভ', '6': 'সিক্স', '7': 'সেভেন', '8': 'এইট', '9': 'নাইন'}
             
             },
         "bn":{
             "number"   : ["০","১","২","৩","৪", "৫", "৬", "৭", "৮", "৯", "১০", "১১", "১২"],
             "weekdays" : ["সোমবার", "মঙ্গলবার", "বুধবার","বৃহস্পতিবার", "শুক্রবার", "শনিবার", "রবিবার"],
-            "months"   : ["জানুয়ারি", "ফেব্রুয়ারি", "মার্চ", "এপ্রিল", "মে", "জুন", "জুলাই", "আগস্ট", "সেপ্টেম্বর", "অক্টোবর", "নভেম্বর",  "ডিসেম্বর"],
+            "months"   : ["জানুয়ারি", "ফেব্রুয়ারি", "মার্চ", "এপ্রিল", "মে", "জুন", "জুলাই", "আগস্ট", "সেপ্টেম্বর", "অক্টোবর", "নভেম্বর",  "ডিসেম্বর"],
             "option_name" :  ["বৈশাখ", "জ্যৈষ্ঠ","আষাঢ়", "শ্রাবণ", "ভাদ্র", "আশ্বিন", "কার্তিক", "অগ্রহায়ণ", "পৌষ", "মাঘ", "ফাল্গুন", "চৈত্র"],
             "seasons"  : ["গ্রীষ্ম","বর্ষা", "শরৎ", "হেমন্ত", "শীত", "বসন্ত"],
-            "number_mapping": {'০':'শূন্য', '১':'এক', '২':'দুই', '৩':'তিন', '৪':'চার', '৫':'পাঁচ', '৬':'ছয়', '৭':'সাত', '৮':'আট', '৯':'নয়'}
+            "number_mapping": {'০':'শূন্য', '১':'এক', '২':'দুই', '৩':'তিন', '৪':'চার', '৫':'পাঁচ', '৬':'ছয়', '৭':'সাত', '৮':'আট', '৯':'নয়'}
 
             }
     }
-    bn_number_word_mapping = {'০':'শূন্য', '১':'এক', '২':'দুই', '৩':'তিন', '৪':'চার', '৫':'পাঁচ', '৬':'ছয়', '৭':'সাত', '৮':'আট', '৯':'নয়'}
+    bn_number_word_mapping = {'০':'শূন্য', '১':'এক', '২':'দুই', '৩':'তিন', '৪':'চার', '৫':'পাঁচ', '৬':'ছয়', '৭':'সাত', '৮':'আট', '৯':'নয়'}
 
     bn_regex = r'[০-৯]+'
     en_regex = r'[0-9]+'
     samples = ["-", ",", "/", " "]
+    # years in [start, stop) are verbalized once and served from a lookup table
+    year_table_range = (1000, 3000)
+    # NumberParser.number_to_words: "grouped" (কোটি chains) or "digits" past digits_threshold digits,
+    # max_number_digits caps the work of one call, None for no cap
+    number_policy = "grouped"
+    digits_threshold = 15
+    max_number_digits = None
+    # BangabdaCalendar tables, Gregorian 1900-04-14 to 2200-04-13
+    bangabda_year_range = (1307, 1606)
+    # days of Boishakh .. Chaitra in the revised Bangladesh calendar, Falgun has 30 in a leap year
+    _bangabda_month_days = (31, 31, 31, 31, 31, 31, 30, 30, 30, 30, 29, 30)
+    # NumberParser caches, filled on first use: year -> words per language, and the 0-99 and scale words
+    _year_tables = {}
+    _group_words = {}
+    # distinct word clusters ("এক লক্ষ", "ডাবল ওয়ান") Word2NumberMap keeps converted
+    cluster_cache_size = 4096
+    # Normalizer default for malformed input: "quiet" only count it, "print" the error too, "strict" raise it
+    error_policy = "quiet"
+    # characters of a document piece Normalizer.normalize_document hands to one worker
+    document_chunk_size = 1 << 20
+    # rows of a date column Normalizer.date_format_bulk infers the format from
+    date_sample_size = 100
+    # canonical pre-pass of every Normalizer operation: (first, last) code points it drops, zero width
+    # and bidi marks, controls that are not whitespace, emoji with their selectors, skin tones and tags
+    # in the symbol blocks only the emoji presentation code points go, ✓ ★ → are kept
+    _dropped_ranges = [(0x00, 0x08), (0x0e, 0x1b), (0x7f, 0x84), (0x86, 0x9f), (0xad, 0xad), (0x200b, 0x200b),
+                       (0x200e, 0x200f), (0x202a, 0x202e), (0x2060, 0x2064), (0x2066, 0x2069), (0x20e3, 0x20e3),
+                       (0x2614, 0x2615), (0x2648, 0x2653), (0x267f, 0x267f), (0x2693, 0x2693), (0x26a1, 0x26a1),
+                       (0x26aa, 0x26ab), (0x26bd, 0x26be), (0x26c4, 0x26c5), (0x26ce, 0x26ce), (0x26d4, 0x26d4),
+                       (0x26ea, 0x26ea), (0x26f2, 0x26f3), (0x26f5, 0x26f5), (0x26fa, 0x26fa), (0x26fd, 0x26fd),
+                       (0x2705, 0x2705), (0x270a, 0x270b), (0x2728, 0x2728), (0x274c, 0x274c), (0x274e, 0x274e),
+                       (0x2753, 0x2755), (0x2757, 0x2757), (0x2795, 0x2797), (0x27b0, 0x27b0), (0x27bf, 0x27bf),
+                       (0x2b1b, 0x2b1c), (0x2b50, 0x2b50), (0x2b55, 0x2b55), (0xfe00, 0xfe0f), (0xfeff, 0xfeff),
+                       (0x1f000, 0x1faff), (0xe0000, 0xe007f)]
+    # ZWNJ and ZWJ spell a conjunct (র‍্য, ক্‌ষ) between Bangla letters or next to a hasanta, elsewhere they are dropped
+    _joiners = "\u200c\u200d"
+    _bangla_letters = "\u0980-\u09e3\u09f0-\u09f1"
+    # its NFC form of the Bangla block: nukta letters as letter + nukta, two part vowel signs joined
+    _nukta_letters = {"\u09dc": "\u09a1\u09bc", "\u09dd": "\u09a2\u09bc", "\u09df": "\u09af\u09bc"}
+    _compositions = {"\u09c7\u09be": "\u09cb", "\u09c7\u09d7": "\u09cc"}
     _currency = {"৳" : "টাকা", "$" : "ডলার", "£" : "পাউন্ড", "€" : "ইউরো", "¥" : "ইয়েন", "₹" : "রুপি", "₽" : "রুবেল", "₺" : "লিরা"}
+    decimal_word = "দশমিক"
+
+    _currency_re = currency_regex(_currency)
     en_to_bn_digits_mapping = {e : b for e, b in zip(data["en"]["number"], data["bn"]["number"])}
+    _en_to_bn_digits = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+    _bn_to_en_digits = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
     bn_to_en_digits_mapping = {v : k for k, v in en_to_bn_digits_mapping.items()}
     en_month_shortname = [i[:3] for i in data["en"]["months"]]
 
     data["bn"]["digits_mapping"] = en_to_bn_digits_mapping
     data["en"]["digits_mapping"] = bn_to_en_digits_mapping
     data["en"]["option_name"] = en_month_shortname
+
+    # month name, short name, Bangla month, Bangla calendar month or month number -> 1-12,
+    # DateParser.month_convert_to_number and the expand_dates scanner read it
+    _month_numbers = month_numbers(data)
+    _date_re = date_regex([name for name in _month_numbers if not name.isdigit()])
+    _time_words = {"hour": "টা", "minute": "মিনিট", "second": "সেকেন্ড"}
     
     _bangla2english_digits_mapping = {'১':'1', '২':'2', '৩':'3', '৪':'4', '৫':'5', '৬':'6', '৭':'7', '৮':'8', '৯':'9', '০':'0'}
 
@@ -42,7 +173,7 @@ class Config:
     
     
     bn_word_map = {
-    'শূন্য': '0', 'এক': '1', 'দুই': '2', 'তিন': '3', 'চার': '4', 'পাঁচ': '5', 'ছয়': '6', 'সাত': '7', 'আট': '8', 'নয়': '9', 'দশ': '10', 
+    'শূন্য': '0', 'এক': '1', 'দুই': '2', 'তিন': '3', 'চার': '4', 'পাঁচ': '5', 'ছয়': '6', 'সাত': '7', 'আট': '8', 'নয়': '9', 'দশ': '10', 
     'এগারো': '11', 'বারো': '12', 'তেরো': '13', 'চৌদ্দ': '14', 'পনেরো': '15', 'ষোল': '16', 'সতেরো': '17', 'আঠারো': '18', 'উনিশ': '19', 'বিশ': '20',
     'একুশ': '21', 'বাইশ': '22', 'তেইশ': '23', 'চব্বিশ': '24', 'পঁচিশ': '25', 'ছাব্বিশ': '26', 'সাতাশ': '27', 'আঠাশ': '28', 'ঊনত্রিশ': '29', 'ত্রিশ': '30',
     'একত্রিশ': '31', 'বত্রিশ': '32', 'তেত্রিশ': '33', 'চৌত্রিশ': '34', 'পঁয়ত্রিশ': '35', 'ছত্রিশ': '36', 'সাঁইত্রিশ': '37', 'আটত্রিশ': '38', 'ঊনচল্লিশ': '39', 'চল্লিশ': '40', 
@@ -54,31 +185,31 @@ class Config:
     'একানব্বই': '91', 'বিরানব্বই': '92', 'তিরানব্বই': '93', 'চুরানব্বই': '94', 'পঁচানব্বই': '95', 'ছিয়ানব্বই': '96', 'সাতানব্বই': '97', 'আটানব্বই': '98', 'নিরানব্বই': '99'
 }
 
-    bn_hundreds_1={'একশ': "100",'দুইশ': "200", 'তিনশ':"300",'চারশ': "400",'পাঁচশ':"500",'ছয়শ':"600",'সাতশ': "700",'আটশ':"800",'নয়শ':"900"}
+    bn_hundreds_1={'একশ': "100",'দুইশ': "200", 'তিনশ':"300",'চারশ': "400",'পাঁচশ':"500",'ছয়শ':"600",'সাতশ': "700",'আটশ':"800",'নয়শ':"900"}
 
     target_chars = ["শো", "শত", "শ"]
 
-    checking_hunderds = ['একশ', 'দুইশ', 'তিনশ', 'চারশ', 'পাঁচশ', 'ছয়শ', 'সাতশ', 'আটশ', 'নয়শ', 'লক্ষ', 'হাজার', 'কোটি', 'লাখ', "একশত"]
+    checking_hunderds = ['একশ', 'দুইশ', 'তিনশ', 'চারশ', 'পাঁচশ', 'ছয়শ', 'সাতশ', 'আটশ', 'নয়শ', 'লক্ষ', 'হাজার', 'কোটি', 'লাখ', "একশত"]
 
     decimale_chunks = {"কোটি" : "10000000",'লক্ষ': "100000", "লাখ": "100000", 'হাজার': "1000"}
 
-    adjust_number = {"সাড়ে":0.5, "সারে":0.5, "আড়াই": 2.5, "আরাই":2.5, "দেড়":0.5, "দের":0.5}
+    adjust_number = {"সাড়ে":0.5, "সারে":0.5, "আড়াই": 2.5, "আরাই":2.5, "দেড়":0.5, "দের":0.5}
     conjugative_number = {"ডবল": "2", "ডাবল": "2", "ট্রিপল": "3"}
-    en_number_mapping = {"জিরো": "0" ,"ওয়ান": "1", "টু": "2", "থ্রি":"3", "ফোর":"4", "ফাইভ":"5", "সিক্স":"6", "সেভেন":"7", "এইট":"8", "নাইন":"9", "টেন": "10"}
+    en_number_mapping = {"জিরো": "0" ,"ওয়ান": "1", "টু": "2", "থ্রি":"3", "ফোর":"4", "ফাইভ":"5", "সিক্স":"6", "সেভেন":"7", "এইট":"8", "নাইন":"9", "টেন": "10"}
 
     en_doshok_map = {
         'ইলেভেন':"11", 'টুয়েলভ':"12", 'থার্টিন':"13", 'ফোরটিন':"14", 'ফিফটিন':"15", 'সিক্সটিন':"16", 'সেভেনটিন':"17", 'এইটিন':"18", 
         'নাইনটিন':"19","টুয়েন্টি": "20", "থার্টি": "30", "ফর্টি":"40", "ফিফ্টি": "50", "সিক্সটি": "60", "সেভেন্টি":"70", "এটি": "80", "নাইনটি":"90"
         }
 
-    fraction_int = {"ডেরশ": "150", "দেড়শো":"150", "দেড়শত":"150", "দেরশ": "150", "আরাইশ": "250", "আড়াইশ": "250", "আরাইশো" : "250", "আড়াইশত": "250" }
+    fraction_int = {"ডেরশ": "150", "দেড়শো":"150", "দেড়শত":"150", "দেরশ": "150", "আরাইশ": "250", "আড়াইশ": "250", "আরাইশো" : "250", "আড়াইশত": "250" }
 
     
 
 
     function_mapping = {
-                    "সাড়ে" : "equation_of_sare_and_der", "সারে": "equation_of_sare_and_der", "আড়াই": "equation_of_arai", 
-                    "আরাই": "equation_of_arai", "দেড়": "equation_of_sare_and_der", "দের" : "equation_of_sare_and_der"
+                    "সাড়ে" : "equation_of_sare_and_der", "সারে": "equation_of_sare_and_der", "আড়াই": "equation_of_arai", 
+                    "আরাই": "equation_of_arai", "দেড়": "equation_of_sare_and_der", "দের" : "equation_of_sare_and_der"
                     }
 
     bn_hundreds_2 = {i.replace(i[-1], "শত"): v for i, v in bn_hundreds_1.items()}
@@ -88,6 +219,8 @@ class Config:
     hundreds = list(bn_hundreds.keys())
     checking_adjust = list(adjust_number.keys())
     checking_conjugative_number = list(conjugative_number.keys())
+    # words that make a cluster a sum ("এক লক্ষ দুই হাজার"), see Word2NumberMap.sum_status
+    checking_sum_words = frozenset(checking_hunderds + checking_adjust)
 
     
     
@@ -136,21 +269,22 @@ class Config:
 
     _symbols = {
             "en": [
-                (re.compile(r"%s" % re.escape(x[0]), re.IGNORECASE), x[1])
+                (re.compile(x[0], re.IGNORECASE), x[1])
                 for x in [
                     ("&", " and "),
                     ("@", " at "),
-                    ("%", " percent "),
+                    # a percent right after digits is verbalized with its number by number_processing
+                    (r"(?<![0-9০-৯])%", " percent "),
                     ("#", " hash "),
                     ("°", " degree ")
                 ]
             ],
             "bn": [
-                (re.compile(r"%s" % re.escape(x[0]), re.IGNORECASE), x[1])
+                (re.compile(x[0], re.IGNORECASE), x[1])
                 for x in [
                     ("&", " এবং"),
                     ("@", " এট দা রেট"),
-                    ("%", " পারসেন্ট"),
+                    (r"(?<![0-9০-৯])%", " পারসেন্ট"),
                     ("#", " হ্যাশ"),
                     ("°", " ডিগ্রী")
                 ]
@@ -158,27 +292,58 @@ class Config:
         }
 
     
+    _bn_ordinals = [
+        ("১ম", "প্রথম"),
+        ("২য়", "দ্বিতীয়"),
+        ("৩য়", "তৃতীয়"),
+        ("৪র্থ", "চতুর্থ"),
+        ("৫ম","পঞ্চম"),
+        ("৬ষ্ঠ", "ষষ্ঠ"),
+        ("৭ম", "সপ্তম"),
+        ("৮ম", "অষ্টম"),
+        ("৯ম", "নবম"),
+        ("১০ম", "দশম")
+    ]
+    
     _ordinal_re = {
         "en": re.compile(r"([0-9]+)(st|nd|rd|th)"),
         "bn": [
                 (re.compile(r"%s" % re.escape(x[0]), re.IGNORECASE), x[1])
-                for x in [
-                    ("১ম", "প্রথম"),
-                    ("২য়", "দ্বিতীয়"),
-                    ("৩য়", "তৃতীয়"),
-                    ("৪র্থ", "চতুর্থ"),
-                    ("৫ম","পঞ্চম"),
-                    ("৬ষ্ঠ", "ষষ্ঠ"),
-                    ("৭ম", "সপ্তম"),
-                    ("৮ম", "অষ্টম"),
-                    ("৯ম", "নবম"),
-                    ("১০ম", "দশম")
-                ]
+                for x in _bn_ordinals
             ],
         }
+
+    _ordinal_words = dict(_bn_ordinals)
+    _ordinal_numbers = {i + 1: x[1] for i, x in enumerate(_bn_ordinals)}
+    _ordinal_matcher = ordinal_regex(_ordinal_words)
     
     
     _whitespace_re = re.compile(r"\s+")
+
+    # words before a digit run that make it a code read digit by digit: "ওটিপি ৪৫১২", "PIN: 0042"
+    digit_sequence_cues = ["ওটিপি", "OTP", "পিন", "PIN", "কোড", "code", "অ্যাকাউন্ট", "একাউন্ট", "account", "A/C",
+                           "আইডি", "ID", "এনআইডি", "NID", "কার্ড", "card"]
+    _numeral_re = numeral_regex(digit_sequence_cues)
+    # repeated digits inside a digit sequence: "৭৭" -> "ডাবল সাত"
+    _repeat_words = {2: "ডাবল", 3: "ট্রিপল"}
+    _sign_words = {"+": "প্লাস", "-": "মাইনাস", "−": "মাইনাস"}
+    _percent_word = "পারসেন্ট"
+    # spoken variants InverseNormalizer reads besides the words text_normalizer writes
+    _itn_variants = {"পার্সেন্ট": "%", "শতাংশ": "%", "ডিগ্রি": "°", "পয়েন্ট": ".", "point": "."}
+    # "৩/৪" -> "চার ভাগের তিন"
+    _fraction_word = "ভাগের"
+
+    # TextParser.processing stages, run from the highest priority down, custom rules slot in by priority
+    stages = [
+        ("collapse_whitespace", 700),
+        ("expand_symbols", 600),
+        ("expand_abbreviations", 500),
+        ("expand_dates", 450),
+        ("expand_position", 400),
+        ("extract_currency_amounts", 300),
+        ("year_formation", 200),
+        ("number_processing", 100),
+    ]
     
     
     _bangla_numeric_words = {
@@ -188,10 +353,10 @@ class Config:
         'three':'তিন',
         'four':'চার',
         'five':'পাঁচ',
-        'six':'ছয়',
+        'six':'ছয়',
         'seven':'সাত',
         'eight':'আট',
-        'nine':'নয়',
+        'nine':'নয়',
         "hundred" : "শত", 
         "thousand" : "হাজার", 
         "lakh" : "লক্ষ", 
@@ -221,26 +386,26 @@ class Config:
         "thirty-two" : "বত্রিশ",
         "thirty-three" : "তেত্রিশ",
         "thirty-four" : "চৌত্রিশ",
-        "thirty-five" : "পঁয়ত্রিশ",
+        "thirty-five" : "পঁয়ত্রিশ",
         "thirty-six" : "ছত্রিশ",
         "thirty-seven" : "সাইত্রিশ",
         "thirty-eight" : "আটত্রিশ",
         "thirty-nine" : "ঊনচল্লিশ",
         "forty" : "চল্লিশ",
         "forty-one" : "একচল্লিশ",
-        "forty-two" : "বেয়াল্লিশ",
+        "forty-two" : "বেয়াল্লিশ",
         "forty-three" : "তেতাল্লিশ",
-        "forty-four" : "চুয়াল্লিশ",
-        "forty-five" : "পঁয়তাল্লিশ",
+        "forty-four" : "চুয়াল্লিশ",
+        "forty-five" : "পঁয়তাল্লিশ",
         "forty-six" : "ছেচল্লিশ",
         "forty-seven" : "সাতচল্লিশ",
         "forty-eight" : "আটচল্লিশ",
         "forty-nine" : "ঊনপঞ্চাশ",
         "fifty" : "পঞ্চাশ",
         "fifty-one" : "একান্ন",
-        "fifty-two" : "বায়ান্ন",
+        "fifty-two" : "বায়ান্ন",
         "fifty-three" : "তেপ্পান্ন",
-        "fifty-four" : "চুয়ান্ন",
+        "fifty-four" : "চুয়ান্ন",
         "fifty-five" : "পঞ্চান্ন",
         "fifty-six" : "ছাপ্পান্ন",
         "fifty-seven" : "সাতান্ন",
@@ -251,7 +416,7 @@ class Config:
         "sixty-two" : "বাষট্টি",
         "sixty-three" : "তেষট্টি",
         "sixty-four" : "চৌষট্টি",
-        "sixty-five" : "পঁয়ষট্টি",
+        "sixty-five" : "পঁয়ষট্টি",
         "sixty-six" : "ছেষট্টি",
         "sixty-seven" : "সাতষট্টি",
         "sixty-eight" : "আটষট্টি",
@@ -259,10 +424,10 @@ class Config:
         "seventy" : "সত্তর",
         "seventy-one" : "একাত্তর",
         "seventy-two" : "বাহাত্তর",
-        "seventy-three" : "তেয়াত্তর",
-        "seventy-four" : "চুয়াত্তর",
+        "seventy-three" : "তেয়াত্তর",
+        "seventy-four" : "চুয়াত্তর",
         "seventy-five" : "পঁচাত্তর",
-        "seventy-six" : "ছিয়াত্তর",
+        "seventy-six" : "ছিয়াত্তর",
         "seventy-seven" : "সাতাত্তর",
         "seventy-eight" : "আটাত্তর",
         "seventy-nine" : "ঊনআশি",
@@ -272,7 +437,7 @@ class Config:
         "eighty-three" : "তিরাশি",
         "eighty-four" : "চুরাশি",
         "eighty-five" : "পঁচাশি",
-        "eighty-six" : "ছিয়াশি",
+        "eighty-six" : "ছিয়াশি",
         "eighty-seven" : "সাতাশি",
         "eighty-eight" : "আটাশি",
         "eighty-nine" : "ঊননব্বই",
@@ -282,8 +447,31 @@ class Config:
         "ninety-three" : "তিরানব্বই",
         "ninety-four" : "চুরানব্বই",
         "ninety-five" : "পঁচানব্বই",
-        "ninety-six" : "ছিয়ানব্বই",
+        "ninety-six" : "ছিয়ানব্বই",
         "ninety-seven" : "সাতানব্বই",
         "ninety-eight" : "আটানব্বই",
         "ninety-nine" : "নিরানব্বই"
-    }
\ No newline at end of file
+    }
+
+
+def _intern(table):
+    """
+    Intern every string of a lexicon table in place, so equal tokens share one object
+    """
+    if isinstance(table, dict):
+        # the keys are only replaced by rebuilding the dict, in insertion order
+        items = [(sys.intern(key) if isinstance(key, str) else key, value) for key, value in table.items()]
+        table.clear()
+        table.update(items)
+    items = table.items() if isinstance(table, dict) else enumerate(table)
+    for key, value in list(items):
+        if isinstance(value, str):
+            table[key] = sys.intern(value)
+        elif isinstance(value, (dict, list)):
+            _intern(value)
+    return table
+
+
+for _table in (Config.data, Config.bn_word_map, Config.bn_hundreds, Config.en_number_mapping, Config.en_doshok_map,
+               Config.fraction_int, Config._bangla_numeric_words, Config._ordinal_words, Config.bn_number_word_mapping):
+    _intern(_table)
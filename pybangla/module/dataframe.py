@@ -0,0 +1,151 @@
+"""
+pandas and pyarrow integration, every distinct value of a column is normalized once
+
+    import pybangla.module.dataframe
+    df["text"] = df["text"].bangla.text_normalizer()
+    table = table.set_column(0, "text", normalize_arrow(table["text"]))
+"""
+from itertools import repeat
+
+import numpy as np
+
+from .workers import executor, get_normalizer
+
+OPERATIONS = ("text_normalizer", "word2number", "number_convert")
+
+
+def _apply(operation, values, field=None):
+    """
+    Run a Normalizer operation over a batch of values, module level so process pools can pickle it
+    """
+    normalizer = get_normalizer()
+    if operation == "word2number":
+        return normalizer.word2number_batch(values)
+    func = getattr(normalizer, operation)
+    if operation == "text_normalizer":
+        return [func(v) for v in values]
+    if field is None:
+        # plain dicts, every field is computed here rather than wherever the column is read
+        return [func(v).to_dict() for v in values]
+    return [func(v)[field] for v in values]
+
+
+def normalize_unique(values, operation="text_normalizer", workers=None, chunk_size=1000, field=None):
+    """
+    Normalize a list of distinct values
+
+    Arg:
+        values{list}    : distinct, non null values
+        operation{str}  : "text_normalizer", "word2number" or "number_convert"
+        workers{int}    : process pool size, None or 1 runs in this process
+        chunk_size{int} : values sent to a worker at a time
+        field{str}      : pick one key of the number_convert result, like "number_string"
+
+    return: list of results in the order of values
+    """
+    if operation not in OPERATIONS:
+        raise ValueError("operation must be one of %s, got %r" % (", ".join(OPERATIONS), operation))
+    if not workers or workers == 1 or len(values) <= chunk_size:
+        return _apply(operation, values, field)
+    batches = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+    results = []
+    with executor(max_workers=workers) as pool:
+        for batch in pool.map(_apply, repeat(operation), batches, repeat(field)):
+            results.extend(batch)
+    return results
+
+
+def _scatter(results, codes):
+    """
+    Gather results by dictionary codes, code -1 (null) gives None
+    """
+    table = np.empty(len(results) + 1, dtype=object)
+    table[:-1] = results
+    table[-1] = None
+    return table[codes]
+
+
+def normalize_arrow(array, operation="text_normalizer", workers=None, field=None, dictionary=False):
+    """
+    pyarrow compute-style normalization of a string column
+
+    Arg:
+        array{pyarrow Array or ChunkedArray}: string or dictionary encoded string column
+        operation{str}                      : "text_normalizer", "word2number" or "number_convert"
+        workers{int}                        : process pool size for the distinct values
+        field{str}                          : pick one key of the number_convert result
+        dictionary{bool}                    : keep the result dictionary encoded
+
+    return: pyarrow Array, or ChunkedArray for chunked input, nulls stay null
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    memo = {}
+
+    def convert(chunk):
+        encoded = chunk if pa.types.is_dictionary(chunk.type) else pc.dictionary_encode(chunk)
+        values = encoded.dictionary.to_pylist()
+        missing = [v for v in values if v not in memo]
+        memo.update(zip(missing, normalize_unique(missing, operation, workers, field=field)))
+        converted = pa.array([memo[v] for v in values])
+        if dictionary:
+            return pa.DictionaryArray.from_arrays(encoded.indices, converted)
+        return converted.take(encoded.indices)
+
+    if isinstance(array, pa.ChunkedArray):
+        # the memo is shared, so a value repeated across chunks is normalized once
+        return pa.chunked_array([convert(chunk) for chunk in array.chunks])
+    return convert(array)
+
+
+def register_arrow_functions():
+    """
+    Register bangla_text_normalizer and bangla_word2number as pyarrow compute functions
+
+        pc.call_function("bangla_text_normalizer", [table["text"]])
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for operation in ("text_normalizer", "word2number"):
+        name = "bangla_" + operation
+        if name in pc.list_functions():
+            continue
+
+        def udf(context, array, operation=operation):
+            return normalize_arrow(array, operation=operation).cast(pa.string())
+
+        doc = {"summary": "pybangla " + operation, "description": "Normalizer." + operation + " on every distinct value"}
+        pc.register_scalar_function(udf, name, doc, {"text": pa.string()}, pa.string())
+
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional, the arrow functions work without it
+    pd = None
+
+if pd is not None:
+
+    @pd.api.extensions.register_series_accessor("bangla")
+    class BanglaAccessor:
+        """
+        series.bangla.text_normalizer(), series.bangla.word2number(), series.bangla.number_convert()
+        """
+
+        def __init__(self, series):
+            self._series = series
+
+        def _map(self, operation, workers=None, field=None):
+            codes, uniques = pd.factorize(self._series)
+            results = normalize_unique(list(uniques), operation, workers, field=field)
+            return pd.Series(_scatter(results, codes), index=self._series.index, name=self._series.name)
+
+        def text_normalizer(self, workers=None):
+            return self._map("text_normalizer", workers)
+
+        def word2number(self, workers=None):
+            return self._map("word2number", workers)
+
+        def number_convert(self, field=None, workers=None):
+            return self._map("number_convert", workers, field=field)
@@ -0,0 +1,140 @@
+"""
+Date format inference for homogeneous date columns
+
+The layout of a sample of the column ("DD-MM-YYYY", "DD-Month-YYYY", "YYYYMMDD") is compiled
+into one regex, rows matching it skip the data_splitter / get_date_indexes heuristics and give
+the [day, month, year] those heuristics would give:
+
+    date_format = infer_date_format(["01-04-2023", "15-08-2024"])
+    date_format.name                    # "DD-MM-YYYY"
+    date_format.parse("02-05-2023")     # ["02", "05", "2023"]
+"""
+import re
+from collections import Counter
+
+from .config import Config as cfg
+
+_digits = r"[0-9০-৯]"
+# a run of DateParser separators, kept by split
+_separator_re = re.compile("([%s]+)" % re.escape("".join(cfg.samples)))
+_month_names = {name: month for name, month in cfg._month_numbers.items() if not name.isdigit()}
+_month_re = r"(?i:%s)" % "|".join(map(re.escape, sorted(_month_names, key=len, reverse=True)))
+
+
+class DateFormat:
+    """
+    One inferred layout, parse() reads a row of it or returns None
+    """
+    __slots__ = ("name", "regex", "day", "month", "month_name", "compact")
+
+    def __init__(self, name, pattern, day=None, month=None, month_name=False, compact=False):
+        """
+        Arg:
+            name{str}        : layout like "DD-MM-YYYY"
+            pattern{str}     : regex of the whole row, the parts are groups 1-3
+            day, month{int}  : groups of the day and the month, the year is the other one
+            month_name{bool} : the month is a name, read through Config._month_numbers
+            compact{bool}    : eight digits, split like DateParser.format_non_punctuation
+        """
+        self.name = name
+        self.regex = re.compile(pattern)
+        self.day, self.month, self.month_name, self.compact = day, month, month_name, compact
+
+    def __repr__(self):
+        return "DateFormat(%r)" % self.name
+
+    def parse(self, value):
+        """
+        [day, month, year] of a row of this layout, None for any other row
+        """
+        match = self.regex.fullmatch(value)
+        if match is None:
+            return None
+        if self.compact:
+            if int(value[4:6]) <= 12:
+                return [value[6:], value[4:6], value[:4]]
+            return [value[:2], value[2:4], value[4:]]
+        parts = match.groups()
+        month = parts[self.month - 1]
+        if self.month_name:
+            month = _month_names.get(month.lower())
+            if month is None:
+                return None
+        # the groups are 1, 2 and 3, the year is the one left
+        return [parts[self.day - 1], month, parts[5 - self.day - self.month]]
+
+
+def _shape(value):
+    """
+    Tokens and separators of a row, tokens as "YYYY", "DD" or "Month", None when the row does
+    not look like a date the heuristics read
+    """
+    pieces = _separator_re.split(value)
+    tokens, separators = pieces[::2], pieces[1::2]
+    if len(tokens) == 1 and len(value) == 8 and value.isdigit():
+        return ("YYYYMMDD",), ()
+    if len(tokens) != 3:
+        return None
+    kinds = []
+    for token in tokens:
+        if token.isdigit() and len(token) == 4:
+            kinds.append("YYYY")
+        elif token.isdigit() and len(token) <= 2:
+            kinds.append("DD")
+        elif token.lower() in _month_names:
+            kinds.append("Month")
+        else:
+            return None
+    return tuple(kinds), tuple(separators)
+
+
+def _compile(kinds, separators):
+    """
+    DateFormat of a shape, with the day and month roles get_date_indexes gives its tokens
+    """
+    if kinds == ("YYYYMMDD",):
+        return DateFormat("YYYYMMDD", r"(%s{4})(%s{2})(%s{2})" % (_digits, _digits, _digits), compact=True)
+    if kinds.count("YYYY") != 1 or kinds[1] == "YYYY" or kinds.count("Month") > 1:
+        return None
+    # get_day_and_month: with the year last the day is the token before the month unless that
+    # one is a name, with the year first the day is the last token unless that one is a name
+    first, second = (0, 1) if kinds[2] == "YYYY" else (2, 1)
+    if kinds[first] == "Month":
+        day, month = second, first
+    else:
+        day, month = first, second
+    names = list(kinds)
+    names[day] = "DD"
+    if kinds[month] == "DD":
+        names[month] = "MM"
+    groups = {"YYYY": r"(%s{4})" % _digits, "DD": r"(%s{1,2})" % _digits, "MM": r"(%s{1,2})" % _digits, "Month": r"(%s)" % _month_re}
+    pattern = groups[names[0]] + re.escape(separators[0]) + groups[names[1]] + re.escape(separators[1]) + groups[names[2]]
+    name = names[0] + separators[0] + names[1] + separators[1] + names[2]
+    return DateFormat(name, pattern, day + 1, month + 1, month_name=kinds[month] == "Month")
+
+
+def infer_date_format(values, sample_size=None):
+    """
+    Most common layout among the first sample_size string values
+
+    Arg:
+        values{iterable}: date strings, other values are skipped
+        sample_size{int}: values looked at, default Config.date_sample_size
+
+    return: DateFormat, None when no sampled value has a known layout
+    """
+    sample_size = sample_size or cfg.date_sample_size
+    shapes = Counter()
+    for value in values:
+        if isinstance(value, str):
+            shape = _shape(value)
+            if shape is not None:
+                shapes[shape] += 1
+            sample_size -= 1
+            if not sample_size:
+                break
+    for shape, _ in shapes.most_common():
+        date_format = _compile(*shape)
+        if date_format is not None:
+            return date_format
+    return None
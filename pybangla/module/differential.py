@@ -0,0 +1,215 @@
+"""
+Differential runs of two normalization implementations over one corpus
+
+Each side is a Normalizer operation or a "module:function" target, optionally imported from
+another pybangla checkout, and runs over the corpus on its own process pool. Every line whose
+outputs differ is reported with a word level diff, next to the throughput of both sides. A
+side's output can be saved as a golden file and later compared against:
+
+    python -m pybangla.module.differential corpus.txt --right /src/pybangla-old
+    python -m pybangla.module.differential corpus.txt --snapshot golden.jsonl
+    python -m pybangla.module.differential corpus.txt --golden golden.jsonl
+"""
+import argparse
+import difflib
+import importlib
+import json
+import sys
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+GOLDEN_VERSION = 1
+
+_engine = None
+
+
+class Side:
+    """
+    One implementation: a Normalizer method name or a "module:function" target, imported from
+    the pybangla checkout at path, or from this one when path is None
+    """
+    __slots__ = ("target", "path", "label")
+
+    def __init__(self, target="text_normalizer", path=None, label=None):
+        self.target = target
+        self.path = path
+        self.label = label or (target if path is None else "%s@%s" % (target, path))
+
+    def load(self):
+        """
+        The callable of this side, in this process
+        """
+        if self.path is not None:
+            # forget the pybangla imported so far, the next import reads the other checkout
+            for name in [name for name in sys.modules if name == "pybangla" or name.startswith("pybangla.")]:
+                del sys.modules[name]
+            sys.path.insert(0, self.path)
+        if ":" in self.target:
+            module, _, attribute = self.target.partition(":")
+            return getattr(importlib.import_module(module), attribute)
+        return getattr(importlib.import_module("pybangla").Normalizer(), self.target)
+
+
+def _render(value):
+    """
+    Outputs compare as strings, mappings like the number_convert result as sorted JSON
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, Mapping):
+        value = dict(value)
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _apply(engine, line):
+    """
+    Rendered output of one line, an exception is the output "<error: KeyError: '5'>", so a side
+    that crashes on some lines shows them as diffs instead of ending the run
+    """
+    try:
+        return _render(engine(line))
+    except Exception as error:
+        return "<error: %s: %s>" % (type(error).__name__, error)
+
+
+def _init_worker(side):
+    global _engine
+    _engine = side.load()
+
+
+def _run_batch(lines):
+    return [_apply(_engine, line) for line in lines]
+
+
+def run(side, lines, workers=None, batch_size=256):
+    """
+    Outputs of one side over the lines
+
+    Arg:
+        side{Side}       : the implementation
+        lines{list}      : corpus lines
+        workers{int}     : process pool size, default the CPU count, 1 runs in this process
+        batch_size{int}  : lines sent to a worker at a time
+
+    return: (outputs, seconds)
+    """
+    start = time.perf_counter()
+    if workers == 1 and side.path is None:
+        engine = side.load()
+        outputs = [_apply(engine, line) for line in lines]
+    else:
+        batches = [lines[i:i + batch_size] for i in range(0, len(lines), batch_size)]
+        outputs = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(side,)) as pool:
+            for batch in pool.map(_run_batch, batches):
+                outputs.extend(batch)
+    return outputs, time.perf_counter() - start
+
+
+def minimal_diff(left, right, context=2):
+    """
+    Word level diff of two outputs, changes as [-left-] {+right+} with context words around them
+
+    "এক দুই তিন", "এক চার তিন" -> "এক [-দুই-] {+চার+} তিন"
+    """
+    a, b = left.split(" "), right.split(" ")
+    parts = []
+    opcodes = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    for index, (tag, i1, i2, j1, j2) in enumerate(opcodes):
+        if tag == "equal":
+            words = a[i1:i2]
+            head = words[:context] if index else []
+            tail = words[-context:] if index < len(opcodes) - 1 else []
+            if len(words) > len(head) + len(tail):
+                words = head + ["…"] + tail
+            parts.extend(words)
+            continue
+        if i2 > i1:
+            parts.append("[-%s-]" % " ".join(a[i1:i2]))
+        if j2 > j1:
+            parts.append("{+%s+}" % " ".join(b[j1:j2]))
+    return " ".join(part for part in parts if part)
+
+
+def compare(lines, left_outputs, right_outputs):
+    """
+    [(line number, input, left output, right output, minimal diff)] of the differing lines
+    """
+    return [
+        (number, line, left, right, minimal_diff(left, right))
+        for number, (line, left, right) in enumerate(zip(lines, left_outputs, right_outputs), 1)
+        if left != right
+    ]
+
+
+def snapshot(path, side, lines, outputs):
+    """
+    Write a golden file: a header line, then {"input", "output"} per corpus line, JSON lines
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"golden": GOLDEN_VERSION, "target": side.target, "lines": len(lines)}, ensure_ascii=False) + "\n")
+        for line, output in zip(lines, outputs):
+            f.write(json.dumps({"input": line, "output": output}, ensure_ascii=False) + "\n")
+
+
+def load_golden(path, lines):
+    """
+    Outputs of a golden file, checked against the corpus it was taken from
+
+    return: (target, outputs)
+    """
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("golden") != GOLDEN_VERSION:
+            raise ValueError("unsupported golden file version %r" % (header.get("golden"),))
+        records = [json.loads(record) for record in f]
+    if [record["input"] for record in records] != lines:
+        raise ValueError("golden file %s was taken from another corpus" % path)
+    return header["target"], [record["output"] for record in records]
+
+
+def _throughput(label, lines, seconds):
+    characters = sum(map(len, lines))
+    return "%-40s %8.2f s %10.0f lines/s %8.2f MB/s" % (label, seconds, len(lines) / seconds, characters / seconds / 1e6)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Differential run of two pybangla normalization implementations")
+    parser.add_argument("corpus", help="UTF-8 text file, one input per line")
+    parser.add_argument("--target", default="text_normalizer", help="Normalizer method or module:function of the left side")
+    parser.add_argument("--left", default=None, help="pybangla checkout of the left side, default this one")
+    parser.add_argument("--right", default=None, help="pybangla checkout of the right side")
+    parser.add_argument("--right-target", default=None, help="target of the right side, default --target")
+    parser.add_argument("--golden", default=None, help="compare the left side against this golden file")
+    parser.add_argument("--snapshot", default=None, help="write the left side outputs as a golden file")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size of each side, default the CPU count")
+    parser.add_argument("--limit", type=int, default=50, help="differing lines printed, 0 prints all")
+    args = parser.parse_args(argv)
+
+    with open(args.corpus, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    left = Side(args.target, args.left)
+    left_outputs, seconds = run(left, lines, args.workers)
+    print(_throughput(left.label, lines, seconds))
+    if args.snapshot:
+        snapshot(args.snapshot, left, lines, left_outputs)
+        print("golden file written: %s (%d lines)" % (args.snapshot, len(lines)))
+        return 0
+    if args.golden:
+        target, right_outputs = load_golden(args.golden, lines)
+        print("%-40s golden file %s" % (target + "@golden", args.golden))
+    else:
+        right = Side(args.right_target or args.target, args.right)
+        right_outputs, seconds = run(right, lines, args.workers)
+        print(_throughput(right.label, lines, seconds))
+
+    diffs = compare(lines, left_outputs, right_outputs)
+    for number, line, _, _, diff in diffs[:args.limit or None]:
+        print("%d: %s\n    %s" % (number, line, diff))
+    print("%d of %d lines differ" % (len(diffs), len(lines)))
+    return 1 if diffs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Normalization of one long document across a process pool
+
+The document is cut at whitespace after a sentence end ("।", "?", "!") or at a line break,
+never inside a numeral, date, code or abbreviation, the pieces are normalized in workers and
+joined in order with the single space collapse_whitespace leaves there, so the output is the
+one of the serial text_normalizer:
+
+    nmlr = Normalizer()
+    text = nmlr.normalize_document(book, workers=8)
+"""
+import re
+
+from .config import Config as cfg
+from .errors import PybanglaError
+from .workers import executor, get_normalizer
+
+# whitespace after a sentence end, or holding a line break, between a non digit and a letter or
+# an opening quote: no stage pattern reads across it, the cue words are checked on their own
+_boundary_re = re.compile(r"(?<=[^\d\s])(?:(?<=[।?!])\s+|[^\S\n]*\n\s*)(?=[^\W\d_]|[\"'“‘(\[])")
+# a digit sequence cue right before the cut, "OTP\nনম্বর ১২৩৪" is still one code
+_cue_tail_re = re.compile(r"(?<!\w)(?i:%s)\Z" % "|".join(map(re.escape, cfg.digit_sequence_cues)))
+_cue_window = max(map(len, cfg.digit_sequence_cues)) + 1
+# rule patterns that could match across a cut
+_spanning_re = re.compile(r"\\s|\s|\^|\$|\\A|\\Z")
+
+
+def _next_cut(text, pos):
+    """
+    First safe boundary at or after pos, None when there is none
+    """
+    match = _boundary_re.search(text, pos)
+    while match and _cue_tail_re.search(text, max(0, match.start() - _cue_window), match.start()):
+        match = _boundary_re.search(text, match.end())
+    return match
+
+
+def split_document(text, chunk_size=None):
+    """
+    Cut text into pieces of about chunk_size characters at safe boundaries
+
+    Arg:
+        text{str}       : the document
+        chunk_size{int} : characters per piece, default Config.document_chunk_size
+
+    return: list of pieces, the whitespace of every cut is dropped
+    """
+    chunk_size = chunk_size or cfg.document_chunk_size
+    pieces, start = [], 0
+    while len(text) - start > chunk_size:
+        match = _next_cut(text, start + chunk_size)
+        if match is None:
+            break
+        pieces.append(text[start:match.start()])
+        start = match.end()
+    pieces.append(text[start:])
+    return pieces
+
+
+def split_sentences(source):
+    """
+    Sentences of a string or of an iterator of chunks, each one yielded as soon as the
+    letter after its boundary has arrived
+
+    Arg:
+        source{str or iterable of str}: the text, or its chunks as they come in
+
+    return: generator of sentences, the whitespace between them is dropped
+    """
+    if isinstance(source, str):
+        source = (source,)
+    buffer = ""
+    for chunk in source:
+        # a cut needs the letter after it, so only the trailing whitespace is scanned again
+        scan = len(buffer.rstrip())
+        buffer += chunk
+        start, match = 0, _next_cut(buffer, scan)
+        while match is not None:
+            yield buffer[start:match.start()]
+            start = match.end()
+            match = _next_cut(buffer, start)
+        buffer = buffer[start:]
+    if buffer.strip():
+        yield buffer
+
+
+def splittable(text_parser):
+    """
+    Whether pieces of text normalized by text_parser join to its serial output: the stages
+    start with collapse_whitespace, are all built in and no symbol or abbreviation rule
+    reads whitespace or anchors
+    """
+    stages = text_parser.stages
+    if not stages or stages[0] != text_parser.collapse_whitespace:
+        return False
+    if any(getattr(stage, "__self__", None) not in (text_parser, text_parser.npr) for stage in stages):
+        return False
+    tables = (text_parser.symbols["bn"], text_parser.abbreviations["bn"])
+    return not any(_spanning_re.search(regex.pattern) for rules in tables for regex, _ in rules)
+
+
+def _process_piece(piece):
+    """
+    processing() of one piece with the worker's normalizer, errors go back to the caller
+    """
+    return get_normalizer().tp.processing(piece)
+
+
+def normalize_document(normalizer, text, workers=None, chunk_size=None):
+    """
+    Arg:
+        normalizer{Normalizer}: its plan, lexicon pack and error policy apply
+        text{str}             : the document
+        workers{int}          : process pool size, default the CPU count
+        chunk_size{int}       : characters per piece, default Config.document_chunk_size
+
+    return: str, the text_normalizer output of the whole document
+    """
+    if workers == 1 or not splittable(normalizer.tp):
+        return normalizer.text_normalizer(text)
+    pieces = split_document(text, chunk_size)
+    if len(pieces) == 1:
+        return normalizer.text_normalizer(text)
+    with executor(max_workers=workers, plan=normalizer.plan, lexicon=normalizer.parsers.pack) as pool:
+        try:
+            return " ".join(pool.map(_process_piece, pieces))
+        except PybanglaError as error:
+            return normalizer.errors.handle(error, normalizer.sentinel)
@@ -0,0 +1,60 @@
+"""
+Typed errors for malformed input and the policy a Normalizer applies to them
+
+    nmlr = Normalizer()
+    nmlr.date_format("32/13/2023")     # None
+    nmlr.error_counts()                # {"date_format": 1}
+"""
+from collections import Counter
+
+POLICIES = ("print", "quiet", "strict")
+
+
+class PybanglaError(ValueError):
+    """
+    Base of the malformed input errors, kind names the counter it is reported under
+    """
+    kind = "error"
+
+
+class DateFormatError(PybanglaError):
+    kind = "date_format"
+
+
+class MonthNameError(DateFormatError):
+    kind = "month_name"
+
+
+class NumberWordsError(PybanglaError):
+    kind = "number_words"
+
+
+class LanguageError(PybanglaError):
+    kind = "language"
+
+
+class ErrorPolicy:
+    """
+    Counts every malformed input error by kind, then ignores it ("quiet"), prints it ("print")
+    or raises it ("strict")
+    """
+    __slots__ = ("policy", "counts")
+
+    def __init__(self, policy="quiet"):
+        if policy not in POLICIES:
+            raise ValueError("error policy must be one of %s, got %r" % (", ".join(POLICIES), policy))
+        self.policy = policy
+        self.counts = Counter()
+
+    def handle(self, error, sentinel=None):
+        """
+        Arg:
+            error{PybanglaError}: the error raised by a parser
+            sentinel            : value returned instead of a result when the error is not raised
+        """
+        self.counts[error.kind] += 1
+        if self.policy == "strict":
+            raise error
+        if self.policy == "print":
+            print(error)
+        return sentinel
@@ -0,0 +1,197 @@
+"""
+Inverse text normalization: spoken Bangla back to written form, the reverse of text_normalizer
+
+    itn = InverseNormalizer()
+    itn.convert("পাঁচশ টাকা দিলাম, বিশ পারসেন্ট ছাড়")   # "৳৫০০ দিলাম, ২০% ছাড়"
+    itn.convert("এক এপ্রিল দুই হাজার তেইশ সালে")         # "০১-০৪-২০২৩ সালে"
+
+Word2NumberMap reads the number words, the currency, symbol, month and year tables of the
+Config are read in reverse.
+"""
+import re
+
+from .number_parser import Word2NumberMap
+
+# punctuation closing a word is cut off before the number words are read and put back after,
+# the marker keeps it apart from the words: "পঁচিশ।" -> "পঁচিশ \ue000।" -> "২৫।"
+_MARK = "\ue000"
+_punctuation_re = re.compile(r"(?<=\S)([,;:।?!)\"'”’]+)(?=\s|$)")
+# symbols of Config._symbols that belong to the number before them
+NUMBER_SYMBOLS = "%°"
+
+
+class InverseNormalizer:
+    """
+    Spoken numbers, amounts, percentages, years and dates -> digits and symbols
+
+    The tokens go through the Word2NumberMap cluster conversion, with the year readings of the
+    Config year table replaced first, then a single token pass attaches currency, percent and
+    degree symbols, signs and decimal points and formats dates. Reverse tables are built on the
+    first call.
+    """
+    __slots__ = ("cfg", "word2number", "_tables")
+
+    def __init__(self, word2number=None):
+        """
+        Arg:
+            word2number{Word2NumberMap}: number word reader, its cfg gives the tables, default a new one on Config
+        """
+        self.word2number = Word2NumberMap() if word2number is None else word2number
+        self.cfg = self.word2number.cfg
+        self._tables = None
+
+    def tables(self):
+        """
+        Reverse lexicons: word -> symbol, month name -> number, year reading -> year
+        """
+        if self._tables is None:
+            cfg = self.cfg
+            suffix = {cfg._percent_word: "%"}
+            for rules in cfg._symbols.values():
+                for regex, replacement in rules:
+                    symbol = regex.pattern[-1]
+                    if symbol in NUMBER_SYMBOLS and regex.pattern.endswith(symbol):
+                        suffix[replacement.strip()] = symbol
+            suffix.update((word, symbol) for word, symbol in cfg._itn_variants.items() if symbol in NUMBER_SYMBOLS)
+            currency = {}
+            for symbol, word in cfg._currency.items():
+                currency.setdefault(word, symbol)
+            decimal = {cfg.decimal_word}.union(word for word, symbol in cfg._itn_variants.items() if symbol == ".")
+            years, first_words = {}, {}
+            for year, words in self.word2number.npr._year_table("bn").items():
+                # the Bangla digit entries hold the Bangla readings
+                if not year.isascii():
+                    words = tuple(words.split())
+                    years.setdefault(words, year.translate(cfg._bn_to_en_digits))
+                    first_words.setdefault(words[0], set()).add(len(words))
+            # "পাঁচ শত" as text_normalizer writes it -> "পাঁচশত" of Config.bn_hundreds
+            hundreds = {(word[:-2], word[-2:]): word for word in cfg.bn_hundreds if word.endswith("শত")}
+            numbers = {
+                word: str(i) for i, word in enumerate(self.word2number.npr.group_words("bn")["numbers"])
+                if word not in cfg.bn_word_map
+            }
+            number_words = set(cfg.bn_word_map).union(
+                numbers, cfg.en_number_mapping, cfg.en_doshok_map, cfg.bn_hundreds, cfg.decimale_chunks,
+                cfg.fraction_int, cfg.conjugative_number, cfg.adjust_number, cfg.target_chars,
+            )
+            self._tables = {
+                "currency": currency,
+                "suffix": suffix,
+                "decimal": decimal,
+                "signs": {word: sign for sign, word in cfg._sign_words.items() if sign.isascii()},
+                "months": {name: month for name, month in cfg._month_numbers.items() if not name.isdigit()},
+                "calendar_months": frozenset(cfg.data["bn"]["option_name"]),
+                "years": years,
+                "year_lengths": {word: sorted(lengths, reverse=True) for word, lengths in first_words.items()},
+                "hundreds": hundreds,
+                "numbers": numbers,
+                "number_words": frozenset(number_words),
+            }
+        return self._tables
+
+    def _is_number_word(self, token, tables):
+        return token.isdigit() or token in tables["number_words"]
+
+    def _year_at(self, tokens, i, tables):
+        """
+        (year, length) of the year reading starting at tokens[i], only when no number word is next
+        to it, so "এক হাজার পাঁচশ" stays for the cluster conversion
+        """
+        for length in tables["year_lengths"].get(tokens[i], ()):
+            year = tables["years"].get(tuple(tokens[i:i + length]))
+            if year and not (i + length < len(tokens) and self._is_number_word(tokens[i + length], tables)):
+                return year, length
+        return None, 0
+
+    def _read_phrases(self, tokens, tables):
+        """
+        Replace the readings text_normalizer writes and Word2NumberMap does not know: years
+        ("এক হাজার নয় শত চুরানব্বই" -> "1994"), split hundreds ("পাঁচ শত" -> "পাঁচশত") and the
+        0-99 words of NumberParser.group_words spelled otherwise than Config.bn_word_map
+        """
+        hundreds, numbers = tables["hundreds"], tables["numbers"]
+        output, i = [], 0
+        while i < len(tokens):
+            year, length = (None, 0) if output and self._is_number_word(output[-1], tables) else self._year_at(tokens, i, tables)
+            if year:
+                output.append(year)
+                i += length
+            elif tuple(tokens[i:i + 2]) in hundreds:
+                output.append(hundreds[tuple(tokens[i:i + 2])])
+                i += 2
+            else:
+                output.append(numbers.get(tokens[i], tokens[i]))
+                i += 1
+        return output
+
+    def _to_digits(self, text):
+        """
+        Word2NumberMap.convert_word2number, with the year readings replaced first
+        """
+        w2n, tables = self.word2number, self.tables()
+        text_list = w2n.replace_word_to_number(self._read_phrases(w2n.normalize(text + " "), tables))
+        results = w2n.word_clustering(text_list)
+        return w2n.converting2digits(results, text_list, w2n.sum_status(results)).split()
+
+    def _tokens(self, text):
+        """
+        [(word, punctuation after it)] of the converted text
+        """
+        tokens = []
+        for token in self._to_digits(_punctuation_re.sub(" " + _MARK + r"\1", text)):
+            if token[0] == _MARK and tokens:
+                tokens[-1][1] += token[1:]
+            else:
+                tokens.append([token.lstrip(_MARK), ""])
+        return tokens
+
+    def convert(self, text, digits="bn"):
+        """
+        Arg:
+            text{str}  : spoken form, like an ASR transcript or a text_normalizer output
+            digits{str}: "bn" writes Bangla digits, "en" English ones
+
+        return: str, written form
+        """
+        if digits not in ("bn", "en"):
+            raise ValueError("digits must be 'bn' or 'en', got %r" % (digits,))
+        digit_table = self.cfg._en_to_bn_digits if digits == "bn" else self.cfg._bn_to_en_digits
+        tables = self.tables()
+        currency, suffix, decimal, signs, months = tables["currency"], tables["suffix"], tables["decimal"], tables["signs"], tables["months"]
+        tokens = self._tokens(text)
+        output, i, n = [], 0, len(tokens)
+        while i < n:
+            word, punctuation = tokens[i]
+            sign = ""
+            if word in signs and not punctuation and i + 1 < n and tokens[i + 1][0].isdigit() \
+                    and not (i and tokens[i - 1][0].isdigit() and not tokens[i - 1][1]):
+                sign, i = signs[word], i + 1
+                word, punctuation = tokens[i]
+            if not word.isdigit():
+                output.append(word + punctuation)
+                i += 1
+                continue
+            number = word
+            if not punctuation and i + 2 < n and tokens[i + 1][0] in decimal and not tokens[i + 1][1] and tokens[i + 2][0].isdigit():
+                i += 2
+                number, punctuation = number + "." + tokens[i][0], tokens[i][1]
+            following = tokens[i + 1][0].lower() if i + 1 < n and not punctuation else None
+            if following in months and not tokens[i + 1][1] and i + 2 < n and len(tokens[i + 2][0]) == 4 \
+                    and tokens[i + 2][0].isdigit() and number.isdigit() and 1 <= int(number) <= 31:
+                year, punctuation = tokens[i + 2]
+                if following in tables["calendar_months"]:
+                    date = "%s %s %s" % (number.translate(digit_table), following, year.translate(digit_table))
+                else:
+                    date = ("%02d-%02d-%s" % (int(number), months[following], year)).translate(digit_table)
+                output.append(sign + date + punctuation)
+                i += 3
+            elif following in currency:
+                output.append(sign + currency[following] + number.translate(digit_table) + tokens[i + 1][1])
+                i += 2
+            elif following in suffix:
+                output.append(sign + number.translate(digit_table) + suffix[following] + tokens[i + 1][1])
+                i += 2
+            else:
+                output.append(sign + number.translate(digit_table) + punctuation)
+                i += 1
+        return " ".join(output)
@@ -0,0 +1,189 @@
+"""
+Versioned lexicon packs: the word tables of Config as a marshal blob, layered with user overrides
+
+    pack = LexiconPack.default().overlay({"currency": {"₿": "বিটকয়েন"}}, revision="2024-06")
+    pack.save("bn.lexicon")
+    nmlr.load_lexicon("bn.lexicon")      # in flight calls finish on the old tables
+"""
+import marshal
+import os
+
+from .canonical import canonical_entries
+from .config import Config, currency_regex, ordinal_regex
+from .number_parser import Word2NumberMap
+from .itn import InverseNormalizer
+from .parser import TextParser
+from .plan import _compile_table, _rule_table
+
+PACK_VERSION = 1
+
+# pack table -> Config attribute of the {word: value} tables
+WORD_TABLES = {
+    "bn_word_map": "bn_word_map",
+    "en_number_mapping": "en_number_mapping",
+    "en_doshok_map": "en_doshok_map",
+    "bn_hundreds": "bn_hundreds",
+    "fraction_int": "fraction_int",
+    "decimale_chunks": "decimale_chunks",
+    "conjugative_number": "conjugative_number",
+    "bangla_numeric_words": "_bangla_numeric_words",
+    "currency": "_currency",
+}
+# pack table -> Config attribute of the {language: [(pattern, flags, replacement)]} tables
+RULE_TABLES = {"symbols": "_symbols", "abbreviations": "_abbreviations"}
+TABLES = tuple(WORD_TABLES) + tuple(RULE_TABLES) + ("ordinals",)
+
+
+def _merge(entries, overrides):
+    """
+    Entries keyed by their first item, an override replaces the entry in place or is appended
+    """
+    merged = {entry[0]: entry for entry in entries}
+    merged.update((entry[0], entry) for entry in overrides)
+    return list(merged.values())
+
+
+class LexiconPack:
+    """
+    Named, revisioned set of lexicon tables, built from Config or loaded from a file
+    """
+    __slots__ = ("name", "revision", "tables", "_config")
+
+    def __init__(self, tables, name="default", revision=0):
+        """
+        Arg:
+            tables{dict}  : every table of TABLES, see default() for the layout, its words are
+                            canonicalized so spellings of one word in other code points share one entry
+            name{str}     : pack name, reported by Normalizer.lexicon_info
+            revision      : str or int revision of the pack
+        """
+        missing = [table for table in TABLES if table not in tables]
+        if missing:
+            raise ValueError("lexicon pack misses the tables %s" % ", ".join(missing))
+        self.name, self.revision, self.tables = name, revision, canonical_entries(tables)
+        self._config = None
+
+    @classmethod
+    def default(cls):
+        """
+        Pack of the built in Config tables
+        """
+        tables = {table: dict(getattr(Config, attribute)) for table, attribute in WORD_TABLES.items()}
+        tables.update({table: _rule_table(getattr(Config, attribute)) for table, attribute in RULE_TABLES.items()})
+        tables["ordinals"] = list(Config._bn_ordinals)
+        return cls(tables)
+
+    def overlay(self, overrides, name=None, revision=None):
+        """
+        New pack with the overrides layered on top of this one
+
+        Arg:
+            overrides{dict or LexiconPack}: {table: entries}, word tables as {word: value}, rule tables as
+                                            {language: [(pattern, flags, replacement)]}, ordinals as [(ordinal, word)].
+                                            An entry for the same word, pattern or ordinal replaces ours.
+
+        return: LexiconPack
+        """
+        if isinstance(overrides, LexiconPack):
+            overrides = overrides.tables
+        tables = dict(self.tables)
+        for table, entries in overrides.items():
+            if table in WORD_TABLES:
+                tables[table] = {**tables[table], **entries}
+            elif table in RULE_TABLES:
+                rules = dict(tables[table])
+                for lang, lang_rules in entries.items():
+                    rules[lang] = _merge(rules.get(lang, []), [tuple(rule) for rule in lang_rules])
+                tables[table] = rules
+            elif table == "ordinals":
+                tables[table] = _merge(tables[table], [tuple(ordinal) for ordinal in entries])
+            else:
+                raise ValueError("unknown lexicon table %r, expected one of %s" % (table, ", ".join(TABLES)))
+        return LexiconPack(tables, name or self.name, self.revision if revision is None else revision)
+
+    def dumps(self):
+        """
+        marshal blob of the pack, only built in types so it loads without unpickling code
+        """
+        return marshal.dumps({"version": PACK_VERSION, "name": self.name, "revision": self.revision, "tables": self.tables})
+
+    @classmethod
+    def loads(cls, blob):
+        data = marshal.loads(blob)
+        if data.get("version") != PACK_VERSION:
+            raise ValueError("unsupported lexicon pack version %r" % (data.get("version"),))
+        tables = data["tables"]
+        tables["ordinals"] = [tuple(ordinal) for ordinal in tables["ordinals"]]
+        for table in RULE_TABLES:
+            tables[table] = {lang: [tuple(rule) for rule in rules] for lang, rules in tables[table].items()}
+        return cls(tables, data["name"], data["revision"])
+
+    def save(self, path):
+        """
+        Write the pack next to path and rename it over, readers never see half a file
+        """
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        with open(temp, "wb") as f:
+            f.write(self.dumps())
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.loads(f.read())
+
+    def __reduce__(self):
+        # pickles as the marshal blob
+        return (self.loads, (self.dumps(),))
+
+    def config(self):
+        """
+        Config subclass serving the tables of this pack, with the lookups and regexes derived
+        from them, built once per pack; month names, the date regex and the fraction words
+        (adjust_number, function_mapping, checking_hunderds) stay the Config ones
+        """
+        if self._config is None:
+            tables = self.tables
+            attributes = {attribute: dict(tables[table]) for table, attribute in WORD_TABLES.items()}
+            attributes.update({attribute: _compile_table(tables[table]) for table, attribute in RULE_TABLES.items()})
+            ordinals = [tuple(ordinal) for ordinal in tables["ordinals"]]
+            attributes.update(
+                _bn_ordinals=ordinals,
+                _ordinal_words=dict(ordinals),
+                _ordinal_numbers={i + 1: word for i, (_, word) in enumerate(ordinals)},
+                _ordinal_matcher=ordinal_regex(dict(ordinals)),
+                _currency_re=currency_regex(attributes["_currency"]),
+                hundreds=list(attributes["bn_hundreds"]),
+                checking_sum_words=Config.checking_sum_words.union(attributes["decimale_chunks"]),
+                lexicon=(self.name, self.revision),
+            )
+            if attributes["_bangla_numeric_words"] != Config._bangla_numeric_words:
+                # other words, so the year and group word tables of Config do not apply
+                attributes.update(_year_tables={}, _group_words={})
+            self._config = type("LexiconConfig", (Config,), attributes)
+        return self._config
+
+    def parsers(self, plan=None):
+        """
+        Text and word2number parsers reading this pack
+
+        Arg:
+            plan{NormalizationPlan}: stages and rules of the text parser, the plan keeps its own
+                                     symbol, abbreviation, ordinal and currency tables
+        """
+        cfg = self.config()
+        text_parser = TextParser(cfg=cfg) if plan is None else plan.text_parser(cfg)
+        return LoadedLexicon(self, text_parser, Word2NumberMap(cfg=cfg))
+
+
+class LoadedLexicon:
+    """
+    The parsers of one pack, a Normalizer replaces the whole object at once
+    """
+    __slots__ = ("pack", "text_parser", "word2number", "inverse")
+
+    def __init__(self, pack, text_parser, word2number):
+        self.pack = pack
+        self.text_parser = text_parser
+        self.word2number = word2number
+        self.inverse = InverseNormalizer(word2number)
@@ -5,41 +5,92 @@ import datetime
 from .config import Config as cfg
 from .parser import DateParser, TextParser, NumberParser
 from .number_parser import Word2NumberMap
+from .array_parser import ArrayNumberParser
+from .bangabda import BangabdaCalendar
+from .results import DateResult, NumberResult
+from .errors import DateFormatError, ErrorPolicy, PybanglaError
+from .lexicon import LexiconPack, LoadedLexicon
+from .canonical import canonicalize
 dp, tp, npr, wnmp = DateParser(), TextParser(), NumberParser(), Word2NumberMap()
+anp, bangabda = ArrayNumberParser(), BangabdaCalendar()
 data = cfg.data
 
 class Normalizer:
-    def __init__(self):
-
+    def __init__(self, plan=None, errors=None, sentinel=None, lexicon=None):
+        """
+        Arg:
+            plan{NormalizationPlan}: custom stages and rules for text_normalizer, default the Config ones
+            errors{str}            : what a malformed input does, "quiet" count it and return the sentinel,
+                                     "print" the error too, "strict" raise it, default Config.error_policy
+            sentinel               : result of a call whose input is malformed, default None
+            lexicon{LexiconPack}   : word tables of text_normalizer and word2number, a pack or its file path
+        """
         self.bn_regex = cfg.bn_regex
-    
-    def today(self, language="bn"):
+        self.plan = plan
+        self.errors = ErrorPolicy(errors or cfg.error_policy)
+        self.sentinel = sentinel
+        if lexicon is None:
+            self.parsers = LoadedLexicon(None, tp if plan is None else plan.text_parser(), wnmp)
+        else:
+            self.load_lexicon(lexicon)
+
+    @property
+    def tp(self):
+        return self.parsers.text_parser
 
+    def load_lexicon(self, pack):
         """
-        It return today date if may Bangla and English
-        
+        Build the parsers of a lexicon pack, then swap them in with a single assignment: calls
+        already running finish on the old tables, the next ones read the new pack
+
+        Arg:
+            pack{LexiconPack or str}: a pack or the path of a saved one
+
+        return: the loaded LexiconPack
         """
-        current_date_object = datetime.date.today()
-        formatted_date = [current_date_object.day, current_date_object.month, current_date_object.year]
+        if isinstance(pack, str):
+            pack = LexiconPack.load(pack)
+        self.parsers = pack.parsers(self.plan)
+        return pack
 
-        weekday = npr.get_weekday(formatted_date, language)
-        formatted_date = list(map(str, formatted_date))
-        day   = npr._digit_converter(formatted_date[0], language)
-        month = npr.search_month(formatted_date[1], language)
-        year  =  npr._digit_converter(formatted_date[2], language)
+    def lexicon_info(self):
+        """
+        (name, revision) of the loaded pack, ("default", 0) for the Config tables
+        """
+        pack = self.parsers.pack
+        return ("default", 0) if pack is None else (pack.name, pack.revision)
 
+    def error_counts(self):
+        """
+        Malformed inputs seen by this normalizer per kind, like {"date_format": 2, "month_name": 1}
+        """
+        return dict(self.errors.counts)
 
-        txt_date = npr.number_to_words(day)
-        txt_year = npr.year_in_number(year, language=language)
+    def reset_error_counts(self):
+        self.errors.counts.clear()
+    
+    def today(self, language="bn", fields=None):
 
-        return {"date":day , "month": month[0], "month": month[0], "year": year, "txt_date": txt_date, "txt_year":txt_year, "weekday" : weekday, "ls_month": month[1], "seasons" : month[2]}
+        """
+        It return today date if may Bangla and English
+
+        Arg:
+            language{str}: specific language format, support bangla and english
+            fields{list} : only compute and return these keys, like ["weekday"]
+
+        return: DateResult, the same keys as date_format
+        """
+        current_date_object = datetime.date.today()
+        formatted_date = [current_date_object.day, current_date_object.month, current_date_object.year]
+        result = DateResult(formatted_date, language, self.tp.npr)
+        return result if fields is None else result.select(fields)
     
     def weekdays(self, language="", day=""):
         """
         Weekday return or pair of weekday
         """
         if day:
-            day = day.lower().strip()
+            day = canonicalize(day).lower().strip()
             bn_weakday, en_weakday = data["bn"]["weekdays"], data["en"]["weekdays"]
             if day in bn_weakday:
                 return {day: en_weakday[bn_weakday.index(day)]}
@@ -59,7 +110,7 @@ class Normalizer:
 
         """
         if seasons:
-            seasons = seasons.lower().strip()
+            seasons = canonicalize(seasons).lower().strip()
             bn_seasons, en_seasons = data["bn"]["seasons"], data["en"]["seasons"]
             if seasons in bn_seasons:
                 return {seasons: en_seasons[bn_seasons.index(seasons)]}
@@ -81,7 +132,7 @@ class Normalizer:
         
         """
         if month:
-            month = month.lower().strip()
+            month = canonicalize(month).lower().strip()
             bn_months, option_name, en_months = data["bn"]["months"], data["bn"]["option_name"], data["en"]["months"]
             if month in bn_months:
                 return {month: en_months[bn_months.index(month)], "bangla" : option_name[bn_months.index(month)]}
@@ -98,22 +149,16 @@ class Normalizer:
         }
         return months_map
 
-    def date_format(self, date_, language="bn"):
+    def _split_date(self, date_):
         """
-        Process the date from input and return format date
-
-        Arg:
-            data_{str or list} :  date may string or list of list like ["dd", "mm", "yyyy"]
-            language{str}      : specific language format, support bangla and english
-
-        return : 
-                Dictonary :  {"date":day, "month": month[0], "year": year, "weekday" : weekday, "ls_month": month[1], "seasons" : month[2]}       
+        [day, month, year] of a date string or list, today when nothing is found
         """
         if isinstance(date_, list):
-            if len(date_):
-                formatted_date = date_
+            if not date_:
+                raise DateFormatError("empty date list, expected [day, month, year]")
+            formatted_date = date_
         else:
-            split_date = dp.data_splitter(date_)
+            split_date = dp.data_splitter(canonicalize(date_))
             split_date = [i for i in split_date if i]
 
             if len(split_date) == 1:
@@ -124,49 +169,247 @@ class Normalizer:
         if formatted_date[0] == None and formatted_date[1] == None and formatted_date[2] == None:
             current_date_object = datetime.date.today()
             formatted_date = [current_date_object.day, current_date_object.month, current_date_object.year]
+        return formatted_date
+
+    def date_format(self, date_, language="bn", fields=None):
+        """
+        Process the date from input and return format date
+
+        Arg:
+            data_{str or list} :  date may string or list of list like ["dd", "mm", "yyyy"]
+            language{str}      : specific language format, support bangla and english
+            fields{list}       : only compute and return these keys, like ["date", "weekday"]
 
-        weekday = npr.get_weekday(formatted_date, language)
-        day   = npr._digit_converter(str(formatted_date[0]), language)
-        month = npr.search_month(str(formatted_date[1]), language)
-        year  =  npr._digit_converter(str(formatted_date[2]), language)
+        return : 
+                DateResult, a dict computing every text field on first access :  {"date":day, "month": month[0], "year": year, "txt_date": txt_date, "txt_year": txt_year, "weekday" : weekday, "ls_month": month[1], "seasons" : month[2]}
+                with fields, a dict of those keys only
+        """
+        try:
+            result = DateResult(self._split_date(date_), language, self.tp.npr)
+        except PybanglaError as error:
+            return self.errors.handle(error, self.sentinel)
+        return result if fields is None else result.select(fields)
 
-        txt_date = npr.number_to_words(day)
-        txt_year = npr.year_in_number(year, language=language)
+    def date_format_bulk(self, dates, language="bn", fields=None, sample_size=None):
+        """
+        date_format over a column sharing one format: the format is inferred from a sample and
+        compiled once, only the rows it does not read go through the date_format heuristics
 
+        Arg:
+            dates{list}      : date strings, like a DataFrame column, lists go through date_format
+            language{str}    : specific language format, support bangla and english
+            fields{list}     : only compute and return these keys, like ["weekday"]
+            sample_size{int} : rows the format is inferred from, default Config.date_sample_size
 
-        return {"date":day, "month": month[0], "year": year, "txt_date":txt_date, "txt_year": txt_year, "weekday" : weekday, "ls_month": month[1], "seasons" : month[2]}
+        return: (results, report), the date_format result of every row and
+                {"format": "DD-MM-YYYY" or None, "rows": rows, "fallback": rows read by the heuristics}
+        """
+        from .date_formats import infer_date_format
+        dates = [canonicalize(date_) if isinstance(date_, str) else date_ for date_ in dates]
+        date_format = infer_date_format(dates, sample_size)
+        parse = date_format.parse if date_format is not None else None
+        # a column repeats its dates, every distinct string is read once, its fields computed once
+        # and every row gets a result of its own
+        seen = {}
+        results, fallback = [], 0
+        for date_ in dates:
+            key = date_ if isinstance(date_, str) else None
+            hit = seen.get(key)
+            if hit is None:
+                parts = parse(date_) if parse is not None and key is not None else None
+                try:
+                    if parts is None:
+                        hit = (DateResult(self._split_date(date_), language, self.tp.npr), 1)
+                    else:
+                        hit = (DateResult(parts, language, self.tp.npr), 0)
+                except PybanglaError as error:
+                    fallback += parts is None
+                    results.append(self.errors.handle(error, self.sentinel))
+                    continue
+                if key is not None:
+                    seen[key] = hit
+            result, fell_back = hit
+            fallback += fell_back
+            results.append(result._row_copy() if fields is None else result.select(fields))
+        report = {"format": date_format.name if date_format is not None else None, "rows": len(dates), "fallback": fallback}
+        return results, report
+
+    def bangabda(self, date_=None, language="bn"):
+        """
+        Bangabda (Bengali calendar) date of a Gregorian date, revised Bangladesh rules
+
+        Arg:
+            date_{str, list or datetime.date}: any date_format input, default today
+            language{str}: digit script of date and year, "bn" or "en"
 
-    def number_convert(self, number, language="bn"):
+        return:
+                Dictonary : {"date": "১", "month": "বৈশাখ", "year": "১৪৩০", "txt_date": "এক", "txt_year": "এক হাজার চার শত ত্রিশ", "season": "গ্রীষ্ম"}
+        """
+        if date_ is None:
+            date_ = datetime.date.today()
+        elif not isinstance(date_, datetime.date):
+            try:
+                day, month, year = self._split_date(date_)
+                day, year = npr._digit_converter(str(day), "en"), npr._digit_converter(str(year), "en")
+                month = dp.month_convert_to_number(npr._digit_converter(str(month), "en"))
+                date_ = datetime.date(int(year), int(month), int(day))
+            except PybanglaError as error:
+                return self.errors.handle(error, self.sentinel)
+            except ValueError as error:
+                return self.errors.handle(DateFormatError("invalid date %r: %s" % (date_, error)), self.sentinel)
+        try:
+            year, month, day = bangabda.to_bangabda(date_)
+        except ValueError as error:
+            # outside Config.bangabda_year_range
+            return self.errors.handle(DateFormatError(str(error)), self.sentinel)
+        bn_day, bn_year = npr._digit_converter(str(day), "bn"), npr._digit_converter(str(year), "bn")
+        return {
+            "date": npr._digit_converter(str(day), language),
+            "month": data["bn"]["option_name"][month - 1],
+            "year": npr._digit_converter(str(year), language),
+            "txt_date": npr.number_to_words(bn_day),
+            "txt_year": npr.year_in_number(bn_year),
+            "season": data["bn"]["seasons"][(month - 1) // 2],
+        }
+
+    def bangabda_bulk(self, dates):
+        """
+        Bangabda dates of a whole column, requires numpy
+
+        Arg:
+            dates{array like}: numpy datetime64 values, "YYYY-MM-DD" strings or datetime.date objects
+
+        return: (years, months, days) numpy int arrays, months 1-12 index data["bn"]["option_name"]
+        """
+        return bangabda.to_bangabda_bulk(dates)
+
+    def gregorian_bulk(self, years, months, days):
+        """
+        Gregorian dates of Bangabda year, month, day columns, requires numpy
+
+        return: numpy datetime64[D] array
+        """
+        return bangabda.from_bangabda_bulk(years, months, days)
+
+    def number_convert(self, number, language="bn", fields=None):
         """
         Convert the number digits English -> Bangla  or Bangla -> English
 
         Arg:
             number{str}  :  number string
             language{str}: specific language format, support bangla and english
+            fields{list} : only compute and return these keys, like ["digit"]
 
-        return: string
-        
+        return: NumberResult, a dict computing every field on first access : {"digit": number, "digit_word": digit_word, "number_string": number_string}
+                with fields, a dict of those keys only
+        """
+        result = NumberResult(canonicalize(number) if isinstance(number, str) else number, language, self.tp.npr)
+        return result if fields is None else result.select(fields)
+
+    def number_to_words_bulk(self, numbers, language="bn"):
         """
-        number   = npr._digit_converter(number, language)
-        # print("====== ",number)
+        Verbalize a whole column of numbers at once, requires numpy
 
+        Arg:
+            numbers{numpy integer array or list of str}: non negative integers or English/Bangla digit strings
+            language{str}: "bn" for Bangla words, "en" for English words
 
-        number_string = npr.number_to_words(number)
-        digit_word = npr.digit_number_to_digit_word(number, language=language)
+        return: numpy object array with the number_string of every value
+        """
+        return anp.number_to_words(numbers, language=language)
 
-        data = {"digit": number, "digit_word":digit_word , "number_string": number_string}
-        return data
+    def format_digits_bulk(self, numbers, decimals=None, language="bn"):
+        """
+        Render a column of numbers as digit strings with lakh/crore grouping, requires numpy
+
+        Arg:
+            numbers{numpy array or list}: integers or floats
+            decimals{int}: digits after the decimal point, default 0 for integers and 2 for floats
+            language{str}: digit script, "bn" or "en"
+
+        return: numpy str array like ["১২,৩৪,৫৬৭.৮৯"]
+        """
+        return anp.format_digits(numbers, decimals=decimals, language=language)
+
+    def parse_numbers_bulk(self, values, dtype="int64"):
+        """
+        Parse a column of Bangla, English or mixed digit strings, requires numpy
+
+        Arg:
+            values{list or numpy array of str}: numbers like "১,২৩,৪৫৬" or "-১২.৫", grouping commas are tolerated
+            dtype{str}: "int64" or "float64"
+
+        return: (numbers, invalid) numpy arrays, invalid is True where a value could not be parsed
+        """
+        return anp.parse_numbers(values, dtype=dtype)
 
     def text_normalizer(self, text):
         """
         this is the text normalizer fucntion
         """
-        text = tp.processing(text)
-        return text
+        try:
+            return self.parsers.text_parser.processing(canonicalize(text))
+        except PybanglaError as error:
+            return self.errors.handle(error, self.sentinel)
     
+    def normalize_document(self, text, workers=None, chunk_size=None):
+        """
+        text_normalizer of one long document, split at sentence ends and line breaks and
+        normalized across a process pool, the output is the one of text_normalizer(text)
+
+        Arg:
+            text{str}       : the document, like a whole book
+            workers{int}    : process pool size, default the CPU count, 1 runs text_normalizer
+            chunk_size{int} : characters per piece, default Config.document_chunk_size
+        """
+        from .document import normalize_document
+        return normalize_document(self, canonicalize(text), workers, chunk_size)
+
+    def normalize_sentences(self, source):
+        """
+        Generator of normalized sentences for streaming consumers like TTS, every sentence
+        is yielded as soon as it is complete, not when the whole input is read
+
+        Arg:
+            source{str or iterable of str}: a paragraph, or its chunks as they arrive
+
+        return: generator of text_normalizer outputs, one per sentence, a malformed one gives the sentinel
+        """
+        from .document import split_sentences
+        text_parser = self.tp
+        for sentence in split_sentences(source):
+            try:
+                yield text_parser.processing(canonicalize(sentence))
+            except PybanglaError as error:
+                yield self.errors.handle(error, self.sentinel)
+
     def word2number(self, text):
-        text = wnmp.convert_word2number(text)
+        text = self.parsers.word2number.convert_word2number(canonicalize(text))
         return text
+
+    def inverse_text_normalizer(self, text, digits="bn"):
+        """
+        Spoken form back to written form, the reverse of text_normalizer
+
+        "পাঁচশ টাকা দিলাম, বিশ পারসেন্ট ছাড়" -> "৳৫০০ দিলাম, ২০% ছাড়"
+        "এক এপ্রিল দুই হাজার তেইশ" -> "০১-০৪-২০২৩"
+
+        Arg:
+            text{str}  : spoken text, like an ASR transcript
+            digits{str}: "bn" writes Bangla digits, "en" English ones
+        """
+        return self.parsers.inverse.convert(canonicalize(text), digits)
+
+    def word2number_batch(self, texts):
+        """
+        word2number over many texts, every distinct number cluster is converted once
+
+        Arg:
+            texts{list of str}: utterances, like ASR transcripts
+
+        return: list of converted texts in input order
+        """
+        return self.parsers.word2number.convert_word2number_batch([canonicalize(text) for text in texts])
     
 if __name__ == "__main__":
 
@@ -236,7 +479,7 @@ if __name__ == "__main__":
     print(month)
 
 
-    text = "রাহিম ক্লাস ওয়ান এ ১ম, ১১তম ২২ তম ৩৩ তম, ১২৩৪ শতাব্দীতে ¥২০৩০.১২৩৪ বিবিধ  বাকেরগঞ্জ উপজেলার প্রায় 40 ভাগের পেশাই চাষাবাদ 80 and 40 ২২"
+    text = "রাহিম ক্লাস ওয়ান এ ১ম, ১১তম ২২ তম ৩৩ তম, ১২৩৪ শতাব্দীতে ¥২০৩০.১২৩৪ বিবিধ  বাকেরগঞ্জ উপজেলার প্রায় 40 ভাগের পেশাই চাষাবাদ 80 and 40 ২২"
     
     text = nmlr.text_normalizer(text)
 
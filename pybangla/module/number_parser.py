@@ -1,18 +1,28 @@
 
 import re
+from functools import lru_cache
 from .parser import NumberParser, TextParser
 from .config import Config as cfg
 
-npr, tp = NumberParser(), TextParser()
+tp = TextParser()
 
 class Word2NumberMap:
+    __slots__ = ("convert_cluster", "cfg", "npr")
+
+    def __init__(self, cache_size=cfg.cluster_cache_size, cfg=cfg):
+        """
+        Arg:
+            cache_size{int}: distinct clusters kept by the convert_cluster LRU, 0 disables it
+            cfg{Config}    : Config or the Config subclass of a lexicon pack
+        """
+        self.cfg = cfg
+        self.npr = NumberParser(cfg)
+        self.convert_cluster = lru_cache(maxsize=cache_size)(self._convert_cluster)
 
-    def __init__(self):
-        pass
     def equation_of_sare_and_der(self, value:str, fraction:float)->float:
 
         """
-        Convert word if start bangla word like "সাড়ে", সারে, দেড়, দের 
+        Convert word if start bangla word like "সাড়ে", সারে, দেড়, দের 
         and return numerical value
         """
         re_value = int(value.replace(value[0], "1"))
@@ -21,7 +31,7 @@ class Word2NumberMap:
     def equation_of_arai(self, value:str, fraction:float)->float:
 
         """
-        Convert word if the start bangla word like "আড়াই" or "আরাই" 
+        Convert word if the start bangla word like "আড়াই" or "আরাই" 
         and return numerical value   
         """
         return int(value)*fraction
@@ -39,7 +49,7 @@ class Word2NumberMap:
 
         status, adjust_name = False, ""
         for v in value:
-            if v in cfg.adjust_number:
+            if v in self.cfg.adjust_number:
                 adjust_name = v
                 status, sum_status = True, False
                 break
@@ -49,8 +59,8 @@ class Word2NumberMap:
             else:
                 number = str(value[1])
 
-            fraction_value = cfg.adjust_number[adjust_name]
-            function_name = cfg.function_mapping[adjust_name]
+            fraction_value = self.cfg.adjust_number[adjust_name]
+            function_name = self.cfg.function_mapping[adjust_name]
 
             if hasattr(self, function_name) and callable(getattr(self, function_name)):
                 func = getattr(self, function_name)
@@ -64,7 +74,7 @@ class Word2NumberMap:
         """
         Checking last character match with target character
         """
-        for char in cfg.target_chars:
+        for char in self.cfg.target_chars:
             if word.endswith(char):
                 return True, char
         return False, None
@@ -75,14 +85,8 @@ class Word2NumberMap:
         Cheching the group word sum status 
         
         """
-        status_list = []
-        for sublist in lst:
-            x = ["1" if i in sublist else "0" for i in cfg.checking_hunderds+cfg.checking_adjust]
-            if "1" in x:
-                status_list.append(True)
-            else:
-                status_list.append(False)
-        return status_list
+        sum_words = self.cfg.checking_sum_words
+        return [any(word in sum_words for word in sublist) for sublist in lst]
 
     def word_clustering(self, input_list:list)->list:
 
@@ -98,15 +102,15 @@ class Word2NumberMap:
                     output.append(temp_sequence)
                 else:
                     temp_sequence.append(input_list[i])
-            elif input_list[i] in cfg.decimale_chunks or input_list[i] in cfg.fraction_int:
+            elif input_list[i] in self.cfg.decimale_chunks or input_list[i] in self.cfg.fraction_int:
                 temp_sequence.append(input_list[i])
-            elif input_list[i] in cfg.hundreds:
+            elif input_list[i] in self.cfg.bn_hundreds:
                 temp_sequence.append(input_list[i])
-            elif input_list[i] in cfg.checking_conjugative_number:
+            elif input_list[i] in self.cfg.conjugative_number:
                 temp_sequence.append(input_list[i])
-            elif input_list[i] in cfg.en_doshok_map:
+            elif input_list[i] in self.cfg.en_doshok_map:
                 temp_sequence.append(input_list[i])
-            elif  input_list[i] in cfg.adjust_number:
+            elif  input_list[i] in self.cfg.adjust_number:
                 temp_sequence.append(input_list[i])
             else:
                 if temp_sequence:
@@ -125,8 +129,8 @@ class Word2NumberMap:
         if all_numeric_status:
             return False
         for item in input_list:
-            if item in cfg.decimale_chunks or item in cfg.adjust_number \
-                or item in cfg.fraction_int or item in cfg.conjugative_number or item in cfg.en_doshok_map:
+            if item in self.cfg.decimale_chunks or item in self.cfg.adjust_number \
+                or item in self.cfg.fraction_int or item in self.cfg.conjugative_number or item in self.cfg.en_doshok_map:
                 return False
         return True
 
@@ -139,7 +143,7 @@ class Word2NumberMap:
         """
         temp, output_list, output_status = [], [], []
         for i, value in enumerate(input_list):
-            if value in cfg.bn_hundreds:
+            if value in self.cfg.bn_hundreds:
                 temp.append(value)
                 if i == len(input_list) - 1 or not input_list[i + 1].isdigit():
                     output_list.append(temp), output_status.append(False)
@@ -177,70 +181,90 @@ class Word2NumberMap:
 
         if word.isdigit():
             final_value.append(word)
-        elif word in cfg.decimale_chunks:
+        elif word in self.cfg.decimale_chunks:
             if final_value:
                 value = final_value[-1]
-                d_c = int(cfg.decimale_chunks[word])
+                d_c = int(self.cfg.decimale_chunks[word])
                 if value.isdigit():
                     final_value.append(str((d_c*int(value))-int(value)))
                 else:
                     final_value.append(d_c)
             else:
-                final_value.append(int(cfg.decimale_chunks[word]))
-        elif word in cfg.bn_hundreds:
-            final_value.append(cfg.bn_hundreds[word])
-        elif word in cfg.en_doshok_map:
-            final_value.append(cfg.en_doshok_map[word])
-        elif word in cfg.fraction_int:
-            final_value.append(cfg.fraction_int[word])
-        elif word in cfg.conjugative_number:
-            c_n = int(cfg.conjugative_number[word])-1
+                final_value.append(int(self.cfg.decimale_chunks[word]))
+        elif word in self.cfg.bn_hundreds:
+            final_value.append(self.cfg.bn_hundreds[word])
+        elif word in self.cfg.en_doshok_map:
+            final_value.append(self.cfg.en_doshok_map[word])
+        elif word in self.cfg.fraction_int:
+            final_value.append(self.cfg.fraction_int[word])
+        elif word in self.cfg.conjugative_number:
+            c_n = int(self.cfg.conjugative_number[word])-1
             if len(c_data) > index+1:
                 l_value = [str(c_data[index+1])]*c_n
             else:
-                l_value = cfg.conjugative_number[word]
+                l_value = self.cfg.conjugative_number[word]
             final_value.extend(l_value)
         else:
             final_value.append(word)
         return final_value, index
 
-    def converting2digits(self, results:list, text_list:list, sum_status_list:list)->str:
+    def _convert_cluster(self, cluster:tuple, status:bool)->tuple:
 
+        """
+        Digits of one word cluster, pure so convert_cluster can cache it
 
+        return: ((words, digits), ...) for every sub cluster, in text order
         """
-        
-        Converting word to digit and if have hunderds only then cluster again
-        
+        # checking hunderds only and return status
+        if self.checking_hundreds_only(cluster):
+            # generate number clustring
+            clustring_data, clustring_status = self.clustring_consecutive_hunderd(cluster)
+        else:
+            clustring_data, clustring_status = [cluster], [status]
+        converted = []
+        for c_data, c_status in zip(clustring_data, clustring_status):
+            index, final_value = 0, []
+            for c_d in c_data:
+                final_value, index = self.converting_condition(c_d, final_value, c_data, index)
+                index += 1
+            value, status = self.adjust_value_conversion(final_value, sum_status= c_status)
+            if status:
+                numbers = str(sum(int(num) for num in value))
+            elif isinstance(value, str):
+                numbers = value
+            else:
+                numbers = "".join(value)
+            converted.append((" ".join(c_data), numbers))
+        return tuple(converted)
+
+    def apply_clusters(self, text_list:list, converted:list)->str:
+
+        """
+        Replace every converted cluster in the joined text
         """
         original_text = " ".join(text_list)
-        for result_chunk, status in zip(results, sum_status_list):
+        for pairs in converted:
+            for replance_text, numbers in pairs:
+                word_spanning = self.find_word_index(original_text, replance_text)
+                original_text = self.replace_text_at_position(original_text, numbers, word_spanning[0], word_spanning[1])
+        return original_text
 
+    def converting2digits(self, results:list, text_list:list, sum_status_list:list)->str:
 
-            # checking hunderds only and return status
-            hundreds_status = self.checking_hundreds_only(result_chunk)
 
-            # generate number clustring
-            if hundreds_status:
-                clustring_data, clustring_status = self.clustring_consecutive_hunderd(result_chunk)
-            else:
-                clustring_data, clustring_status = [result_chunk], [status]
-            for c_data, c_status in zip(clustring_data, clustring_status):
-                replance_text = " ".join(c_data)
-                word_spanning = self.find_word_index(original_text, replance_text)
-                index, final_value = 0, []
-                for c_d in c_data:
-                    final_value, index = self.converting_condition(c_d, final_value, c_data, index)
-                    index += 1
-                value, status = self.adjust_value_conversion(final_value, sum_status= c_status)
-                if status:
-                    numbers = str(sum(int(num) for num in value))
-                elif isinstance(value, str):
-                    numbers = value
-                else:
-                    numbers = "".join(value)
+        """
+        
+        Converting word to digit and if have hunderds only then cluster again
+        
+        """
+        converted = [self.convert_cluster(tuple(chunk), status) for chunk, status in zip(results, sum_status_list)]
+        return self.apply_clusters(text_list, converted)
 
-                original_text = self.replace_text_at_position(original_text, numbers, word_spanning[0], word_spanning[1])
-        return original_text
+    def cache_info(self):
+        """
+        hits, misses, maxsize and currsize of the cluster cache
+        """
+        return self.convert_cluster.cache_info()
 
     def replace_word_to_number(self, text:list)-> list:
 
@@ -250,10 +274,10 @@ class Word2NumberMap:
         """
         index = 0
         for t in text:
-            if t in cfg.bn_word_map:
-                text[index] = cfg.bn_word_map[t]
-            elif t in cfg.en_number_mapping:
-                text[index] = cfg.en_number_mapping[t]
+            if t in self.cfg.bn_word_map:
+                text[index] = self.cfg.bn_word_map[t]
+            elif t in self.cfg.en_number_mapping:
+                text[index] = self.cfg.en_number_mapping[t]
             else:
                 pass
             index+=1
@@ -277,9 +301,9 @@ class Word2NumberMap:
         for word in texts:
             status, char = self.check_last_chars(word)
             if status:
-                if word not in cfg.bn_word_map:
-                    if word[:-2] in cfg.bn_word_map:
-                        rword = npr.number_processing(str(int(cfg.bn_word_map[word[:-2]])*100))
+                if word not in self.cfg.bn_word_map:
+                    if word[:-2] in self.cfg.bn_word_map:
+                        rword = self.npr.number_processing(str(int(self.cfg.bn_word_map[word[:-2]])*100))
                         rword = rword.replace(" শত", "শত")
                         text_list.extend(rword.split(" "))
                     else:
@@ -298,18 +322,46 @@ class Word2NumberMap:
         text = self.converting2digits(results, text_list, sum_status_list)
         return text
 
+    def convert_word2number_batch(self, texts)->list:
+        """
+        convert_word2number over many texts, repeated texts and clusters are converted once
+
+        Every distinct text is tokenized and clustered first, then every distinct
+        cluster of the batch goes through convert_cluster and the results are applied.
+
+        Arg:
+            texts{iterable of str}: utterances
+
+        return: list of converted texts in input order
+        """
+        texts = list(texts)
+        parsed = {}
+        for text in texts:
+            if text not in parsed:
+                text_list = self.replace_word_to_number(self.normalize(text+" "))
+                results = self.word_clustering(text_list)
+                keys = [(tuple(chunk), status) for chunk, status in zip(results, self.sum_status(results))]
+                parsed[text] = (text_list, keys)
+        clusters = {}
+        for _, keys in parsed.values():
+            for key in keys:
+                if key not in clusters:
+                    clusters[key] = self.convert_cluster(*key)
+        converted = {text: self.apply_clusters(text_list, [clusters[key] for key in keys]) for text, (text_list, keys) in parsed.items()}
+        return [converted[text] for text in texts]
+
 
 
 if __name__ == "__main__":
 
     texts = [
-        "আমি এক দুই তিন চার পাঁচ টু থ্রি ফাইভ ছয় সেভেন এইট নাইন শূন্য আমার ফোন নাম্বার জিরো ওয়ান ডাবল সেভেন",
-        "ওয়ান ডাবল নাইন টু",
+        "আমি এক দুই তিন চার পাঁচ টু থ্রি ফাইভ ছয় সেভেন এইট নাইন শূন্য আমার ফোন নাম্বার জিরো ওয়ান ডাবল সেভেন",
+        "ওয়ান ডাবল নাইন টু",
         "একশ বিশ টাকা",
-        "জিরো টু ডাবল ওয়ান",
-        "জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
-        "আমার ফোন নম্বর জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
-        "ট্রিপল টু ওয়ান",
+        "জিরো টু ডাবল ওয়ান",
+        "জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
+        "আমার ফোন নম্বর জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
+        "ট্রিপল টু ওয়ান",
         "দুই হাজার চারশো বিশ",
         "দুই হাজার চারশ  বিশ",
         "হাজার বিশ",
@@ -317,36 +369,36 @@ if __name__ == "__main__":
         "এক লক্ষ চার হাজার দুইশ",
         "এক লক্ষ চার হাজার দুইশ এক",
         "এক লক্ষ চার হাজার দুইশ এক টাকা এক দুই",
-        "আমাকে এক লক্ষ দুই হাজার টাকা দেয়",
-        "আমাকে এক লক্ষ দুই হাজার এক টাকা দেয় এন্ড তুমি বিশ হাজার টাকা নিও এন্ড এক লক্ষ চার হাজার দুইশ এক টাকা এক ডবল দুই",
-        "ছয় হাজার বিশ",
-        "আমার সাড়ে পাঁচ হাজার",
-        "আমার সাড়ে তিনশ",
-        "আড়াই হাজার",
-        "আড়াই লক্ষ",
+        "আমাকে এক লক্ষ দুই হাজার টাকা দেয়",
+        "আমাকে এক লক্ষ দুই হাজার এক টাকা দেয় এন্ড তুমি বিশ হাজার টাকা নিও এন্ড এক লক্ষ চার হাজার দুইশ এক টাকা এক ডবল দুই",
+        "ছয় হাজার বিশ",
+        "আমার সাড়ে পাঁচ হাজার",
+        "আমার সাড়ে তিনশ",
+        "আড়াই হাজার",
+        "আড়াই লক্ষ",
         "ডেরশ",
-        "আমাকে ডেরশ টাকা দেয়",
-        "সাড়ে পাঁচ কোটি টাকা",
-        "সাড়ে 1254 টাকা",
+        "আমাকে ডেরশ টাকা দেয়",
+        "সাড়ে পাঁচ কোটি টাকা",
+        "সাড়ে 1254 টাকা",
         "জিরো",
         "একশ বিশ take একশ",
-        "জিরো টু ডাবল ওয়ান",
-        "জিরো টু ওয়ান ওয়ান",
+        "জিরো টু ডাবল ওয়ান",
+        "জিরো টু ওয়ান ওয়ান",
         "থ্রি ফোর ফাইভ এইট",
         "একশ বিশ টাকা",
-        "ডাবল ওয়ান ডবল টু",
-        "জিরো ওয়ান টু",
+        "ডাবল ওয়ান ডবল টু",
+        "জিরো ওয়ান টু",
         "থ্রি ফোর ফাইভ সিক্স",
         "সেভেন এইট নাইন টেন",
         "একশ দুইশ তিনশ",
         "চারশ পাঁচশ",
-        "ছয়শ সাতশ",
-        "আটশ নয়শ",
+        "ছয়শ সাতশ",
+        "আটশ নয়শ",
         "দশ তিরানব্বই",
         "ট্রিপল থ্রি টু",
         "শূন্য এক দুই তিন",
-        "চার পাঁচ ছয় সাত",
-        "আট নয় দশ এগারো",
+        "চার পাঁচ ছয় সাত",
+        "আট নয় দশ এগারো",
         "বারো তেরো চৌদ্দ পনেরো",
         "ষোল সতেরো আঠারো উনিশ",
         "বিশ একুশ বাইশ তেইশ",
@@ -1,23 +1,32 @@
 import re
 import datetime
-from .config import Config as cfg
+from functools import partial
+from itertools import groupby
+from .config import Config as cfg, currency_regex, ordinal_regex
+from .errors import DateFormatError, LanguageError, MonthNameError, NumberWordsError
 from num2words import num2words
 data = cfg.data
 
-_abbreviations = cfg._abbreviations
-_symbols = cfg._symbols
 _ordinal_re = cfg._ordinal_re
 _whitespace_re = cfg._whitespace_re
-_currency = cfg._currency
+
+_en_digit_re = re.compile(cfg.en_regex)
 
 english_digits = cfg._bangla2english_digits_mapping
-bangla_numeric_words = cfg._bangla_numeric_words
 
 
 class NumberParser:
-    def __init__(self):
+    __slots__ = ("english_digits", "bangla_numeric_words", "en_regex", "bn_regex", "cfg")
+
+    def __init__(self, cfg=cfg):
+        """
+        Arg:
+            cfg{Config}: Config or the Config subclass of a lexicon pack, its year and group word
+                         tables are shared by every parser of that config
+        """
+        self.cfg = cfg
         self.english_digits = english_digits
-        self.bangla_numeric_words = bangla_numeric_words
+        self.bangla_numeric_words = cfg._bangla_numeric_words
         self.en_regex = cfg.en_regex
         self.bn_regex = cfg.bn_regex
 
@@ -27,7 +36,8 @@ class NumberParser:
 
     def number_to_words_converting_process(self, number_string:str, lang = "bn"):
         number_string = number_string.strip()
-        num = int("".join([self.english_digits[bangla_digit] if lang =="bn" else bangla_digit for bangla_digit in number_string]))
+        # int() reads Bangla digits as well
+        num = int(number_string)
         try:
             eng_in_num_to_words = num2words(num, lang='en_IN')
             if lang =="bn":
@@ -36,48 +46,150 @@ class NumberParser:
                 bangla_num_to_words_list = [word for word in eng_in_num_to_words.replace(',', ' ').replace(' and ', ' ').split()]
             return ' '.join(bangla_num_to_words_list)
         except Exception as e:
-            print(e)
-            return 
+            raise NumberWordsError("can not verbalize %r: %s" % (number_string, e)) from e
         
-    def number_to_words(self, number:str, chunk_millions = 7):
-
-        en_extraction = list(re.finditer(self.en_regex, number, re.UNICODE))
-        number = number[::-1]
-        chunks = [
-            number[i:i+chunk_millions] 
-            for i in range(0, len(number), chunk_millions)
-            ]
-        chunks = [c[::-1] for c in chunks]
-        chunks = chunks[::-1]
-        if en_extraction:
-            number = " crore ".join([self.number_to_words_converting_process(chunk, lang="en") for chunk in chunks])
-            number = number.replace("zero", "")
-        else:
-            number = " কোটি ".join([self.number_to_words_converting_process(chunk, lang="bn") for chunk in chunks])
-            # print(number)
-            number = number.replace("শূন্য", "")
+    def number_to_words(self, number:str, chunk_millions = 7, policy=None, digits_threshold=None, max_digits=None):
+        """
+        Verbalize a digit string in time linear in its length, English digits give English words
 
+        Arg:
+            number{str}           : Bangla or English digits
+            policy{str}           : "grouped" reads 7 digit chunks joined by কোটি, "digits" reads the
+                                    number digit by digit once it is longer than digits_threshold,
+                                    default Config.number_policy
+            digits_threshold{int} : default Config.digits_threshold
+            max_digits{int}       : longer numbers raise ValueError, default Config.max_number_digits
 
+        return: string, "" for zero
+        """
+        policy = policy or self.cfg.number_policy
+        if policy not in ("grouped", "digits"):
+            raise ValueError("policy must be 'grouped' or 'digits', got %r" % (policy,))
+        max_digits = self.cfg.max_number_digits if max_digits is None else max_digits
+        if max_digits is not None and len(number) > max_digits:
+            raise ValueError("number has %d digits, max_digits is %d" % (len(number), max_digits))
+        if not number:
+            return ""
+        language = "en" if _en_digit_re.search(number) else "bn"
+        if policy == "digits" and len(number) > (self.cfg.digits_threshold if digits_threshold is None else digits_threshold):
+            return self.digits_to_words(number, language)
+
+        # 7 digit chunks from the left, the first one takes the remainder
+        first = len(number) % chunk_millions or chunk_millions
+        words = [self._chunk_to_words(number[:first], language)]
+        words.extend(self._chunk_to_words(number[i:i+chunk_millions], language) for i in range(first, len(number), chunk_millions))
+        number = (" crore " if language == "en" else " কোটি ").join(words)
         return " ".join(number.split())
+
+    def _chunk_to_words(self, chunk:str, language="bn"):
+        """
+        Words of a chunk below one crore from the group_words tables, "" for zero
+        """
+        value = int(chunk)
+        if value >= 10000000:
+            # only reachable with chunk_millions > 7
+            words = self.number_to_words_converting_process(chunk, lang=language)
+            return words.replace("zero" if language == "en" else "শূন্য", "")
+        table = self.group_words(language)
+        numbers, scales = table["numbers"], table["scales"]
+        lakh, value = divmod(value, 100000)
+        thousand, value = divmod(value, 1000)
+        hundred, value = divmod(value, 100)
+        parts = []
+        if lakh:
+            parts += numbers[lakh], scales["lakh"]
+        if thousand:
+            parts += numbers[thousand], scales["thousand"]
+        if hundred:
+            parts += numbers[hundred], scales["hundred"]
+        if value:
+            parts.append(numbers[value])
+        return " ".join(parts)
+
+    def digits_to_words(self, number:str, language="bn"):
+        """
+        Digit by digit reading, "১০৫" -> "এক শূন্য পাঁচ", "105" with "en" -> "one zero five"
+        """
+        numbers = self.group_words(language)["numbers"]
+        return " ".join([numbers[int(digit)] for digit in number if not digit.isspace()])
     
+    def group_words(self, language="bn"):
+        """
+        Words for 0-99 and the hundred/thousand/lakh/crore scale words of a language,
+        the building blocks number_to_words produces for every chunk
+        
+        """
+        words = self.cfg._group_words.get(language)
+        if words is None:
+            digits = data["bn"]["digits_mapping"] if language == "bn" else data["en"]["digits_mapping"]
+            numbers = ["".join([digits.get(d, d) for d in str(i)]) for i in range(100)]
+            scales = ["hundred", "thousand", "lakh", "crore"]
+            words = {
+                "numbers": [self.number_to_words_converting_process(n, lang=language) for n in numbers],
+                "scales": dict(zip(scales, [self.bangla_numeric_words[w] for w in scales] if language == "bn" else scales)),
+            }
+            self.cfg._group_words[language] = words
+        return words
+
     def digit_number_to_digit_word(self, number, language="bn"):
 
-        number = re.sub(_whitespace_re, " ", number)
+        number = _whitespace_re.sub(" ", number)
         s_n = ""
         for i in number:
             n = data[language]["number_mapping"][i]
             s_n += " "+n
         return s_n.strip()
     
+    def decimal_to_words(self, integer:str, fraction:str=""):
+        """
+        Verbalize a decimal from its Bangla digit integer and fraction parts
+
+        "১২", "৫০" -> "বারো দশমিক পাঁচ শূন্য"
+        """
+        words = self.number_to_words(integer) or data["bn"]["number_mapping"]["০"]
+        if fraction:
+            words += " " + self.cfg.decimal_word + " " + self.digit_number_to_digit_word(fraction)
+        return words
+
     def year_in_number(self, year_in_number:str, language="bn"):
         """ Converts a Bangla year in numeric form to literal words.
 
+        Years inside ``Config.year_table_range`` are served from a lazily built
+        lookup table, everything else goes through the general algorithm.
+
         Args:
             number_string: Bangla year in numbers as string. Example: "১৯৯৪"
 
         Returns:
             Bangla year in words. Example: "উনিশশো চুরানব্বই"
 
+        """
+        words = self._year_table(language).get(year_in_number)
+        if words is None:
+            words = self._year_to_words(year_in_number, language=language)
+        return words
+
+    def _year_table(self, language="bn"):
+        """
+        Year -> words table for Bangla and English digit years, built on first use per language
+        
+        """
+        table = self.cfg._year_tables.get(language)
+        if table is None:
+            table = {}
+            start, stop = self.cfg.year_table_range
+            for year in range(start, stop):
+                en_year = str(year)
+                bn_year = "".join([self.cfg.en_to_bn_digits_mapping[d] for d in en_year])
+                table[en_year] = self._year_to_words(en_year, language=language)
+                table[bn_year] = self._year_to_words(bn_year, language=language)
+            self.cfg._year_tables[language] = table
+        return table
+
+    def _year_to_words(self, year_in_number:str, language="bn"):
+        """
+        General year verbalization, used to fill the year table and as its fallback
+        
         """
         # print("year_in_number[1]", year_in_number[1])
         # if (len(year_in_number) == 4 and year_in_number[1] != '০') or \
@@ -116,22 +228,18 @@ class NumberParser:
         convert the digit En to Bn or Bn to En
         
         """
-        # print("number  : ", number, language)
-
-        if language=="en":
-            extracted_number = list(re.finditer(self.bn_regex, str(number), re.UNICODE))
-            if extracted_number:
-                number = "".join([cfg._bangla2english_digits_mapping[i] for i in number])
-                # print("extracted : ", number)
-        c_number = ""
+        if language=="en" and re.search(self.bn_regex, str(number)):
+            number = "".join([self.cfg._bangla2english_digits_mapping[i] for i in number])
+        digits, digits_mapping = data[language]["number"], data[language]["digits_mapping"]
+        c_number = []
         for n in number:
-            if n in data[language]["number"]:
-                c_number += n
+            if n in digits:
+                c_number.append(n)
             else:
-                if n.strip() in data[language]["digits_mapping"]:
-                    b_n = data[language]["digits_mapping"][n.strip()]
-                    c_number+=b_n
-        return c_number
+                n = n.strip()
+                if n in digits_mapping:
+                    c_number.append(digits_mapping[n])
+        return "".join(c_number)
     
     def get_weekday(self, date_:list=[], language="bn"):
 
@@ -140,24 +248,15 @@ class NumberParser:
         
         """
 
-        # print("++++++++++++++++++++ : ", date_)
-
-        d, y = list(re.finditer(self.bn_regex, str(date_[0]), re.UNICODE)), list(re.finditer(self.bn_regex, str(date_[2]), re.UNICODE))
-        
-        # print("d, y : ", d, y)
-        
-        if d:
+        if re.search(self.bn_regex, str(date_[0])):
             date_[0] = self._digit_converter(date_[0], language="bn")
-        if y:
+        if re.search(self.bn_regex, str(date_[2])):
             date_[2] = self._digit_converter(date_[2], language="bn")
 
         current_date_object = datetime.datetime(int(date_[2]), int(date_[1]), int(date_[0]))
-        if language in data:
-            weekday = data[language]["weekdays"][current_date_object.weekday()]
-        else:
-            print("language not handel")
-            weekday = ""
-        return weekday
+        if language not in data:
+            raise LanguageError("language %r is not handled, expected one of %s" % (language, ", ".join(data)))
+        return data[language]["weekdays"][current_date_object.weekday()]
     
     def search_month(self, search_key, language="bn"):
         """
@@ -182,32 +281,84 @@ class NumberParser:
         return [month, option_name, seasons]
     
     def number_processing(self, text):
+        """
+        Verbalize every numeric literal in a single scan: phone numbers, OTP/PIN/account/ID codes
+        and leading zero runs digit by digit, "৩/৪" as a fraction, signed integers, decimals
+        and percentages with the decimal_to_words reading
 
-        # bn_regex, en_regex = r'[০-৯]+', r'[0-9]+'
-        bn_matches, en_matches = list(re.finditer(self.bn_regex, text, re.UNICODE)), \
-            list(re.finditer(self.en_regex, text, re.UNICODE))
-        if en_matches:
-            for m in en_matches:
-                if m[0]:
-                    bn_m= self.number_to_words(self._digit_converter(m[0]))
-                    text = text.replace(m[0], bn_m)
-        if bn_matches:
-            for m in bn_matches:
-                if m[0]:
-                    bn_m= self.number_to_words(m[0])
-                    text = text.replace(m[0], bn_m)
-        return text
+        "-১২.৫%" -> "মাইনাস বারো দশমিক পাঁচ পারসেন্ট"
+        """
+        return self.cfg._numeral_re.sub(self._numeral_replacement, text)
+
+    def _numeral_replacement(self, match):
+        amount = match.group("amount")
+        if amount:
+            # the amount is digits, "," and "." only, so a translate does the digit conversion
+            integer, _, fraction = amount.replace(",", "").translate(self.cfg._en_to_bn_digits).partition(".")
+            if fraction:
+                words = self.decimal_to_words(integer, fraction)
+            else:
+                words = self.number_to_words(integer)
+            if match.group("sign"):
+                words = self.cfg._sign_words[match.group("sign")] + " " + words
+            if match.group("percent"):
+                words += " " + self.cfg._percent_word
+            return words
+        if match.group("dotted"):
+            # "1.2.3" -> "এক.দুই.তিন", a run with a leading zero is read digit by digit
+            runs = match.group("dotted").translate(self.cfg._en_to_bn_digits).split(".")
+            return ".".join(
+                self.digit_sequence_to_words(run, grouping=False) if len(run) > 1 and run[0] == "০" else self.number_to_words(run)
+                for run in runs
+            )
+        if match.group("numerator"):
+            numerator, denominator = match.group("numerator", "denominator")
+            numerator, denominator = numerator.translate(self.cfg._en_to_bn_digits), denominator.translate(self.cfg._en_to_bn_digits)
+            return self.number_to_words(denominator) + " " + self.cfg._fraction_word + " " + self.number_to_words(numerator)
+        if match.group("sequence"):
+            return match.group("cue") + self.digit_sequence_to_words(match.group("sequence"))
+        sequence = match.group()
+        if sequence.startswith("+"):
+            return self.cfg._sign_words["+"] + " " + self.digit_sequence_to_words(sequence)
+        return self.digit_sequence_to_words(sequence)
+
+    def digit_sequence_to_words(self, sequence, grouping=True):
+        """
+        Read a phone, account or ID number digit by digit, separators are dropped
+
+        Arg:
+            sequence{str}  : digits in one script, may contain spaces, "-" or "+"
+            grouping{bool} : read repeated digits as ডাবল/ট্রিপল, "০১৭৭৭" -> "শূন্য এক ট্রিপল সাত"
+
+        return: string in the digit_number_to_digit_word style of the sequence's script
+        """
+        language = "bn" if re.search(self.bn_regex, sequence) else "en"
+        mapping = data[language]["number_mapping"]
+        digits = [d for d in sequence if d in mapping]
+        if not grouping:
+            return " ".join([mapping[d] for d in digits])
+        words = []
+        for digit, run in groupby(digits):
+            count = len(list(run))
+            while count:
+                # 4 -> 2 + 2, 5 -> 3 + 2, longer runs take triples first
+                take = 1 if count == 1 else 2 if count in (2, 4) else 3
+                words.append(mapping[digit] if take == 1 else self.cfg._repeat_words[take] + " " + mapping[digit])
+                count -= take
+        return " ".join(words)
 
 class DateParser:
+    __slots__ = ("samples", "splitter")
+
     def __init__(self):
         self.samples = cfg.samples
+        self.splitter = re.compile('|'.join(map(re.escape, self.samples)))
 
     def data_splitter(self, date_string):
         """
         
         """
-        separator_pattern = '|'.join(map(re.escape, self.samples))
-        return re.split(separator_pattern, date_string)
+        return self.splitter.split(date_string)
 
 
     def month_convert_to_number(self, month):
@@ -215,21 +366,9 @@ class DateParser:
         
         """
         key = month.lower().strip()
-        if key in data["en"]["months"]:
-            index = data["en"]["months"].index(key)+1
-        elif key in data["bn"]["months"]:
-            index = data["bn"]["months"].index(key)+1
-        elif key in  data["bn"]["option_name"]:
-            index = data["bn"]["option_name"].index(key)+1
-        elif key in data["en"]["option_name"]:
-            index = data["en"]["option_name"].index(key)+1
-        elif key in data["en"]["number"]:
-            index = data["en"]["number"].index(key)+1
-        elif key in data["bn"]["number"]:
-            index = data["bn"]["number"].index(key)+1
-        else:
-            print("else : ", key)
-            index = key
+        index = cfg._month_numbers.get(key)
+        if index is None:
+            raise MonthNameError("unknown month %r" % (key,))
         return index
 
 
@@ -243,9 +382,7 @@ class DateParser:
             else:
                 year, month, day = split_date[0][4:], split_date[0][2:4], split_date[0][:2]
             return [day, month, year]
-        else:
-            print("This date format is not handled yet")
-        return None
+        raise DateFormatError("date format %r is not handled yet" % (split_date[0],))
 
 
     def get_day_and_month(self, year_idx, idx, date_list):
@@ -256,9 +393,7 @@ class DateParser:
             return self.get_day_and_month_helper(idx, date_list, 1, 2)
         elif year_idx == 2:
             return self.get_day_and_month_helper(idx, date_list, -1, -2)
-        else:
-            print("Date format not handled yet")
-        return None, None
+        raise DateFormatError("date format %r is not handled yet, the year must come first or last" % ("-".join(date_list),))
 
 
     def get_day_and_month_helper(self, idx, date_list, offset1, offset2):
@@ -271,9 +406,7 @@ class DateParser:
             return date_list[idx + offset2], self.month_convert_to_number(date_list[idx + offset1])
         elif date_list[idx + offset1].isdigit() and not date_list[idx + offset2].isdigit():
             return date_list[idx + offset1], self.month_convert_to_number(date_list[idx + offset2])
-        else:
-            print("Date format not handled yet")
-        return None, None
+        raise DateFormatError("date format %r is not handled yet, no day found" % ("-".join(date_list),))
 
 
     def get_date_indexes(self, date_list):
@@ -291,25 +424,60 @@ class DateParser:
         return [day, month, year]
 
 class TextParser:
+    __slots__ = ("year_patterns", "year_pattern", "symbols", "abbreviations", "ordinal_words", "ordinal_numbers",
+                 "ordinal_matcher", "currency", "currency_pattern", "npr", "dp", "stages")
 
-    def __init__(self):
+    def __init__(self, symbols=None, abbreviations=None, ordinals=None, currency=None, stages=None, rules=None, cfg=cfg):
+        """
+        Rule tables default to the ones of cfg, NormalizationPlan passes its own
+
+        Arg:
+            cfg{Config}                 : Config or the Config subclass of a lexicon pack
+            symbols, abbreviations{dict}: language -> [(compiled regex, replacement)]
+            ordinals{list}              : [("১ম", "প্রথম"), ...]
+            currency{dict}              : symbol -> currency word
+            stages{list}                : [(stage name, priority)]
+            rules{list}                 : custom [(priority, compiled regex, replacement)]
+        """
         self.year_patterns  =["সালের","সালে", "শতাব্দী", "শতাব্দীর", "শতাব্দীতে"]
-        self.year_pattern = r'(?:\b|^\d+)(\d{4})\s*(?:সালে?র?|শতাব্দী(?:র)?|শতাব্দীতে)+'
-        self.currency_pattern = r'(?:\$|£|৳|€|¥|₹|₽|₺)?(?:\d+(?:,\d{3})*(?:\.\d+)?|\d+(?:\.\d+)?)'
-        self.npr = NumberParser()
+        self.year_pattern = re.compile(r'(?:\b|^\d+)(\d{4})\s*(?:সালে?র?|শতাব্দী(?:র)?|শতাব্দীতে)+')
+        self.symbols = cfg._symbols if symbols is None else symbols
+        self.abbreviations = cfg._abbreviations if abbreviations is None else abbreviations
+        if ordinals is None:
+            self.ordinal_words, self.ordinal_numbers, self.ordinal_matcher = cfg._ordinal_words, cfg._ordinal_numbers, cfg._ordinal_matcher
+        else:
+            self.ordinal_words = dict(ordinals)
+            self.ordinal_numbers = {i + 1: x[1] for i, x in enumerate(ordinals)}
+            self.ordinal_matcher = ordinal_regex(self.ordinal_words)
+        if currency is None:
+            self.currency, self.currency_pattern = cfg._currency, cfg._currency_re
+        else:
+            self.currency, self.currency_pattern = currency, currency_regex(currency)
+        self.npr = NumberParser(cfg)
+        self.dp = DateParser()
+        self.stages = self._build_stages(cfg.stages if stages is None else stages, rules or [])
+
+    def _build_stages(self, stages, rules):
+        """
+        Order the built in stages and the custom rules by priority, highest first
+        """
+        ordered = [(priority, getattr(self.npr if name == "number_processing" else self, name)) for name, priority in stages]
+        ordered += [(priority, partial(regex.sub, replacement)) for priority, regex, replacement in rules]
+        ordered.sort(key=lambda stage: -stage[0])
+        return [stage for _, stage in ordered]
 
     def collapse_whitespace(self, text):
-        return re.sub(_whitespace_re, " ", text)
+        return _whitespace_re.sub(" ", text)
     
     def expand_symbols(self, text, lang="bn"):
-        for regex, replacement in _symbols[lang]:
+        for regex, replacement in self.symbols[lang]:
             # print("regex : ", regex)
             text = re.sub(regex, replacement, text)
             text = text.replace("  ", " ")  # Ensure there are no double spaces
         return text.strip()
 
     def expand_abbreviations(self, text, lang="bn"):
-        for regex, replacement in _abbreviations[lang]:
+        for regex, replacement in self.abbreviations[lang]:
             text = re.sub(regex, replacement, text)
         return text
     
@@ -318,8 +486,8 @@ class TextParser:
         """
         Replace : 
             ("১ম", "প্রথম"),
-            ("২য়", "দ্বিতীয়"),
-            ("৩য়", "তৃতীয়"),
+            ("২য়", "দ্বিতীয়"),
+            ("৩য়", "তৃতীয়"),
             ("৪র্থ", "চতুর্থ"),
             ("৫ম","পঞ্চম"),
             ("৬ষ্ঠ", "ষষ্ঠ"),
@@ -327,74 +495,116 @@ class TextParser:
             ("৮ম", "অষ্টম"),
             ("৯ম", "নবম"),
             ("১০ম", "দশম")
-        রাহিম ক্লাস ওয়ান এ ১ম, ১১তম ২২ তম ৩৩ তম -> রাহিম ক্লাস ওয়ান এ প্রথম, এগারোতম বাইশতম তেত্রিশতম
-        
-        """
-        for regex, replacement in _ordinal_re[lang]:
-            text = re.sub(regex, replacement, text)
-        if lang=="bn":
-            matches = re.findall(r'(\d+)(?:\s*)(?:তম)', text)
-            if matches:
-                for i in matches:
-                    word = self.npr.number_to_words(i)
-                    text = text.replace(i+"তম", word+"তম")
-                    text = text.replace(i+" তম", word+"তম")
-        return text
+        রাহিম ক্লাস ওয়ান এ ১ম, ১১তম ২২ তম ৩৩ তম -> রাহিম ক্লাস ওয়ান এ প্রথম, এগারোতম বাইশতম তেত্রিশতম
 
-    def year_formation(self, text):
-        matches = re.findall(self.year_pattern, text)
-
-        # print(matches)
+        English ordinals are handled in the same pass: 2nd -> দ্বিতীয়, 21st -> একুশতম,
+        or twenty-first with lang="en".
+        
         """
-        Need to correct year format extraction
+        if lang == "en":
+            return self.ordinal_matcher.sub(self._en_ordinal_replacement, text)
+        return self.ordinal_matcher.sub(self._ordinal_replacement, text)
+
+    def _ordinal_replacement(self, match):
+        fixed = match.group("fixed")
+        if fixed:
+            return self.ordinal_words[fixed]
+        number = match.group("number")
+        if number:
+            return self.npr.number_to_words(self.npr._digit_converter(number)) + "তম"
+        number = int(match.group("en_number"))
+        if number in self.ordinal_numbers:
+            return self.ordinal_numbers[number]
+        return self.npr.number_to_words(self.npr._digit_converter(str(number))) + "তম"
+
+    def _en_ordinal_replacement(self, match):
+        if match.group("en_number"):
+            return num2words(int(match.group("en_number")), lang="en", to="ordinal")
+        return self._ordinal_replacement(match)
+
+    def expand_dates(self, text):
         """
-        for i in matches:
-            text = text.replace(i, self.npr.year_in_number(i))
-        return text
-
-    def extract_currency_amounts(self, text):
+        Verbalize dates and clock times inside the text in one scan, anything that is not a
+        valid date or time is left for the later stages
 
-        matches = re.findall(self.currency_pattern, text)
-        pattern = r'[৳$£€¥₹₽₺]'
+        "০১-এপ্রিল-২০২৩" -> "এক এপ্রিল দুই হাজার তেইশ", "১০:৩০" -> "দশটা ত্রিশ মিনিট"
+        """
+        return cfg._date_re.sub(self._date_replacement, text)
 
-        for m in matches:
-            # print("m : ", m)
-            # Use findall to extract matches
-            currency = re.findall(pattern, m)
+    def _date_replacement(self, match):
+        if match.group("hour"):
+            return self._time_to_words(match) or match.group()
+        # "12.12.2020" splits like "12/12/2020"
+        tokens = [token for token in self.dp.data_splitter(match.group("date").replace(".", "/")) if token]
+        try:
+            day, month, year = self.dp.get_date_indexes(tokens)
+        except DateFormatError:
+            return match.group()
+        month = cfg._month_numbers.get(str(month).lower(), 0)
+        if not 1 <= month <= 12:
+            return match.group()
+        # a Bangla calendar month keeps its name, Gregorian ones are read in Bangla
+        calendar_month = [token for token in tokens if token in data["bn"]["option_name"]]
+        # the day must exist in its month, "৩১-০২-২০২৩" stays as written like date_format rejects it
+        if calendar_month:
+            if not 1 <= int(day) <= cfg._bangabda_month_days[month - 1] + (month == 11):
+                return match.group()
+        else:
+            try:
+                datetime.date(int(year), month, int(day))
+            except ValueError:
+                return match.group()
+        month_word = calendar_month[0] if calendar_month else data["bn"]["months"][month - 1]
+        numbers = self.npr.group_words("bn")["numbers"]
+        return " ".join([numbers[int(day)], month_word, self.npr.year_in_number(year.translate(cfg._en_to_bn_digits))])
+
+    def _time_to_words(self, match):
+        hour, minute, second = match.group("hour", "minute", "second")
+        if int(hour) > 24 or int(minute) > 59 or (second and int(second) > 59):
+            return None
+        # every part is below 100, the group word table reads it directly
+        numbers = self.npr.group_words("bn")["numbers"]
+        words = numbers[int(hour)] + cfg._time_words["hour"]
+        for value, unit in ((minute, "minute"), (second, "second")):
+            if value and int(value):
+                words += " " + numbers[int(value)] + " " + cfg._time_words[unit]
+        return words
 
-            # print(currency)
-            if currency:
-                # print("m : ", m)
-                n_m = m.replace(currency[0], "")
-                if "." in n_m:
-                    s_m = n_m.split(".")
-                    before_dot_word, after_dot_word = self.npr.number_to_words(s_m[0]), self.npr.digit_number_to_digit_word(s_m[1])
+    def year_formation(self, text):
+        """
+        Verbalize the year in "<year> সালে/শতাব্দী" spans, only the matched year is replaced
+        """
+        return self.year_pattern.sub(self._year_replacement, text)
 
-                    word =  before_dot_word+" দশমি "+after_dot_word+ " "+_currency[currency[0]]
-                    text = text.replace(m, word)
-                    # print(s_m, before_dot_word, after_dot_word)
-                else:
-                    word = self.npr.number_to_words(n_m)
-                    n_word = word + " "+_currency[currency[0]]
+    def _year_replacement(self, match):
+        start, end = match.start(1) - match.start(), match.end(1) - match.start()
+        span = match.group()
+        return span[:start] + self.npr.year_in_number(match.group(1)) + span[end:]
 
+    def extract_currency_amounts(self, text):
+        """
+        Verbalize symbol-prefixed or symbol-suffixed amounts in a single pass
 
-                    text = text.replace(m, n_word)
-        return text
+        "৳১,০০,০০০" -> "এক লক্ষ টাকা", "$12.50" -> "বারো দশমিক পাঁচ শূন্য ডলার"
+        """
+        return self.currency_pattern.sub(self._currency_replacement, text)
+
+    def _currency_replacement(self, match):
+        amount = match.group("amount") or match.group("amount_s")
+        symbol = match.group("symbol") or match.group("symbol_s")
+        integer, _, fraction = amount.replace(",", "").partition(".")
+        word = self.npr.decimal_to_words(self.npr._digit_converter(integer), self.npr._digit_converter(fraction))
+        return word + " " + self.currency[symbol]
     
 
     def processing(self, text):
-        text = self.collapse_whitespace(text)
-        text = self.expand_symbols(text)
-        text = self.expand_abbreviations(text)
-        text = self.expand_position(text)
-        text = self.extract_currency_amounts(text)
-        text = self.year_formation(text)
-        text = self.npr.number_processing(text)
+        for stage in self.stages:
+            text = stage(text)
         return text
     
 if __name__ =="__main__":
 
-    text = "রাহিম ক্লাস ওয়ান এ ১ম, ১১তম ২২ তম ৩৩ তম, ১২৩৪ শতাব্দীতে ¥২০৩০.১২৩৪ বিবিধ  বাকেরগঞ্জ উপজেলার প্রায় 40 ভাগের পেশাই চাষাবাদ 80 and 40 ২২"
+    text = "রাহিম ক্লাস ওয়ান এ ১ম, ১১তম ২২ তম ৩৩ তম, ১২৩৪ শতাব্দীতে ¥২০৩০.১২৩৪ বিবিধ  বাকেরগঞ্জ উপজেলার প্রায় 40 ভাগের পেশাই চাষাবাদ 80 and 40 ২২"
     tp = TextParser()
     text = tp.processing(text)
     print(text)
@@ -0,0 +1,136 @@
+import marshal
+import re
+
+from .config import Config as cfg
+from .parser import TextParser
+
+PLAN_VERSION = 1
+
+
+def _rule_table(compiled_rules):
+    """
+    {language: [(compiled regex, replacement)]} -> {language: [(pattern, flags, replacement)]}
+    """
+    return {lang: [(regex.pattern, int(regex.flags), replacement) for regex, replacement in rules] for lang, rules in compiled_rules.items()}
+
+
+def _compile_table(rule_table):
+    return {lang: [(re.compile(pattern, flags), replacement) for pattern, flags, replacement in rules] for lang, rules in rule_table.items()}
+
+
+class NormalizationPlan:
+    """
+    The text_normalizer stages and rule lists as plain data, marshals to a compact blob
+
+        plan = NormalizationPlan()
+        plan.add_rule(r"কিমি", "কিলোমিটার", priority=550)
+        blob = plan.dumps()
+        nmlr = Normalizer(plan=NormalizationPlan.loads(blob))
+    """
+
+    def __init__(self, stages=None, lexicon=None):
+        """
+        Arg:
+            stages{list}          : stage names to keep, default every Config.stages entry
+            lexicon{LexiconPack}  : take the symbol, abbreviation, ordinal and currency tables from this pack
+        """
+        known = dict(cfg.stages)
+        for name in stages or []:
+            if name not in known:
+                raise ValueError("unknown stage %r, expected one of %s" % (name, ", ".join(known)))
+        self.stages = [(name, priority) for name, priority in cfg.stages if stages is None or name in stages]
+        if lexicon is None:
+            self.symbols = _rule_table(cfg._symbols)
+            self.abbreviations = _rule_table(cfg._abbreviations)
+            self.ordinals = list(cfg._bn_ordinals)
+            self.currency = dict(cfg._currency)
+        else:
+            tables = lexicon.tables
+            self.symbols = {lang: list(rules) for lang, rules in tables["symbols"].items()}
+            self.abbreviations = {lang: list(rules) for lang, rules in tables["abbreviations"].items()}
+            self.ordinals = list(tables["ordinals"])
+            self.currency = dict(tables["currency"])
+        self.rules = []
+        self._parser = None
+
+    def add_rule(self, pattern, replacement, priority=0, flags=0):
+        """
+        Add a custom regex rule, it runs between the stages around its priority (see Config.stages)
+        """
+        re.compile(pattern, flags)
+        self.rules.append((priority, pattern, int(flags), replacement))
+        self._parser = None
+        return self
+
+    def add_abbreviation(self, abbreviation, expansion, lang="bn"):
+        self.abbreviations.setdefault(lang, []).append((re.escape(abbreviation), int(re.IGNORECASE), expansion))
+        self._parser = None
+        return self
+
+    def add_symbol(self, symbol, word, lang="bn"):
+        self.symbols.setdefault(lang, []).append((re.escape(symbol), int(re.IGNORECASE), word))
+        self._parser = None
+        return self
+
+    def add_currency(self, symbol, word):
+        self.currency[symbol] = word
+        self._parser = None
+        return self
+
+    def to_dict(self):
+        return {
+            "version": PLAN_VERSION,
+            "stages": self.stages,
+            "symbols": self.symbols,
+            "abbreviations": self.abbreviations,
+            "ordinals": self.ordinals,
+            "currency": self.currency,
+            "rules": self.rules,
+        }
+
+    def dumps(self):
+        """
+        marshal blob of the plan, only built in types so it loads without unpickling code
+        """
+        return marshal.dumps(self.to_dict())
+
+    @classmethod
+    def loads(cls, blob):
+        data = marshal.loads(blob)
+        if data.get("version") != PLAN_VERSION:
+            raise ValueError("unsupported plan version %r" % (data.get("version"),))
+        plan = cls.__new__(cls)
+        plan.stages = [tuple(stage) for stage in data["stages"]]
+        plan.symbols, plan.abbreviations = data["symbols"], data["abbreviations"]
+        plan.ordinals = [tuple(ordinal) for ordinal in data["ordinals"]]
+        plan.currency, plan.rules = data["currency"], [tuple(rule) for rule in data["rules"]]
+        plan._parser = None
+        return plan
+
+    def __reduce__(self):
+        # pickles as the marshal blob
+        return (self.loads, (self.dumps(),))
+
+    def text_parser(self, cfg=None):
+        """
+        TextParser compiled from this plan, built once and reused
+
+        Arg:
+            cfg{Config}: Config subclass of a lexicon pack for the number words, builds a new parser
+        """
+        if cfg is not None:
+            return self._build(cfg)
+        if self._parser is None:
+            self._parser = self._build()
+        return self._parser
+
+    def _build(self, cfg=cfg):
+        return TextParser(
+            symbols=_compile_table(self.symbols),
+            abbreviations=_compile_table(self.abbreviations),
+            ordinals=self.ordinals,
+            currency=self.currency,
+            stages=self.stages,
+            rules=[(priority, re.compile(pattern, flags), replacement) for priority, pattern, flags, replacement in self.rules],
+            cfg=cfg,
+        )
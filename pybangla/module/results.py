@@ -0,0 +1,208 @@
+import datetime
+
+from .parser import NumberParser
+from .errors import DateFormatError
+
+npr = NumberParser()
+
+
+class LazyResult(dict):
+    """
+    dict whose fields are computed on first access and stored in it
+
+    The value of key "x" comes from the method "_x", called the first time result["x"]
+    or result.x is read. Iterating, comparing, printing or serializing the result
+    (json.dumps, dict(result)) computes the missing fields first, so it behaves as the
+    plain dict of every field, keys can be set like in any dict. The first field is computed
+    when the result is built, json's C encoder writes an empty dict as {} without asking for
+    its items.
+    """
+    __slots__ = ("_npr", "_source")
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._methods = {field: getattr(cls, "_" + field) for field in cls.FIELDS}
+
+    def __missing__(self, key):
+        method = self._methods.get(key)
+        if method is None:
+            raise KeyError(key)
+        source = getattr(self, "_source", None)
+        value = self[key] = method(self) if source is None else source[key]
+        return value
+
+    def __getattr__(self, name):
+        # fields read as attributes, result.txt_date
+        if name in self._methods:
+            return self[name]
+        raise AttributeError("%s has no attribute %r" % (type(self).__name__, name))
+
+    def _fill(self):
+        """
+        Compute the missing fields, then keep them in FIELDS order before any key set by hand
+        """
+        for key in self.FIELDS:
+            if not dict.__contains__(self, key):
+                self[key]
+        if tuple(dict.keys(self))[:len(self.FIELDS)] != self.FIELDS:
+            items = {key: dict.__getitem__(self, key) for key in self.FIELDS}
+            items.update(dict.items(self))
+            dict.clear(self)
+            dict.update(self, items)
+        return self
+
+    def _row_copy(self):
+        """
+        A result of its own for one row sharing this one: the fields it lacks are computed once
+        in this result and copied, keys set on the copy stay in the copy
+        """
+        row = type(self).__new__(type(self))
+        dict.update(row, dict.items(self))
+        row._source = self
+        return row
+
+    def __contains__(self, key):
+        return key in self._methods or dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        return dict.__iter__(self._fill())
+
+    def __len__(self):
+        return dict.__len__(self._fill())
+
+    def keys(self):
+        return dict.keys(self._fill())
+
+    def values(self):
+        return dict.values(self._fill())
+
+    def items(self):
+        return dict.items(self._fill())
+
+    def __eq__(self, other):
+        return dict.__eq__(self._fill(), other._fill() if isinstance(other, LazyResult) else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return dict.__repr__(self._fill())
+
+    def copy(self):
+        return self.to_dict()
+
+    def __reduce__(self):
+        # pickles as the plain dict of every field
+        return (dict, (self.to_dict(),))
+
+    def to_dict(self):
+        """
+        Plain dict of every field, computes the missing ones
+        """
+        return dict(self._fill())
+
+    def select(self, fields):
+        """
+        Plain dict of the requested fields only
+
+        Arg:
+            fields{str or list}: one field name or a list of them
+        """
+        if isinstance(fields, str):
+            fields = (fields,)
+        unknown = [field for field in fields if field not in self.FIELDS]
+        if unknown:
+            raise ValueError("unknown field %s, expected some of %s" % (", ".join(map(repr, unknown)), ", ".join(self.FIELDS)))
+        return {field: self[field] for field in fields}
+
+
+class DateResult(LazyResult):
+    """
+    date_format / today result
+
+    The date is validated when the result is built, like the eager version did through
+    get_weekday, the words, weekday and month names wait for their first access.
+    """
+    FIELDS = ("date", "month", "year", "txt_date", "txt_year", "weekday", "ls_month", "seasons")
+    __slots__ = ("_parts", "_language", "_day")
+
+    def __init__(self, formatted_date, language="bn", number_parser=None):
+        """
+        Arg:
+            formatted_date{list}: [day, month, year] as int, English or Bangla digit strings
+            language{str}       : specific language format, support bangla and english
+            number_parser       : NumberParser of the Normalizer, its Config gives the words, default the Config one
+        """
+        self._npr = npr if number_parser is None else number_parser
+        self._parts = [str(part) for part in formatted_date]
+        self._language = language
+        # int() reads Bangla digits too, an impossible date raises here
+        try:
+            self._day = datetime.date(int(self._parts[2]), int(self._parts[1]), int(self._parts[0]))
+        except ValueError as error:
+            raise DateFormatError("invalid date %r: %s" % ("-".join(self._parts), error)) from None
+        self["date"]
+
+    def _date(self):
+        return self._npr._digit_converter(self._parts[0], self._language)
+
+    def _year(self):
+        return self._npr._digit_converter(self._parts[2], self._language)
+
+    def _month(self):
+        # one search_month call fills the three month fields
+        month, ls_month, seasons = self._npr.search_month(self._parts[1], self._language)
+        self.update(ls_month=ls_month, seasons=seasons)
+        return month
+
+    def _ls_month(self):
+        self["month"]
+        return dict.__getitem__(self, "ls_month")
+
+    def _seasons(self):
+        self["month"]
+        return dict.__getitem__(self, "seasons")
+
+    def _txt_date(self):
+        return self._npr.number_to_words(self["date"])
+
+    def _txt_year(self):
+        return self._npr.year_in_number(self["year"], language=self._language)
+
+    def _weekday(self):
+        return self._npr.cfg.data[self._language]["weekdays"][self._day.weekday()]
+
+
+class NumberResult(LazyResult):
+    """
+    number_convert result, only the fields that are read get computed
+    """
+    FIELDS = ("digit", "digit_word", "number_string")
+    __slots__ = ("_number", "_language")
+
+    def __init__(self, number, language="bn", number_parser=None):
+        """
+        Arg:
+            number{str}  : number string
+            language{str}: specific language format, support bangla and english
+            number_parser: NumberParser of the Normalizer, its Config gives the words, default the Config one
+        """
+        self._npr = npr if number_parser is None else number_parser
+        self._number = number
+        self._language = language
+        self["digit"]
+
+    def _digit(self):
+        return self._npr._digit_converter(self._number, self._language)
+
+    def _digit_word(self):
+        return self._npr.digit_number_to_digit_word(self["digit"], language=self._language)
+
+    def _number_string(self):
+        return self._npr.number_to_words(self["digit"])
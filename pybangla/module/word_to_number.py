@@ -5,7 +5,7 @@ from .parser import NumberParser, TextParser
 np, tp = NumberParser(), TextParser()
 
 bn_word_map = {
-    'শূন্য': '0', 'এক': '1', 'দুই': '2', 'তিন': '3', 'চার': '4', 'পাঁচ': '5', 'ছয়': '6', 'সাত': '7', 'আট': '8', 'নয়': '9', 'দশ': '10', 
+    'শূন্য': '0', 'এক': '1', 'দুই': '2', 'তিন': '3', 'চার': '4', 'পাঁচ': '5', 'ছয়': '6', 'সাত': '7', 'আট': '8', 'নয়': '9', 'দশ': '10', 
     'এগারো': '11', 'বারো': '12', 'তেরো': '13', 'চৌদ্দ': '14', 'পনেরো': '15', 'ষোল': '16', 'সতেরো': '17', 'আঠারো': '18', 'উনিশ': '19', 'বিশ': '20',
     'একুশ': '21', 'বাইশ': '22', 'তেইশ': '23', 'চব্বিশ': '24', 'পঁচিশ': '25', 'ছাব্বিশ': '26', 'সাতাশ': '27', 'আঠাশ': '28', 'ঊনত্রিশ': '29', 'ত্রিশ': '30',
     'একত্রিশ': '31', 'বত্রিশ': '32', 'তেত্রিশ': '33', 'চৌত্রিশ': '34', 'পঁয়ত্রিশ': '35', 'ছত্রিশ': '36', 'সাঁইত্রিশ': '37', 'আটত্রিশ': '38', 'ঊনচল্লিশ': '39', 'চল্লিশ': '40', 
@@ -17,7 +17,7 @@ bn_word_map = {
     'একানব্বই': '91', 'বিরানব্বই': '92', 'তিরানব্বই': '93', 'চুরানব্বই': '94', 'পঁচানব্বই': '95', 'ছিয়ানব্বই': '96', 'সাতানব্বই': '97', 'আটানব্বই': '98', 'নিরানব্বই': '99'
 }
 
-bn_hundreds_1={'একশ': "100",'দুইশ': "200", 'তিনশ':"300",'চারশ': "400",'পাঁচশ':"500",'ছয়শ':"600",'সাতশ': "700",'আটশ':"800",'নয়শ':"900"}
+bn_hundreds_1={'একশ': "100",'দুইশ': "200", 'তিনশ':"300",'চারশ': "400",'পাঁচশ':"500",'ছয়শ':"600",'সাতশ': "700",'আটশ':"800",'নয়শ':"900"}
 
 bn_hundreds_2 = {i.replace(i[-1], "শত"): v for i, v in bn_hundreds_1.items()}
 bn_hundreds_3 = {i.replace(i[-1], "শো"): v for i, v in bn_hundreds_1.items()}
@@ -29,7 +29,7 @@ target_chars = ["শো", "শত", "শ"]
 hundreds = list(bn_hundreds.keys())
 
 
-checking_hunderds = ['একশ', 'দুইশ', 'তিনশ', 'চারশ', 'পাঁচশ', 'ছয়শ', 'সাতশ', 'আটশ', 'নয়শ', 'লক্ষ', 'হাজার', 'কোটি', 'লাখ', "একশত"]
+checking_hunderds = ['একশ', 'দুইশ', 'তিনশ', 'চারশ', 'পাঁচশ', 'ছয়শ', 'সাতশ', 'আটশ', 'নয়শ', 'লক্ষ', 'হাজার', 'কোটি', 'লাখ', "একশত"]
 
 # print("bn_hundreds : ", bn_hundreds)
 
@@ -37,7 +37,7 @@ checking_hunderds = ['একশ', 'দুইশ', 'তিনশ', 'চারশ'
 # print(bn_hundreds_2)
 
 # en_hunderds = {}
-# # bn_word = ['শূন্য', 'এক', 'দুই', 'তিন', 'চার', 'পাঁচ', 'ছয়', 'সাত', 'আট', 'নয়', 'দশ', 'এগারো', 'বারো', 'তেরো', 'চৌদ্দ', 'পনেরো', 'ষোল', 'সতেরো', 'আঠারো', 'উনিশ', 'বিশ', 'একুশ', 'বাইশ', 'তেইশ', 'চব্বিশ', 'পঁচিশ', 'ছাব্বিশ', 'সাতাশ', 'আঠাশ', 'ঊনত্রিশ', 'ত্রিশ', 'একত্রিশ', 'বত্রিশ', 'তেত্রিশ', 'চৌত্রিশ', 'পঁয়ত্রিশ', 'ছত্রিশ', 'সাঁইত্রিশ', 'আটত্রিশ', 'ঊনচল্লিশ', 'চল্লিশ', 'একচল্লিশ', 'বিয়াল্লিশ', 'তেতাল্লিশ', 'চুয়াল্লিশ', 'পঁয়তাল্লিশ', 'ছেচল্লিশ', 'সাতচল্লিশ', 'আটচল্লিশ', 'ঊনপঞ্চাশ', 'পঞ্চাশ', 'একান্ন', 'বাহান্ন', 'তিপ্পান্ন', 'চুয়ান্ন', 'পঞ্চান্ন', 'ছাপ্পান্ন', 'সাতান্ন', 'আটান্ন', 'ঊনষাট', 'ষাট', 'একষট্টি', 'বাষট্টি', 'তেষট্টি', 'চৌষট্টি', 'পঁয়ষট্টি', 'ছেষট্টি', 'সাতষট্টি', 'আটষট্টি', 'ঊনসত্তর', 'সত্তর', 'একাত্তর', 'বাহাত্তর', 'তিয়াত্তর', 'চুয়াত্তর', 'পঁচাত্তর', 'ছিয়াত্তর', 'সাতাত্তর', 'আটাত্তর', 'ঊনআশি', 'আশি', 'একাশি', 'বিরাশি', 'তিরাশি', 'চুরাশি', 'পঁচাশি', 'ছিয়াশি', 'সাতাশি', 'আটাশি', 'ঊননব্বই', 'নব্বই', 'একানব্বই', 'বিরানব্বই', 'তিরানব্বই', 'চুরানব্বই', 'পঁচানব্বই', 'ছিয়ানব্বই', 'সাতানব্বই', 'আটানব্বই', 'নিরানব্বই']
+# # bn_word = ['শূন্য', 'এক', 'দুই', 'তিন', 'চার', 'পাঁচ', 'ছয়', 'সাত', 'আট', 'নয়', 'দশ', 'এগারো', 'বারো', 'তেরো', 'চৌদ্দ', 'পনেরো', 'ষোল', 'সতেরো', 'আঠারো', 'উনিশ', 'বিশ', 'একুশ', 'বাইশ', 'তেইশ', 'চব্বিশ', 'পঁচিশ', 'ছাব্বিশ', 'সাতাশ', 'আঠাশ', 'ঊনত্রিশ', 'ত্রিশ', 'একত্রিশ', 'বত্রিশ', 'তেত্রিশ', 'চৌত্রিশ', 'পঁয়ত্রিশ', 'ছত্রিশ', 'সাঁইত্রিশ', 'আটত্রিশ', 'ঊনচল্লিশ', 'চল্লিশ', 'একচল্লিশ', 'বিয়াল্লিশ', 'তেতাল্লিশ', 'চুয়াল্লিশ', 'পঁয়তাল্লিশ', 'ছেচল্লিশ', 'সাতচল্লিশ', 'আটচল্লিশ', 'ঊনপঞ্চাশ', 'পঞ্চাশ', 'একান্ন', 'বাহান্ন', 'তিপ্পান্ন', 'চুয়ান্ন', 'পঞ্চান্ন', 'ছাপ্পান্ন', 'সাতান্ন', 'আটান্ন', 'ঊনষাট', 'ষাট', 'একষট্টি', 'বাষট্টি', 'তেষট্টি', 'চৌষট্টি', 'পঁয়ষট্টি', 'ছেষট্টি', 'সাতষট্টি', 'আটষট্টি', 'ঊনসত্তর', 'সত্তর', 'একাত্তর', 'বাহাত্তর', 'তিয়াত্তর', 'চুয়াত্তর', 'পঁচাত্তর', 'ছিয়াত্তর', 'সাতাত্তর', 'আটাত্তর', 'ঊনআশি', 'আশি', 'একাশি', 'বিরাশি', 'তিরাশি', 'চুরাশি', 'পঁচাশি', 'ছিয়াশি', 'সাতাশি', 'আটাশি', 'ঊননব্বই', 'নব্বই', 'একানব্বই', 'বিরানব্বই', 'তিরানব্বই', 'চুরানব্বই', 'পঁচানব্বই', 'ছিয়ানব্বই', 'সাতানব্বই', 'আটানব্বই', 'নিরানব্বই']
 # en_word = ['জিরো', 'ওয়ান', 'টু', 'থ্রি', 'ফোর', 'ফাইভ', 'সিক্স', 'সেভেন', 'এইট', 'নাইন', 'টেন', 'ইলেভেন', 'টুয়েলভ', 'থার্টিন', 'ফোরটিন', 'ফিফটিন', 'সিক্সটিন', 'সেভেনটিন', 'এইটিন', 'নাইনটিন']
 
 
@@ -48,28 +48,28 @@ checking_hunderds = ['একশ', 'দুইশ', 'তিনশ', 'চারশ'
 
 decimale_chunks = {"কোটি" : "10000000",'লক্ষ': "100000", "লাখ": "100000", 'হাজার': "1000"}
 
-adjust_number = {"সাড়ে":0.5, "সারে":0.5, "আড়াই": 2.5, "আরাই":2.5, "দেড়":0.5, "দের":0.5}
+adjust_number = {"সাড়ে":0.5, "সারে":0.5, "আড়াই": 2.5, "আরাই":2.5, "দেড়":0.5, "দের":0.5}
 
 
 conjugative_number = {"ডবল": "2", "ডাবল": "2", "ট্রিপল": "3"}
 
 
-en_number_mapping = {"জিরো": "0" ,"ওয়ান": "1", "টু": "2", "থ্রি":"3", "ফোর":"4", "ফাইভ":"5", "সিক্স":"6", "সেভেন":"7", "এইট":"8", "নাইন":"9", "টেন": "10"}
+en_number_mapping = {"জিরো": "0" ,"ওয়ান": "1", "টু": "2", "থ্রি":"3", "ফোর":"4", "ফাইভ":"5", "সিক্স":"6", "সেভেন":"7", "এইট":"8", "নাইন":"9", "টেন": "10"}
 en_doshok_map = {'ইলেভেন':"11", 'টুয়েলভ':"12", 'থার্টিন':"13", 'ফোরটিন':"14", 'ফিফটিন':"15", 'সিক্সটিন':"16", 'সেভেনটিন':"17", 'এইটিন':"18", 'নাইনটিন':"19","টুয়েন্টি": "20", "থার্টি": "30", "ফর্টি":"40", "ফিফ্টি": "50", "সিক্সটি": "60", "সেভেন্টি":"70", "এটি": "80", "নাইনটি":"90"}
 # positional_dict = {'শত':2, 'শো':2, 'হাজার':3,'লক্ষ':5,'কোটি':7, 'লাখ':5}
 
-fraction_int = {"ডেরশ": "150", "দেরশ": "150", "আরাইশ": "250", "আড়াইশ": "250"}
+fraction_int = {"ডেরশ": "150", "দেরশ": "150", "আরাইশ": "250", "আড়াইশ": "250"}
 
 
 
 
 
 function_mapping = {
-                "সাড়ে"    : "equation_of_sare_and_der", 
+                "সাড়ে"    : "equation_of_sare_and_der", 
                 "সারে"    : "equation_of_sare_and_der", 
-                "আড়াই"   : "equation_of_arai", 
+                "আড়াই"   : "equation_of_arai", 
                 "আরাই"   : "equation_of_arai", 
-                "দেড়"     : "equation_of_sare_and_der", 
+                "দেড়"     : "equation_of_sare_and_der", 
                 "দের"     : "equation_of_sare_and_der"
                 }
 
@@ -80,8 +80,6 @@ checking_conjugative_number = list(conjugative_number.keys())
 
 def equation_of_sare_and_der(value , fraction ):
     re_value = int(value.replace(value[0], "1"))
-    print(re_value*fraction)
-    print(value, type(value), re_value, (re_value*int(fraction))+int(value))
     return (re_value*fraction)+int(value)
 
 def equation_of_arai(value, fraction):
@@ -242,18 +240,12 @@ def converting2digits(results:list, text_list:list, sum_status_list:list)->str:
 
     # print("text_list : ", text_list)
     original_text = " ".join(text_list)
-    print("original_text", original_text)
     for result_chunk, status in zip(results, sum_status_list):
 
-        print("result_chunk :", result_chunk)
-
         hundreds_status = checkin_hundreds_only(result_chunk)
 
-        print("hundreds_status : ",  hundreds_status)
-
         if hundreds_status:
             clustring_data, clustring_status = split_consecutive_hunderd(result_chunk)
-            print(clustring_data, clustring_status)
         else:
             clustring_data, clustring_status = [result_chunk], [status]
 
@@ -296,27 +288,18 @@ def converting2digits(results:list, text_list:list, sum_status_list:list)->str:
                     final_value.append(r)
                 index += 1
             value, status = adjust_value_conversion(final_value, sum_status= c_status)
-
-            print("==============", value, status)
             
             if status:
                 # print("status : ", status)
                 # print(value)
                 numbers = str(sum(int(num) for num in value))
-                print(replance_text, numbers)
             elif isinstance(value, str):
                 numbers = value
-                print(numbers)
             else:
                 numbers = "".join(value)
-                print(numbers)
-
-            print("converted value : ", numbers)
 
             original_text = original_text.replace(replance_text, numbers)
 
-            print("final text : ", original_text)
-
     return original_text
 
 def word2number(text):
@@ -337,13 +320,13 @@ def word2number(text):
 if __name__ == "__main__":
 
     texts = [
-        "আমি এক দুই তিন চার পাঁচ টু থ্রি ফাইভ ছয় সেভেন এইট নাইন শূন্য আমার ফোন নাম্বার জিরো ওয়ান ডাবল সেভেন",
-        "ওয়ান ডাবল নাইন টু",
+        "আমি এক দুই তিন চার পাঁচ টু থ্রি ফাইভ ছয় সেভেন এইট নাইন শূন্য আমার ফোন নাম্বার জিরো ওয়ান ডাবল সেভেন",
+        "ওয়ান ডাবল নাইন টু",
         "একশ বিশ টাকা",
-        "জিরো টু ডাবল ওয়ান",
-        "জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
-        "আমার ফোন নম্বর জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
-        "ট্রিপল টু ওয়ান",
+        "জিরো টু ডাবল ওয়ান",
+        "জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
+        "আমার ফোন নম্বর জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
+        "ট্রিপল টু ওয়ান",
         "দুই হাজার চারশো বিশ",
         "দুই হাজার চারশ  বিশ",
         "হাজার বিশ",
@@ -351,36 +334,36 @@ if __name__ == "__main__":
         "এক লক্ষ চার হাজার দুইশ",
         "এক লক্ষ চার হাজার দুইশ এক",
         "এক লক্ষ চার হাজার দুইশ এক টাকা এক দুই",
-        "আমাকে এক লক্ষ দুই হাজার টাকা দেয়",
-        "আমাকে এক লক্ষ দুই হাজার এক টাকা দেয় এন্ড তুমি বিশ হাজার টাকা নিও এন্ড এক লক্ষ চার হাজার দুইশ এক টাকা এক ডবল দুই",
-        "ছয় হাজার বিশ",
-        "আমার সাড়ে পাঁচ হাজার",
-        "আমার সাড়ে তিনশ",
-        "আড়াই হাজার",
-        "আড়াই লক্ষ",
+        "আমাকে এক লক্ষ দুই হাজার টাকা দেয়",
+        "আমাকে এক লক্ষ দুই হাজার এক টাকা দেয় এন্ড তুমি বিশ হাজার টাকা নিও এন্ড এক লক্ষ চার হাজার দুইশ এক টাকা এক ডবল দুই",
+        "ছয় হাজার বিশ",
+        "আমার সাড়ে পাঁচ হাজার",
+        "আমার সাড়ে তিনশ",
+        "আড়াই হাজার",
+        "আড়াই লক্ষ",
         "ডেরশ",
-        "আমাকে ডেরশ টাকা দেয়",
-        "সাড়ে পাঁচ কোটি টাকা",
-        "সাড়ে 1254 টাকা",
+        "আমাকে ডেরশ টাকা দেয়",
+        "সাড়ে পাঁচ কোটি টাকা",
+        "সাড়ে 1254 টাকা",
         "জিরো",
         "একশ বিশ take একশ",
-        "জিরো টু ডাবল ওয়ান",
-        "জিরো টু ওয়ান ওয়ান",
+        "জিরো টু ডাবল ওয়ান",
+        "জিরো টু ওয়ান ওয়ান",
         "থ্রি ফোর ফাইভ এইট",
         "একশ বিশ টাকা",
-        "ডাবল ওয়ান ডবল টু",
-        "জিরো ওয়ান টু",
+        "ডাবল ওয়ান ডবল টু",
+        "জিরো ওয়ান টু",
         "থ্রি ফোর ফাইভ সিক্স",
         "সেভেন এইট নাইন টেন",
         "একশ দুইশ তিনশ",
         "চারশ পাঁচশ",
-        "ছয়শ সাতশ",
-        "আটশ নয়শ",
+        "ছয়শ সাতশ",
+        "আটশ নয়শ",
         "দশ তিরানব্বই",
         "ট্রিপল থ্রি টু",
         "শূন্য এক দুই তিন",
-        "চার পাঁচ ছয় সাত",
-        "আট নয় দশ এগারো",
+        "চার পাঁচ ছয় সাত",
+        "আট নয় দশ এগারো",
         "বারো তেরো চৌদ্দ পনেরো",
         "ষোল সতেরো আঠারো উনিশ",
         "বিশ একুশ বাইশ তেইশ",
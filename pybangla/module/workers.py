@@ -0,0 +1,116 @@
+"""
+Multi-process deployment helpers
+
+Build every table once in the parent, freeze it out of the garbage collector and
+fork, workers then share those pages instead of each growing a private copy:
+
+    from pybangla.module.workers import freeze, executor
+    freeze()                                   # gunicorn: call it in the config file / on_starting
+    with executor(max_workers=8) as pool:
+        texts = list(pool.map(normalize_text, texts, chunksize=256))
+"""
+import gc
+from concurrent.futures import ProcessPoolExecutor
+
+from .main import Normalizer, npr
+from .plan import NormalizationPlan
+from .lexicon import LexiconPack
+
+_normalizer = None
+
+# one call per operation fills the lazily built tables and the re module cache
+_warm_up = {
+    "text_normalizer": "মোঃ রহিম ১ম হন, ২১তম ৳১,০০০.৫০ খরচে ১৯৯৪ সালে ৫০% 21st",
+    "word2number": "এক লক্ষ চার হাজার দুইশ এক টাকা ডাবল সেভেন",
+}
+
+
+def preload(plan=None, languages=("bn", "en"), lexicon=None):
+    """
+    Build the Config tables, year and group word tables and a warmed up Normalizer in this process
+
+    Arg:
+        plan{NormalizationPlan}: plan of the Normalizer, default the Config stages and rules
+        lexicon{LexiconPack}   : word tables of the Normalizer, default the Config ones
+
+    return: Normalizer, also served by get_normalizer()
+    """
+    global _normalizer
+    for language in languages:
+        npr._year_table(language)
+        npr.group_words(language)
+    normalizer = Normalizer(plan=plan, lexicon=lexicon)
+    normalizer.text_normalizer(_warm_up["text_normalizer"])
+    normalizer.word2number(_warm_up["word2number"])
+    normalizer.number_convert("১২৩")
+    normalizer.date_format("০১-০৪-২০২৩")
+    _normalizer = normalizer
+    return normalizer
+
+
+def freeze(plan=None, languages=("bn", "en"), lexicon=None):
+    """
+    preload() then move every object alive now into the permanent GC generation
+
+    Frozen objects are never traversed by the collector, so forked children do not
+    dirty the shared pages writing GC headers. Call it right before forking, and build
+    the executor with the same plan and lexicon so the workers keep this normalizer.
+    """
+    normalizer = preload(plan, languages, lexicon)
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+    return normalizer
+
+
+def get_normalizer():
+    """
+    Normalizer of this process, inherited from the parent after fork or built on first use
+    """
+    if _normalizer is None:
+        preload()
+    return _normalizer
+
+
+def _blob(obj):
+    return None if obj is None else obj.dumps()
+
+
+def worker_initializer(plan_blob=None, lexicon_blob=None):
+    """
+    ProcessPoolExecutor / multiprocessing.Pool initializer
+
+    Forked workers keep the normalizer the parent froze when it has exactly this plan
+    and lexicon, otherwise they build one from the blobs.
+    """
+    if _normalizer is not None and _blob(_normalizer.plan) == plan_blob and _blob(_normalizer.parsers.pack) == lexicon_blob:
+        return
+    plan = None if plan_blob is None else NormalizationPlan.loads(plan_blob)
+    lexicon = None if lexicon_blob is None else LexiconPack.loads(lexicon_blob)
+    preload(plan, lexicon=lexicon)
+
+
+def executor(max_workers=None, plan=None, lexicon=None, **kwargs):
+    """
+    ProcessPoolExecutor whose workers run worker_initializer
+
+    Arg:
+        plan{NormalizationPlan}: plan of the worker normalizers
+        lexicon{LexiconPack}   : lexicon pack of the worker normalizers
+    """
+    initargs = (_blob(plan), _blob(lexicon))
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=worker_initializer, initargs=initargs, **kwargs)
+
+
+def normalize_text(text):
+    """
+    text_normalizer with the worker's normalizer, picklable for pool.map
+    """
+    return get_normalizer().text_normalizer(text)
+
+
+def word_to_number(text):
+    """
+    word2number with the worker's normalizer, picklable for pool.map
+    """
+    return get_normalizer().word2number(text)
@@ -29,5 +29,9 @@ setup(
         "DateTime",
         "num2words"
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "dataframe": ["numpy", "pandas", "pyarrow"],
+    },
     python_requires = ">=3.6"
 )
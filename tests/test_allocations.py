@@ -0,0 +1,62 @@
+import gc
+import sys
+import tracemalloc
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.config import Config
+from pybangla.module.parser import DateParser, NumberParser, TextParser
+from pybangla.module.number_parser import Word2NumberMap
+
+# peak bytes traced during one call, recorded on CPython 3.11 with about 25% headroom,
+# raise them only together with the change that needs the extra memory
+BUDGETS = {
+    "text_normalizer": 6500,
+    "word2number": 5000,
+}
+
+TEXTS = {
+    "text_normalizer": "মোঃ রহিম ১০ কিমি হাঁটেন, ১ম হন, ২১তম, ১৯৯৪ সালে খরচ ৳১,০০০.৫০ এবং 40 ভাগ",
+    "word2number": "আমাকে এক লক্ষ দুই হাজার এক টাকা দেয় এন্ড তুমি বিশ হাজার টাকা নিও জিরো ওয়ান ডাবল সেভেন",
+}
+
+
+def peak_per_call(func, text, calls=20):
+    func(text)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            func(text)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+class TestAllocationBudget(unittest.TestCase):
+
+    @unittest.skipUnless(sys.implementation.name == "cpython" and sys.version_info[:2] == (3, 11),
+                         "budgets are recorded on CPython 3.11, other interpreters allocate differently")
+    def test_budgets(self):
+        nmlr = Normalizer()
+        for operation, budget in BUDGETS.items():
+            with self.subTest(operation=operation):
+                peak = peak_per_call(getattr(nmlr, operation), TEXTS[operation])
+                self.assertLessEqual(peak, budget, "%s peaked at %d bytes per call, budget %d" % (operation, peak, budget))
+
+    def test_lexicon_keys_are_interned(self):
+        for table in (Config.bn_word_map, Config.en_number_mapping, Config._ordinal_words):
+            for key in table:
+                self.assertIs(key, sys.intern("".join(key)))
+
+    def test_parsers_are_slotted(self):
+        for parser in (NumberParser(), DateParser(), TextParser(), Word2NumberMap()):
+            self.assertFalse(hasattr(parser, "__dict__"), type(parser).__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
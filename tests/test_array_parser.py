@@ -0,0 +1,86 @@
+import random
+import unittest
+
+import numpy as np
+
+from pybangla.module.array_parser import ArrayNumberParser
+from pybangla.module.parser import NumberParser
+
+
+class TestArrayNumberToWords(unittest.TestCase):
+
+    def setUp(self):
+        self.anp, self.npr = ArrayNumberParser(), NumberParser()
+
+    def test_matches_scalar_conversion(self):
+        random.seed(5)
+        values = [0, 1, 100, 10 ** 7, 10 ** 14 + 10 ** 7, 2 ** 63 - 1] + [random.randint(0, 10 ** random.randint(1, 18)) for _ in range(500)]
+        bn_words = self.anp.number_to_words(np.array(values, dtype=np.int64), language="bn")
+        en_words = self.anp.number_to_words(np.array(values, dtype=np.int64), language="en")
+        for value, bn, en in zip(values, bn_words, en_words):
+            self.assertEqual(bn, self.npr.number_to_words(self.npr._digit_converter(str(value), "bn")))
+            self.assertEqual(en, self.npr.number_to_words(str(value)))
+
+    def test_digit_strings(self):
+        strings = ["১২৩", "০০০০০০০১২৩৪৫৬৭", "12345678901234567890"]
+        expected = [self.npr.number_to_words(self.npr._digit_converter(s, "bn")) for s in strings]
+        self.assertEqual(list(self.anp.number_to_words(strings)), expected)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            self.anp.number_to_words(np.array([-5]))
+        with self.assertRaises(ValueError):
+            self.anp.number_to_words(["১২ক"])
+        with self.assertRaisesRegex(ValueError, "int64"):
+            self.anp.number_to_words(np.array([2 ** 63 + 5], dtype=np.uint64))
+        self.assertEqual(self.anp.number_to_words(np.array([2 ** 63 - 1], dtype=np.uint64)).tolist(),
+                         self.anp.number_to_words(np.array([2 ** 63 - 1], dtype=np.int64)).tolist())
+
+
+class TestArrayFormatDigits(unittest.TestCase):
+
+    def setUp(self):
+        self.anp = ArrayNumberParser()
+
+    def test_lakh_crore_grouping(self):
+        formatted = self.anp.format_digits(np.array([0, 999, 1000, 100000, 12345678, -1234567]))
+        self.assertEqual(formatted.tolist(), ["০", "৯৯৯", "১,০০০", "১,০০,০০০", "১,২৩,৪৫,৬৭৮", "-১২,৩৪,৫৬৭"])
+
+    def test_decimals_and_script(self):
+        formatted = self.anp.format_digits(np.array([1234567.891, -0.001, np.nan]), language="en")
+        self.assertEqual(formatted.tolist(), ["12,34,567.89", "0.00", ""])
+        self.assertEqual(self.anp.format_digits([5], decimals=1).tolist(), ["৫.০"])
+
+    def test_uint64(self):
+        self.assertEqual(self.anp.format_digits(np.array([12345678], dtype=np.uint64)).tolist(), ["১,২৩,৪৫,৬৭৮"])
+        with self.assertRaisesRegex(ValueError, "int64"):
+            self.anp.format_digits(np.array([2 ** 63 + 5], dtype=np.uint64))
+
+
+
+class TestArrayParseNumbers(unittest.TestCase):
+
+    def setUp(self):
+        self.anp = ArrayNumberParser()
+
+    def test_int64(self):
+        numbers, invalid = self.anp.parse_numbers(["১,২৩,৪৫৬", "12,345", " -৪২ ", "১2৩", "12.5", "1,,2", "12,", "abc", ""])
+        self.assertEqual(numbers[:4].tolist(), [123456, 12345, -42, 123])
+        self.assertEqual(invalid.tolist(), [False] * 4 + [True] * 5)
+
+    def test_grouping_boundaries(self):
+        good = ["1,234", "12,345", "1,234,567", "১২,৩৪,৫৬৭", "১,২৩,৪৫,৬৭৮", "-1,000.50"]
+        bad = ["1,2", "1,2345", "1234,567", "12,34", "1,23,4567", "12,345,67", "1,234,56", "123,45,678"]
+        numbers, invalid = self.anp.parse_numbers(good + bad, dtype="float64")
+        self.assertEqual(numbers[:len(good)].tolist(), [1234, 12345, 1234567, 1234567, 12345678, -1000.5])
+        self.assertEqual(invalid.tolist(), [False] * len(good) + [True] * len(bad))
+
+    def test_float64(self):
+        values = ["৩.১৪", "-1,000.50", "3.14159265358979323846", "1.2.3"]
+        numbers, invalid = self.anp.parse_numbers(values, dtype="float64", block_size=2)
+        self.assertEqual(numbers[:3].tolist(), [3.14, -1000.5, 3.141592653589793])
+        self.assertEqual(invalid.tolist(), [False, False, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
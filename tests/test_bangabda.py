@@ -0,0 +1,53 @@
+import datetime
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.bangabda import BangabdaCalendar
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBangabdaCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = BangabdaCalendar()
+
+    def test_fixed_days(self):
+        cases = {
+            datetime.date(2023, 4, 14): (1430, 1, 1),
+            datetime.date(2024, 2, 21): (1430, 11, 8),
+            datetime.date(2024, 3, 14): (1430, 11, 30),
+            datetime.date(2023, 3, 14): (1429, 11, 29),
+            datetime.date(1971, 12, 16): (1378, 9, 1),
+            datetime.date(2024, 4, 13): (1430, 12, 30),
+        }
+        for date, expected in cases.items():
+            self.assertEqual(self.calendar.to_bangabda(date), expected)
+            self.assertEqual(self.calendar.from_bangabda(*expected), date)
+
+    def test_year_lengths(self):
+        self.assertEqual(self.calendar.year_days(1430), 366)
+        self.assertEqual(self.calendar.year_days(1429), 365)
+        with self.assertRaises(ValueError):
+            self.calendar.from_bangabda(1429, 11, 30)
+        with self.assertRaises(ValueError):
+            self.calendar.to_bangabda(datetime.date(1800, 1, 1))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_bulk_matches_scalar(self):
+        dates = np.arange(np.datetime64("2019-01-01"), np.datetime64("2026-01-01"))
+        years, months, days = self.calendar.to_bangabda_bulk(dates)
+        expected = [self.calendar.to_bangabda(date) for date in dates.astype(object)]
+        self.assertEqual(list(zip(years.tolist(), months.tolist(), days.tolist())), expected)
+        self.assertTrue((self.calendar.from_bangabda_bulk(years, months, days) == dates).all())
+
+    def test_normalizer(self):
+        result = Normalizer().bangabda("21 February, 2024")
+        self.assertEqual((result["date"], result["month"], result["year"], result["season"]), ("৮", "ফাল্গুন", "১৪৩০", "বসন্ত"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unicodedata
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.canonical import canonicalize
+from pybangla.module.config import Config
+from pybangla.module.lexicon import LexiconPack, WORD_TABLES
+
+# the same words in other code points: precomposed nukta letters, zero width joiners, emoji
+PRECOMPOSED = {"\u09a1\u09bc": "\u09dc", "\u09a2\u09bc": "\u09dd", "\u09af\u09bc": "\u09df"}
+
+
+def precomposed(text):
+    for parts, letter in PRECOMPOSED.items():
+        text = text.replace(parts, letter)
+    return text
+
+
+class TestCanonical(unittest.TestCase):
+
+    def setUp(self):
+        self.nmlr = Normalizer()
+
+    def test_nfc_and_cleanup(self):
+        # precomposed nukta letters, split vowel signs, zero width, bidi and control characters, emoji
+        text = "ছা\u09dc আষা\u09dd \u09a6\u09c7\u09d7 \u0995\u09c7\u09be\u200c\u200d৫০%\u200b \U0001f600\U0001f44d\U0001f3fd \x00ok\ufeff\u202e\tবাংলা"
+        expected = unicodedata.normalize("NFC", text)
+        for character in "\u200c\u200d\u200b\U0001f600\U0001f44d\U0001f3fd\x00\ufeff\u202e":
+            expected = expected.replace(character, "")
+        self.assertEqual(canonicalize(text), expected)
+        self.assertEqual(canonicalize(text), "ছাড় আষাঢ় দৌ কো৫০%  ok\tবাংলা")
+
+    def test_joiners_in_words_and_symbols_are_kept(self):
+        self.assertEqual(canonicalize("র\u200d\u09cdযাব"), "র\u200d\u09cdযাব")
+        self.assertEqual(canonicalize("ক\u09cd\u200cষ"), "ক\u09cd\u200cষ")
+        self.assertEqual(canonicalize("হাজার\u200c টাকা \u200dক"), "হাজার টাকা ক")
+        self.assertEqual(self.nmlr.text_normalizer("র\u200d\u09cdযাব ১০টি"), "র\u200d\u09cdযাব দশটি")
+        self.assertEqual(self.nmlr.text_normalizer("✓ ১০ ★ → \u2705"), "✓ দশ ★ →")
+
+    def test_canonical_text_is_kept(self):
+        text = "আমার সাড়ে পাঁচ হাজার টাকা\nদরকার"
+        self.assertIs(canonicalize(text), text)
+
+    def test_config_tables_are_canonical(self):
+        for attribute in WORD_TABLES.values():
+            for word, value in getattr(Config, attribute).items():
+                self.assertEqual(canonicalize(word), word)
+                self.assertEqual(canonicalize(str(value)), str(value))
+        for words in Config.data["bn"].values():
+            if isinstance(words, list):
+                self.assertEqual([canonicalize(word) for word in words], words)
+
+    def test_operations_read_variants(self):
+        spoken = "আমার সাড়ে পাঁচ হাজার টাকা নয় জন"
+        variant = precomposed(spoken).replace(" ", " ‌", 2) + " 😀"
+        self.assertEqual(self.nmlr.word2number(variant), self.nmlr.word2number(spoken))
+        self.assertEqual(self.nmlr.word2number_batch([variant]), [self.nmlr.word2number(spoken)])
+        self.assertEqual(self.nmlr.text_normalizer(precomposed("২য়টি ৳৫০") + "\u200d"), self.nmlr.text_normalizer("২য়টি ৳৫০"))
+        self.assertEqual(self.nmlr.months(month=precomposed("আষাঢ়")), self.nmlr.months(month="আষাঢ়"))
+
+    def test_lexicon_variants_share_one_key(self):
+        pack = LexiconPack.default().overlay({"currency": {"₿": precomposed("বিটকয়েন")}, "bn_word_map": {precomposed("নয়"): "9"}})
+        self.assertEqual(len(pack.tables["bn_word_map"]), len(Config.bn_word_map))
+        self.assertEqual(pack.tables["currency"]["₿"], "বিটকয়েন")
+        self.assertEqual(Normalizer(lexicon=pack).text_normalizer("₿৫"), "পাঁচ বিটকয়েন")
+
+
+if __name__ == "__main__":
+    unittest.main()
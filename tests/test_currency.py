@@ -0,0 +1,27 @@
+import unittest
+
+from pybangla.module.parser import NumberParser, TextParser
+
+
+class TestCurrencyAmounts(unittest.TestCase):
+
+    def setUp(self):
+        self.tp, self.npr = TextParser(), NumberParser()
+
+    def test_grouped_amounts_are_stripped(self):
+        lakh = self.tp.extract_currency_amounts("৳১,০০,০০০")
+        western = self.tp.extract_currency_amounts("৳100,000")
+        self.assertEqual(lakh, self.npr.number_to_words("১০০০০০") + " টাকা")
+        self.assertEqual(lakh, western)
+
+    def test_decimal_and_suffix_symbol(self):
+        text = self.tp.extract_currency_amounts("দাম 12.50$")
+        self.assertEqual(text, "দাম " + self.npr.decimal_to_words("১২", "৫০") + " ডলার")
+
+    def test_plain_numbers_are_untouched(self):
+        text = "মোট ১২৩ জন, 2,500 কেজি"
+        self.assertEqual(self.tp.extract_currency_amounts(text), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
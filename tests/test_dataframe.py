@@ -0,0 +1,39 @@
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from pybangla.module.dataframe import normalize_arrow, normalize_unique
+from pybangla.module.main import Normalizer
+
+
+class TestColumnNormalization(unittest.TestCase):
+
+    def setUp(self):
+        self.nmlr = Normalizer()
+        self.values = ["১ম হয়েছে", None, "৳১,০০০", "১ম হয়েছে"]
+
+    def test_pandas_accessor(self):
+        result = pd.Series(self.values).bangla.text_normalizer()
+        self.assertEqual(result[0], self.nmlr.text_normalizer(self.values[0]))
+        self.assertEqual(result[2], self.nmlr.text_normalizer(self.values[2]))
+        self.assertEqual(result[0], result[3])
+        self.assertTrue(pd.isna(result[1]))
+
+    def test_number_convert_field(self):
+        result = pd.Series(["১২", "১২"]).bangla.number_convert(field="digit_word")
+        self.assertEqual(result.tolist(), [self.nmlr.number_convert("১২")["digit_word"]] * 2)
+
+    def test_arrow_chunked(self):
+        array = pa.chunked_array([self.values[:2], self.values[2:]])
+        result = normalize_arrow(array, operation="word2number")
+        expected = [None if v is None else self.nmlr.word2number(v) for v in self.values]
+        self.assertEqual(result.to_pylist(), expected)
+
+    def test_parallel_matches_serial(self):
+        values = [str(i) for i in range(50)]
+        self.assertEqual(normalize_unique(values, workers=2, chunk_size=10), normalize_unique(values))
+
+
+if __name__ == "__main__":
+    unittest.main()
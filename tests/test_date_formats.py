@@ -0,0 +1,54 @@
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.date_formats import infer_date_format
+
+
+class TestDateFormatInference(unittest.TestCase):
+
+    def setUp(self):
+        self.nmlr = Normalizer(errors="quiet")
+
+    def test_inferred_formats(self):
+        cases = {
+            "DD-MM-YYYY": ["01-04-2023", "১৫-০৮-২০২৪"],
+            "YYYY/MM/DD": ["2023/04/01"],
+            "DD-Month-YYYY": ["01-Apr-2023", "15-aug-2024"],
+            "Month DD, YYYY": ["April 1, 2023"],
+            "DD Month YYYY": ["১৫ বৈশাখ ১৪৩০"],
+            "YYYYMMDD": ["20230401"],
+        }
+        for name, values in cases.items():
+            with self.subTest(name=name):
+                self.assertEqual(infer_date_format(values).name, name)
+        self.assertIsNone(infer_date_format(["hello", None]))
+
+    def test_bulk_matches_date_format(self):
+        column = ["01-04-2023", "15-08-2024", "2023-04-01", "31-02-2023", "01-Apr-2023", ["01", "04", "2023"]]
+        results, report = self.nmlr.date_format_bulk(column)
+        self.assertEqual(report, {"format": "DD-MM-YYYY", "rows": 6, "fallback": 3})
+        for value, result in zip(column, results):
+            with self.subTest(value=value):
+                expected = self.nmlr.date_format(value)
+                self.assertEqual(result, expected)
+
+    def test_duplicate_rows_are_separate(self):
+        results, _ = self.nmlr.date_format_bulk(["01-04-2023", "01-04-2023"])
+        self.assertIsNot(results[0], results[1])
+        results[0]["weekday"] = "?"
+        results[0]["note"] = 1
+        self.assertEqual(results[1], self.nmlr.date_format("01-04-2023"))
+        self.assertEqual(results[1].txt_year, "দুই হাজার তেইশ")
+
+    def test_month_name_roles(self):
+        date_format = infer_date_format(["2023-Apr-01"])
+        self.assertEqual(date_format.parse("2023-apr-05"), ["05", 4, "2023"])
+        self.assertIsNone(date_format.parse("05-04-2023"))
+
+    def test_fields(self):
+        results, _ = self.nmlr.date_format_bulk(["01-04-2023", "02-04-2023"], fields=["weekday"])
+        self.assertEqual(results, [self.nmlr.date_format("01-04-2023", fields=["weekday"]), self.nmlr.date_format("02-04-2023", fields=["weekday"])])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module import differential
+from pybangla.module.differential import Side
+
+
+class TestDifferential(unittest.TestCase):
+
+    lines = ["মোঃ রহিম ১ম হন", "খরচ ৳৫০ & ২০%", "১২৩"]
+
+    def test_minimal_diff(self):
+        self.assertEqual(differential.minimal_diff("এক দুই তিন", "এক চার তিন"), "এক [-দুই-] {+চার+} তিন")
+        self.assertEqual(differential.minimal_diff("a b c d e f g", "a b c d e f x", context=1), "… f [-g-] {+x+}")
+
+    def test_same_implementation_has_no_diffs(self):
+        left, _ = differential.run(Side(), self.lines, workers=1)
+        right, _ = differential.run(Side(), self.lines, workers=2, batch_size=1)
+        self.assertEqual(left, [Normalizer().text_normalizer(line) for line in self.lines])
+        self.assertEqual(differential.compare(self.lines, left, right), [])
+
+    def test_differing_targets(self):
+        left, _ = differential.run(Side("html:escape"), self.lines, workers=1)
+        right, _ = differential.run(Side("html:unescape"), self.lines, workers=1)
+        diffs = differential.compare(self.lines, left, right)
+        self.assertEqual([(number, diff) for number, _, _, _, diff in diffs], [(2, "খরচ ৳৫০ [-&amp;-] {+&+} ২০%")])
+
+    def test_errors_are_outputs(self):
+        outputs, _ = differential.run(Side("ast:literal_eval"), ["1", "x +", "2"], workers=1)
+        self.assertEqual(outputs[::2], ["1", "2"])
+        self.assertTrue(outputs[1].startswith("<error: SyntaxError: "))
+        pooled, _ = differential.run(Side("ast:literal_eval"), ["1", "x +", "2"], workers=2, batch_size=1)
+        self.assertEqual(pooled, outputs)
+        diffs = differential.compare(["1", "x +", "2"], outputs, ["1", "x +", "2"])
+        self.assertEqual([number for number, _, _, _, _ in diffs], [2])
+
+    def test_mapping_outputs_and_golden_file(self):
+        side = Side("number_convert")
+        outputs, _ = differential.run(side, ["১২৩", "45"], workers=1)
+        self.assertIn('"digit_word"', outputs[0])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "golden.jsonl")
+            differential.snapshot(path, side, ["১২৩", "45"], outputs)
+            self.assertEqual(differential.load_golden(path, ["১২৩", "45"]), ("number_convert", outputs))
+            with self.assertRaises(ValueError):
+                differential.load_golden(path, ["১২৩"])
+
+
+if __name__ == "__main__":
+    unittest.main()
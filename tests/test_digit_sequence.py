@@ -0,0 +1,39 @@
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.parser import NumberParser
+
+
+class TestDigitSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.npr = NumberParser()
+
+    def test_grouping(self):
+        self.assertEqual(self.npr.digit_sequence_to_words("০১৭৭৭"), "শূন্য এক ট্রিপল সাত")
+        self.assertEqual(self.npr.digit_sequence_to_words("7777"), "ডাবল সেভেন ডাবল সেভেন")
+        self.assertEqual(self.npr.digit_sequence_to_words("৫৫৫৫৫"), "ট্রিপল পাঁচ ডাবল পাঁচ")
+        self.assertEqual(self.npr.digit_sequence_to_words("০১৭৭৭", grouping=False), self.npr.digit_number_to_digit_word("০১৭৭৭"))
+
+    def test_phone_numbers(self):
+        digits = self.npr.digit_sequence_to_words("০১৭১১২২২৩৩৩")
+        self.assertEqual(self.npr.number_processing("নম্বর ০১৭১১-২২২৩৩৩"), "নম্বর " + digits)
+        self.assertEqual(self.npr.number_processing("+৮৮০১৭১১২২২৩৩৩"), "প্লাস " + self.npr.digit_sequence_to_words("৮৮০১৭১১২২২৩৩৩"))
+
+    def test_codes_and_cardinals_in_one_scan(self):
+        text = Normalizer().text_normalizer("আপনার ওটিপি ৪৫১২, বিল 40 টাকা, কোড 0042")
+        self.assertEqual(text, "আপনার ওটিপি চার পাঁচ এক দুই, বিল চল্লিশ টাকা, কোড ডাবল জিরো ফোর টু")
+
+    def test_cue_words_used_as_nouns(self):
+        nmlr = Normalizer()
+        self.assertEqual(nmlr.text_normalizer("আমার কার্ড ১২টি আছে"), "আমার কার্ড বারোটি আছে")
+        self.assertEqual(nmlr.text_normalizer("৩টি ID ও ২ পিন"), "তিনটি ID ও দুই পিন")
+        self.assertEqual(self.npr.number_processing("কার্ড নং ১২"), "কার্ড নং এক দুই")
+        self.assertEqual(self.npr.number_processing("PIN: 0042"), "PIN: ডাবল জিরো ফোর টু")
+
+    def test_runs_are_replaced_in_place(self):
+        self.assertEqual(self.npr.number_processing("০ ১০০০০০০০"), " এক কোটি")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from pybangla import NormalizationPlan, Normalizer
+from pybangla.module.document import split_document, splittable
+
+
+class TestDocumentSplit(unittest.TestCase):
+
+    def setUp(self):
+        self.nmlr = Normalizer()
+
+    def assertSplitsLikeSerial(self, text, chunk_size=1):
+        pieces = split_document(text, chunk_size)
+        joined = " ".join(self.nmlr.tp.processing(piece) for piece in pieces)
+        self.assertEqual(joined, self.nmlr.text_normalizer(text))
+        return pieces
+
+    def test_cuts_after_sentence_ends_and_line_breaks(self):
+        pieces = self.assertSplitsLikeSerial("মোঃ রহিম ১ম হন। তিনি খুশি?\nকাল আসবেন!  ধন্যবাদ")
+        self.assertEqual(pieces, ["মোঃ রহিম ১ম হন।", "তিনি খুশি?", "কাল আসবেন!", "ধন্যবাদ"])
+
+    def test_never_cuts_numbers_dates_or_codes(self):
+        for text in ["০১৭১২\n৩৪৫৬৭৮ নম্বরে", "১৫\nবৈশাখ ১৪৩০", "এপ্রিল\n১, ২০২৩", "২২\nতম", "OTP\nনম্বর ১২৩৪", "১৯৯৪।\n১২৩৪৫ সালে"]:
+            with self.subTest(text=text):
+                self.assertEqual(self.assertSplitsLikeSerial(text), [text])
+
+    def test_symbols_at_the_cut(self):
+        self.assertSplitsLikeSerial("x%\n%y & z।\n@ হ্যাঁ")
+
+    def test_custom_rules_are_not_split(self):
+        plan = NormalizationPlan().add_rule(r"কিমি\s+পথ", "কিলোমিটার পথ", priority=550)
+        self.assertFalse(splittable(Normalizer(plan=plan).tp))
+        self.assertTrue(splittable(self.nmlr.tp))
+
+    def test_normalize_document_matches_text_normalizer(self):
+        text = "মোঃ রহিম ১৯৯৪ সালে ২১তম হন। খরচ ৳১,০০০.৫০?\nOTP ৪৫১২ দিন!\n" * 50
+        self.assertEqual(self.nmlr.normalize_document(text, workers=2, chunk_size=200), self.nmlr.text_normalizer(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import contextlib
+import datetime
+import io
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.errors import DateFormatError, ErrorPolicy, MonthNameError, PybanglaError
+from pybangla.module.parser import DateParser, NumberParser
+
+
+class TestErrorPolicy(unittest.TestCase):
+
+    def test_parsers_raise_typed_errors(self):
+        dp = DateParser()
+        with self.assertRaises(MonthNameError):
+            dp.month_convert_to_number("foo")
+        with self.assertRaises(DateFormatError):
+            dp.format_non_punctuation(["123"])
+        with self.assertRaises(PybanglaError):
+            NumberParser().get_weekday(["1", "4", "2023"], language="fr")
+
+    def test_quiet_counts_without_output(self):
+        nmlr = Normalizer(errors="quiet")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            results = [nmlr.date_format(date_) for date_ in ["12345", "01-foo-2023", "31-02-2023", "2023-04-05"]]
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual(results[:3], [None, None, None])
+        self.assertEqual(results[3]["weekday"], "বুধবার")
+        self.assertEqual(nmlr.error_counts(), {"date_format": 2, "month_name": 1})
+        nmlr.reset_error_counts()
+        self.assertEqual(nmlr.error_counts(), {})
+
+    def test_docstring_example(self):
+        nmlr = Normalizer(errors="quiet")
+        self.assertIsNone(nmlr.date_format("32/13/2023"))
+        self.assertEqual(nmlr.error_counts(), {"date_format": 1})
+
+    def test_bangabda_out_of_range(self):
+        nmlr = Normalizer(errors="quiet")
+        self.assertIsNone(nmlr.bangabda(datetime.date(1800, 1, 1)))
+        self.assertIsNone(nmlr.bangabda("01-01-2500"))
+        self.assertEqual(nmlr.error_counts(), {"date_format": 2})
+        with self.assertRaises(DateFormatError):
+            Normalizer(errors="strict").bangabda(datetime.date(1800, 1, 1))
+
+    def test_sentinel(self):
+        self.assertEqual(Normalizer(errors="quiet", sentinel={}).date_format([]), {})
+
+    def test_strict_raises(self):
+        nmlr = Normalizer(errors="strict")
+        with self.assertRaises(MonthNameError):
+            nmlr.date_format("01-foo-2023")
+        self.assertEqual(nmlr.error_counts(), {"month_name": 1})
+
+    def test_quiet_is_the_default(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertIsNone(Normalizer().date_format("31-02-2023"))
+            self.assertIsNone(Normalizer(errors="print").date_format("12345"))
+        self.assertNotIn("31", out.getvalue())
+        self.assertIn("not handled", out.getvalue())
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            ErrorPolicy("loud")
+
+
+if __name__ == "__main__":
+    unittest.main()
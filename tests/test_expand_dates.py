@@ -0,0 +1,43 @@
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.parser import DateParser, TextParser
+
+
+class TestExpandDates(unittest.TestCase):
+
+    def setUp(self):
+        self.tp = TextParser()
+
+    def test_dates_in_text(self):
+        expected = "সভা এক এপ্রিল " + self.tp.npr.year_in_number("২০২৩") + " তারিখে"
+        for date in ["০১-০৪-২০২৩", "০১-এপ্রিল-২০২৩", "2023/04/01", "01 April, 2023", "Apr 1, 2023"]:
+            with self.subTest(date=date):
+                self.assertEqual(self.tp.expand_dates("সভা %s তারিখে" % date), expected)
+
+    def test_same_reading_as_date_format(self):
+        result = Normalizer().date_format("07 April, 2023")
+        self.assertEqual(self.tp.expand_dates("07 April, 2023"), " ".join([result["txt_date"], result["month"], result["txt_year"]]))
+
+    def test_bangla_calendar_month_keeps_its_name(self):
+        self.assertTrue(self.tp.expand_dates("১৫ বৈশাখ ১৪৩০").startswith("পনেরো বৈশাখ "))
+
+    def test_days_of_the_month(self):
+        self.assertTrue(self.tp.expand_dates("29/02/2024").startswith("ঊনত্রিশ ফেব্রুয়ারি "))
+        self.assertTrue(self.tp.expand_dates("৩১ জ্যৈষ্ঠ ১৪৩০").startswith("একত্রিশ জ্যৈষ্ঠ "))
+
+    def test_times(self):
+        self.assertEqual(self.tp.expand_dates("১০:৩০ এ"), "দশটা ত্রিশ মিনিট এ")
+        self.assertEqual(self.tp.expand_dates("09:00"), self.tp.npr.number_to_words("৯") + "টা")
+
+    def test_invalid_spans_are_left_alone(self):
+        for text in ["৩২-০৪-২০২৩", "২০২৩-১৩-০১", "২৫:৩০", "২:১", "৩১-০২-২০২৩", "29/02/2023", "৩১ নভেম্বর ২০২৩", "৩১ চৈত্র ১৪৩০"]:
+            self.assertEqual(self.tp.expand_dates(text), text)
+
+    def test_month_table(self):
+        dp = DateParser()
+        self.assertEqual([dp.month_convert_to_number(m) for m in ["April", "apr", "এপ্রিল", "বৈশাখ"]], [4, 4, 4, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
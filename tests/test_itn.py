@@ -0,0 +1,43 @@
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.itn import InverseNormalizer
+from pybangla.module.lexicon import LexiconPack
+
+
+class TestInverseNormalizer(unittest.TestCase):
+
+    def setUp(self):
+        self.nmlr = Normalizer()
+
+    def test_amounts_percent_and_years(self):
+        cases = {
+            "পাঁচশ টাকা দিলাম, বিশ পারসেন্ট ছাড়।": "৳৫০০ দিলাম, ২০% ছাড়।",
+            "দুই হাজার চব্বিশ সালে": "২০২৪ সালে",
+            "মাইনাস বারো দশমিক পাঁচ পারসেন্ট": "-১২.৫%",
+            "আমার বয়স পঁচিশ।": "আমার বয়স ২৫।",
+        }
+        for spoken, written in cases.items():
+            with self.subTest(spoken=spoken):
+                self.assertEqual(self.nmlr.inverse_text_normalizer(spoken), written)
+
+    def test_dates(self):
+        self.assertEqual(self.nmlr.inverse_text_normalizer("এক এপ্রিল দুই হাজার তেইশ তারিখে"), "০১-০৪-২০২৩ তারিখে")
+        self.assertEqual(self.nmlr.inverse_text_normalizer("পনেরো বৈশাখ চৌদ্দশো ত্রিশ"), "১৫ বৈশাখ ১৪৩০")
+        self.assertEqual(self.nmlr.inverse_text_normalizer("এক এপ্রিল দুই হাজার তেইশ", digits="en"), "01-04-2023")
+
+    def test_round_trip(self):
+        for written in ["১৯৯৪ সালে ৳৫০০ দিয়েছি, ২০% ছাড়ে।", "০১-০৪-২০২৩ তারিখে $১২.৫০ খরচ", "১৪৩০ সালের ১৫ বৈশাখ", "৫২৫ জন", "৳৬৩৭২৬৩৮৮"]:
+            with self.subTest(written=written):
+                self.assertEqual(self.nmlr.inverse_text_normalizer(self.nmlr.text_normalizer(written)), written)
+
+    def test_year_reading_inside_a_number_is_left_to_word2number(self):
+        self.assertEqual(InverseNormalizer().convert("এক হাজার পাঁচশ টাকা"), "৳১৫০০")
+
+    def test_lexicon_currency(self):
+        nmlr = Normalizer(lexicon=LexiconPack.default().overlay({"currency": {"₿": "বিটকয়েন"}}))
+        self.assertEqual(nmlr.inverse_text_normalizer("পাঁচ বিটকয়েন"), "₿৫")
+
+
+if __name__ == "__main__":
+    unittest.main()
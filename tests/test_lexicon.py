@@ -0,0 +1,74 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.config import Config
+from pybangla.module.lexicon import LexiconPack
+
+
+class TestLexiconPack(unittest.TestCase):
+
+    text = "মোঃ রহিম ১০ কিমি হাঁটেন, ১ম হন, ২১তম, খরচ ৳১,০০০.৫০ এবং ৫০%"
+    words = "এক লক্ষ চার হাজার দুইশ এক টাকা ডাবল সেভেন"
+
+    def test_default_pack_matches_config(self):
+        nmlr = Normalizer(lexicon=LexiconPack.loads(LexiconPack.default().dumps()))
+        self.assertEqual(nmlr.text_normalizer(self.text), Normalizer().text_normalizer(self.text))
+        self.assertEqual(nmlr.word2number(self.words), Normalizer().word2number(self.words))
+
+    def test_overlay(self):
+        base = LexiconPack.default()
+        pack = base.overlay({"currency": {"৳": "টাকা মাত্র"}, "bn_word_map": {"এককোটি": "10000000"},
+                             "abbreviations": {"bn": [("কিমি", 2, "কিলোমিটার")]}}, name="custom", revision=2)
+        nmlr = Normalizer(lexicon=pack)
+        self.assertIn("কিলোমিটার", nmlr.text_normalizer(self.text))
+        self.assertIn("টাকা মাত্র", nmlr.text_normalizer(self.text))
+        self.assertEqual(nmlr.word2number("এককোটি টাকা").split()[0], "10000000")
+        self.assertEqual(nmlr.lexicon_info(), ("custom", 2))
+        self.assertNotIn("এককোটি", base.tables["bn_word_map"])
+        with self.assertRaises(ValueError):
+            base.overlay({"spelling": {}})
+
+    def test_save_and_load(self):
+        pack = LexiconPack.default().overlay({"currency": {"₿": "বিটকয়েন"}}, revision="2024-06")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bn.lexicon")
+            pack.save(path)
+            nmlr = Normalizer()
+            nmlr.load_lexicon(path)
+        self.assertEqual(nmlr.lexicon_info(), ("default", "2024-06"))
+        self.assertEqual(nmlr.text_normalizer("₿৫"), "পাঁচ বিটকয়েন")
+
+    def test_number_word_caches(self):
+        self.assertIs(LexiconPack.default().config()._year_tables, Config._year_tables)
+        pack = LexiconPack.default().overlay({"bangla_numeric_words": {"crore": "ক্রোর"}})
+        self.assertIsNot(pack.config()._year_tables, Config._year_tables)
+
+    def test_swap_while_normalizing(self):
+        nmlr = Normalizer()
+        packs = [LexiconPack.default(), LexiconPack.default().overlay({"currency": {"৳": "টাকা মাত্র"}})]
+        expected = {Normalizer(lexicon=pack).text_normalizer(self.text) for pack in packs}
+        results, failures = [], []
+
+        def normalize():
+            try:
+                for _ in range(200):
+                    results.append(nmlr.text_normalizer(self.text))
+            except Exception as error:
+                failures.append(error)
+
+        threads = [threading.Thread(target=normalize) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(50):
+            nmlr.load_lexicon(packs[i % 2])
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertLessEqual(set(results), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from pybangla.module.parser import NumberParser
+
+
+class TestNumberToWords(unittest.TestCase):
+
+    def setUp(self):
+        self.npr = NumberParser()
+
+    def test_chunks_match_num2words(self):
+        for number in ["১", "১০৫", "১৫০০", "১০০০০০", "৯৯৯৯৯৯৯", "2023", "100005"]:
+            language = "bn" if number[0] in "০১২৩৪৫৬৭৮৯" else "en"
+            self.assertEqual(self.npr.number_to_words(number), self.npr.number_to_words_converting_process(number, lang=language))
+        self.assertEqual(self.npr.number_to_words("105"), "one hundred five")
+        self.assertEqual(self.npr.number_to_words("১০০০০০০০"), "এক কোটি")
+        self.assertEqual(self.npr.number_to_words("১০০০০০০১"), "এক কোটি এক")
+
+    def test_zero_and_empty(self):
+        self.assertEqual(self.npr.number_to_words("০"), "")
+        self.assertEqual(self.npr.number_to_words(""), "")
+
+    def test_digits_policy(self):
+        number = "০১৭১২৩৪৫৬৭৮"
+        self.assertEqual(self.npr.number_to_words(number, policy="digits", digits_threshold=10), self.npr.digit_number_to_digit_word(number))
+        self.assertEqual(self.npr.number_to_words("১২", policy="digits", digits_threshold=10), self.npr.number_to_words("১২"))
+        self.assertEqual(self.npr.number_to_words("105", policy="digits", digits_threshold=2), "one zero five")
+
+    def test_max_digits(self):
+        self.assertEqual(len(self.npr.number_to_words("১" * 1000).split(" কোটি ")), 143)
+        with self.assertRaises(ValueError):
+            self.npr.number_to_words("১" * 1000, max_digits=100)
+        with self.assertRaises(ValueError):
+            self.npr.number_to_words("১২", policy="words")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.parser import NumberParser
+
+
+class TestNumeralLiterals(unittest.TestCase):
+
+    def setUp(self):
+        self.npr = NumberParser()
+
+    def test_decimals_use_the_currency_reading(self):
+        self.assertEqual(self.npr.number_processing("১২.৫০ মিটার"), self.npr.decimal_to_words("১২", "৫০") + " মিটার")
+        self.assertEqual(self.npr.number_processing("3.14"), "তিন দশমিক এক চার")
+        self.assertEqual(self.npr.number_processing("০.৫"), "শূন্য দশমিক পাঁচ")
+
+    def test_percent_sign_and_grouping(self):
+        self.assertEqual(self.npr.number_processing("-১২.৫%"), "মাইনাস বারো দশমিক পাঁচ পারসেন্ট")
+        self.assertEqual(self.npr.number_processing("১,২৩,৪৫৬ জন"), self.npr.number_to_words("১২৩৪৫৬") + " জন")
+        self.assertEqual(self.npr.number_processing("১০-১২ জন"), "দশ-বারো জন")
+
+    def test_fractions(self):
+        self.assertEqual(self.npr.number_processing("৩/৪ অংশ"), "চার ভাগের তিন অংশ")
+        self.assertNotIn("ভাগের", self.npr.number_processing("১২/০৪/২০২৩"))
+
+    def test_dotted_dates_and_versions(self):
+        for text in ["1.2.3", "১.২.৩"]:
+            self.assertEqual(self.npr.number_processing(text), "এক.দুই.তিন")
+        self.assertEqual(self.npr.number_processing("version 2.10.01"), "version দুই.দশ.শূন্য এক")
+        self.assertEqual(self.npr.number_processing("৩.১৪."), "তিন দশমিক এক চার.")
+        nmlr = Normalizer()
+        self.assertEqual(nmlr.text_normalizer("১২.১২.২০২০ তারিখে"), "বারো ডিসেম্বর দুই হাজার বিশ তারিখে")
+        self.assertEqual(nmlr.text_normalizer("১২.১২.২০২০"), nmlr.text_normalizer("১২/১২/২০২০"))
+        self.assertEqual(nmlr.text_normalizer("version 1.2.3"), "version এক.দুই.তিন")
+
+    def test_text_normalizer_percent(self):
+        nmlr = Normalizer()
+        self.assertEqual(nmlr.text_normalizer("৫০% ছাড়"), "পঞ্চাশ পারসেন্ট ছাড়")
+        self.assertEqual(nmlr.text_normalizer("৫০ % ছাড়"), "পঞ্চাশ পারসেন্ট ছাড়")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from pybangla.module.parser import NumberParser, TextParser
+
+
+class TestOrdinals(unittest.TestCase):
+
+    def setUp(self):
+        self.tp, self.npr = TextParser(), NumberParser()
+
+    def test_fixed_and_general_bangla_ordinals(self):
+        text = self.tp.expand_position("১ম, ১০ম, ২১তম ২২ তম")
+        expected = "প্রথম, দশম, {}তম {}তম".format(self.npr.number_to_words("২১"), self.npr.number_to_words("২২"))
+        self.assertEqual(text, expected)
+
+    def test_english_ordinals(self):
+        self.assertEqual(self.tp.expand_position("2nd"), self.tp.expand_position("২য়"))
+        self.assertEqual(self.tp.expand_position("21st"), self.tp.expand_position("২১তম"))
+        self.assertEqual(self.tp.expand_position("21st", lang="en"), "twenty-first")
+
+    def test_digits_inside_numbers_are_not_ordinals(self):
+        self.assertEqual(self.tp.expand_position("২১ম 1stly"), "২১ম 1stly")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import pickle
+import unittest
+
+from pybangla import NormalizationPlan, Normalizer
+
+
+class TestNormalizationPlan(unittest.TestCase):
+
+    text = "মোঃ রহিম ১০ কিমি হাঁটেন, ১ম হন, খরচ ৳৫০"
+
+    def test_default_plan_matches_normalizer(self):
+        plan = NormalizationPlan.loads(NormalizationPlan().dumps())
+        self.assertEqual(Normalizer(plan=plan).text_normalizer(self.text), Normalizer().text_normalizer(self.text))
+
+    def test_custom_rules_survive_round_trip(self):
+        plan = NormalizationPlan().add_rule("কিমি", "কিলোমিটার", priority=550).add_currency("৳", "টাকা মাত্র")
+        plan = pickle.loads(pickle.dumps(plan))
+        text = Normalizer(plan=plan).text_normalizer(self.text)
+        self.assertIn("কিলোমিটার", text)
+        self.assertTrue(text.endswith("টাকা মাত্র"))
+
+    def test_stage_selection(self):
+        plan = NormalizationPlan(stages=["collapse_whitespace", "expand_position"])
+        self.assertEqual(Normalizer(plan=plan).text_normalizer("৳৫০  ১ম"), "৳৫০ প্রথম")
+        with self.assertRaises(ValueError):
+            NormalizationPlan(stages=["spell_check"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import datetime
+import json
+import pickle
+import unittest
+from unittest import mock
+
+from pybangla import Normalizer
+from pybangla.module.lexicon import LexiconPack
+from pybangla.module.parser import NumberParser
+from pybangla.module.results import DateResult, NumberResult
+
+
+class TestLazyResults(unittest.TestCase):
+
+    def setUp(self):
+        self.nmlr = Normalizer()
+
+    def test_date_format_fields(self):
+        result = self.nmlr.date_format("07 April, 2023")
+        self.assertIsInstance(result, DateResult)
+        self.assertEqual(list(result), list(DateResult.FIELDS))
+        self.assertEqual(result["weekday"], "শুক্রবার")
+        self.assertEqual(result.txt_year, "দুই হাজার তেইশ")
+        self.assertEqual(result, result.to_dict())
+
+    def test_today_has_one_month_key(self):
+        result = self.nmlr.today(language="en").to_dict()
+        self.assertEqual(list(result), list(DateResult.FIELDS))
+        self.assertEqual(result["year"], str(datetime.date.today().year))
+
+    def test_only_read_fields_are_computed(self):
+        with mock.patch.object(NumberParser, "number_to_words", side_effect=AssertionError("computed")):
+            self.assertEqual(self.nmlr.number_convert("১২৩")["digit"], "১২৩")
+            self.assertEqual(self.nmlr.date_format("০১-০৪-২০২৩")["weekday"], "শনিবার")
+            self.assertEqual(self.nmlr.number_convert("123", fields=["digit", "digit_word"]), {"digit": "১২৩", "digit_word": "এক দুই তিন"})
+
+    def test_fields_selector(self):
+        self.assertEqual(self.nmlr.date_format("2023-04-05", language="en", fields="weekday"), {"weekday": "wednesday"})
+        with self.assertRaises(ValueError):
+            self.nmlr.number_convert("১২৩", fields=["digits"])
+
+    def test_invalid_date_raises_on_call(self):
+        with self.assertRaises(ValueError):
+            Normalizer(errors="strict").date_format(["31", "02", "2023"])
+
+    def test_dict_callers(self):
+        result = self.nmlr.date_format("07 April, 2023", language="en")
+        self.assertIsInstance(result, dict)
+        self.assertEqual(json.loads(json.dumps(result)), result.to_dict())
+        result["source"] = "07 April, 2023"
+        self.assertEqual(list(result), list(DateResult.FIELDS) + ["source"])
+        self.assertEqual(dict(self.nmlr.number_convert("১২")), {"digit": "১২", "digit_word": "এক দুই", "number_string": "বারো"})
+
+    def test_lexicon_words(self):
+        nmlr = Normalizer(lexicon=LexiconPack.default().overlay({"bangla_numeric_words": {"two": "দুয়ে"}}))
+        self.assertEqual(nmlr.date_format("02-04-2023").txt_year, "দুয়ে হাজার তেইশ")
+        self.assertEqual(self.nmlr.date_format("02-04-2023").txt_year, "দুই হাজার তেইশ")
+
+    def test_pickle(self):
+        result = NumberResult("২০২৩")
+        result.digit
+        self.assertEqual(pickle.loads(pickle.dumps(result)), self.nmlr.number_convert("২০২৩").to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
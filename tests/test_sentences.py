@@ -0,0 +1,33 @@
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.document import split_sentences
+
+
+class TestSentenceStream(unittest.TestCase):
+
+    text = "মোঃ রহিম ১৯৯৪ সালে ১ম হন। OTP\nনম্বর ১২৩৪ দিন? খরচ ৳৫০!\nধন্যবাদ"
+
+    def setUp(self):
+        self.nmlr = Normalizer()
+
+    def test_split(self):
+        self.assertEqual(list(split_sentences(self.text)), ["মোঃ রহিম ১৯৯৪ সালে ১ম হন।", "OTP\nনম্বর ১২৩৪ দিন?", "খরচ ৳৫০!", "ধন্যবাদ"])
+
+    def test_chunks_give_the_same_sentences(self):
+        chunks = [self.text[i:i + 3] for i in range(0, len(self.text), 3)]
+        self.assertEqual(list(split_sentences(iter(chunks))), list(split_sentences(self.text)))
+
+    def test_sentence_before_the_rest_arrives(self):
+        def chunks():
+            yield "মোঃ রহিম ১ম হন। তি"
+            raise AssertionError("read past the first sentence")
+
+        self.assertEqual(next(self.nmlr.normalize_sentences(chunks())), self.nmlr.text_normalizer("মোঃ রহিম ১ম হন।"))
+
+    def test_joined_output_is_text_normalizer(self):
+        self.assertEqual(" ".join(self.nmlr.normalize_sentences(self.text)), self.nmlr.text_normalizer(self.text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from pybangla import Normalizer
+from pybangla.module.number_parser import Word2NumberMap
+
+
+class TestWord2NumberBatch(unittest.TestCase):
+
+    texts = [
+        "আমাকে এক লক্ষ দুই হাজার টাকা দেয়",
+        "জিরো ওয়ান ডাবল সেভেন থ্রি ডাবল ফাইভ নাইন থ্রি সেভেন নাইন",
+        "আমার সাড়ে পাঁচ হাজার",
+        "একশ দুইশ তিনশ",
+        "আমাকে এক লক্ষ দুই হাজার টাকা দেয়",
+        "ওকে",
+        "",
+    ]
+
+    def test_batch_matches_single_calls(self):
+        expected = [Word2NumberMap(cache_size=0).convert_word2number(t) for t in self.texts]
+        self.assertEqual(Normalizer().word2number_batch(self.texts), expected)
+
+    def test_clusters_are_cached(self):
+        wnmp = Word2NumberMap(cache_size=16)
+        wnmp.convert_word2number("এক লক্ষ টাকা")
+        wnmp.convert_word2number("আরো এক লক্ষ টাকা")
+        info = wnmp.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_batch_converts_each_cluster_once(self):
+        wnmp = Word2NumberMap(cache_size=16)
+        wnmp.convert_word2number_batch(["এক লক্ষ", "এক লক্ষ টাকা", "টাকা এক লক্ষ"])
+        self.assertEqual(wnmp.cache_info().misses, 1)
+        self.assertEqual(wnmp.cache_info().hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import gc
+import unittest
+
+from pybangla import NormalizationPlan, Normalizer
+from pybangla.module import workers
+from pybangla.module.lexicon import LexiconPack
+
+
+class TestWorkers(unittest.TestCase):
+
+    text = "মোঃ রহিম ১০ কিমি হাঁটেন, খরচ ৳৫০"
+
+    def test_preload_serves_the_same_results(self):
+        normalizer = workers.preload()
+        self.assertIs(workers.get_normalizer(), normalizer)
+        self.assertEqual(workers.normalize_text(self.text), Normalizer().text_normalizer(self.text))
+
+    def test_initializer_builds_the_plan(self):
+        plan = NormalizationPlan().add_rule("কিমি", "কিলোমিটার", priority=550)
+        workers.worker_initializer(plan.dumps())
+        self.assertIn("কিলোমিটার", workers.normalize_text(self.text))
+        workers.preload()
+
+    def test_default_executor_after_a_plan_preload(self):
+        plan = NormalizationPlan().add_rule("কিমি", "কিলোমিটার", priority=550)
+        workers.preload(plan)
+        try:
+            workers.worker_initializer()
+            self.assertEqual(workers.normalize_text(self.text), Normalizer().text_normalizer(self.text))
+            with workers.executor(max_workers=2) as pool:
+                self.assertEqual(list(pool.map(workers.normalize_text, [self.text])), [Normalizer().text_normalizer(self.text)])
+        finally:
+            workers.preload()
+
+    def test_freeze_with_a_lexicon(self):
+        pack = LexiconPack.default().overlay({"currency": {"₿": "বিটকয়েন"}})
+        try:
+            workers.freeze(lexicon=pack)
+            self.assertIs(workers.get_normalizer().parsers.pack, pack)
+            self.assertEqual(workers.normalize_text("₿৫"), "পাঁচ বিটকয়েন")
+        finally:
+            if hasattr(gc, "unfreeze"):
+                gc.unfreeze()
+            workers.preload()
+
+    def test_executor(self):
+        with workers.executor(max_workers=2) as pool:
+            results = list(pool.map(workers.word_to_number, ["এক লক্ষ", "দুই হাজার"]))
+        self.assertEqual(results, [Normalizer().word2number("এক লক্ষ"), Normalizer().word2number("দুই হাজার")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from pybangla.module.parser import NumberParser, TextParser
+
+
+class TestYearTable(unittest.TestCase):
+
+    def setUp(self):
+        self.npr = NumberParser()
+
+    def test_table_matches_general_algorithm(self):
+        for year in ["১৯৯৪", "২০২৩", "২০০৫", "১০০০", "2999", "2023", "1905"]:
+            for language in ["bn", "en"]:
+                self.assertEqual(
+                    self.npr.year_in_number(year, language=language),
+                    self.npr._year_to_words(year, language=language),
+                )
+
+    def test_out_of_range_falls_back(self):
+        self.assertNotIn("৮৫০", self.npr._year_table("bn"))
+        self.assertEqual(self.npr.year_in_number("৮৫০"), self.npr._year_to_words("৮৫০"))
+
+    def test_year_formation_replaces_matched_span_only(self):
+        text = TextParser().year_formation("১৯৯৪ সালে ১৯৯৪ জন")
+        self.assertEqual(text, self.npr.year_in_number("১৯৯৪") + " সালে ১৯৯৪ জন")
+
+
+if __name__ == "__main__":
+    unittest.main()